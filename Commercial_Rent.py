@@ -16,13 +16,23 @@ Usage:
 import time
 import os
 from datetime import datetime
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait, Select
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.keys import Keys
 
+from browserwatch import Watchdog
+from drivers import BASE_URL, create_driver, release
+import dom
+import eventlog
+import forms
+import retry
+import waits
+from eventlog import get_logger
+
+log = get_logger("commercial_rent")
+
 # Configuration
 PRIMARY_NAME = "Tanish"
 PRIMARY_MOBILE = "9902978675"
@@ -63,42 +73,37 @@ def login_and_wait(driver):
     Once you are logged in and have clicked on 'Post Property' to reach the
     first page form, press Enter in your terminal to continue.
     """
-    driver.get("https://homehni.in")
+    driver.get(BASE_URL)
     input("Please complete the login process, click on 'Post Property', and when you reach the first page form, press Enter here to continue...")
 
+@log.step
 def fill_first_page(driver):
     """Fill the first page form - select city, Commercial option, and submit.
     More robust with retries, scrolling, and JS clicks to avoid interceptions.
     """
-    print("Starting to fill first page...")
-    print("Note: Name and Mobile are pre-filled automatically")
+    log("Starting to fill first page...")
+    log("Note: Name and Mobile are pre-filled automatically")
 
     def try_fill_once():
         # Mobile Number - Fill with phone number
         try:
-            mobile_input = WebDriverWait(driver, 10).until(
-                EC.element_to_be_clickable((By.XPATH, "//input[@id='mobile']"))
-            )
-            mobile_input.clear()
-            mobile_input.send_keys(PRIMARY_MOBILE)
-            print(f"✓ Mobile Number filled: {PRIMARY_MOBILE}")
+            forms.fill_fields(driver, {"Mobile Number": ("//input[@id='mobile']", PRIMARY_MOBILE)}, timeout=10)
         except Exception as e:
-            print("✗ Could not fill Mobile Number field:", str(e))
+            log("✗ Could not fill Mobile Number field:", str(e))
 
         # City dropdown - always select first option in the list
         try:
             city_combobox = WebDriverWait(driver, 10).until(
                 EC.element_to_be_clickable((By.XPATH, "//button[@role='combobox' and contains(., 'Select city')]"))
             )
-            driver.execute_script("arguments[0].scrollIntoView({block:'center'});", city_combobox)
-            driver.execute_script("arguments[0].click();", city_combobox)
+            dom.click(driver, city_combobox)
             time.sleep(1)
             try:
                 first_opt = WebDriverWait(driver, 5).until(
                     EC.element_to_be_clickable((By.XPATH, "(//div[@role='option'] | //li[@role='option'])[1]"))
                 )
                 driver.execute_script("arguments[0].click();", first_opt)
-                print("✓ City selected (first option)")
+                log("✓ City selected (first option)")
             except:
                 # Fallback: type any character and pick first suggestion
                 try:
@@ -112,35 +117,31 @@ def fill_first_page(driver):
                         EC.element_to_be_clickable((By.XPATH, "(//div[@role='option'] | //li[@role='option'])[1]"))
                     )
                     driver.execute_script("arguments[0].click();", first_opt)
-                    print("✓ City selected (typed, first option)")
+                    log("✓ City selected (typed, first option)")
                 except:
-                    print("⚠️  Skipping city selection this attempt")
+                    log("⚠️  Skipping city selection this attempt")
         except Exception as e:
-            print("⚠️  City combobox not ready:", str(e))
+            log("⚠️  City combobox not ready:", str(e))
 
         # Commercial button (scoped within the same form section as the submit button)
         try:
             commercial_button = WebDriverWait(driver, 10).until(
                 EC.presence_of_element_located((By.XPATH, "//div[.//button[normalize-space()='Start Posting Your Ad For FREE']]//button[normalize-space()='Commercial']"))
             )
-            driver.execute_script("arguments[0].scrollIntoView({block:'center'});", commercial_button)
-            time.sleep(0.3)
-            driver.execute_script("arguments[0].click();", commercial_button)
-            print("✓ Commercial button clicked")
+            dom.click(driver, commercial_button)
+            log("✓ Commercial button clicked")
         except Exception as e:
-            print("✗ Could not click Commercial:", str(e))
+            log("✗ Could not click Commercial:", str(e))
 
         # Rent button (after clicking Commercial)
         try:
             rent_button = WebDriverWait(driver, 10).until(
                 EC.presence_of_element_located((By.XPATH, "//button[normalize-space()='Rent']"))
             )
-            driver.execute_script("arguments[0].scrollIntoView({block:'center'});", rent_button)
-            time.sleep(0.3)
-            driver.execute_script("arguments[0].click();", rent_button)
-            print("✓ Rent button clicked")
+            dom.click(driver, rent_button)
+            log("✓ Rent button clicked")
         except Exception as e:
-            print("✗ Could not click Rent:", str(e))
+            log("✗ Could not click Rent:", str(e))
 
         # Submit button: wait until enabled (no disabled attribute), then click
         try:
@@ -149,45 +150,43 @@ def fill_first_page(driver):
             )
             # wait until button is enabled
             WebDriverWait(driver, 10).until(lambda d: submit_button.get_attribute('disabled') is None)
-            driver.execute_script("arguments[0].scrollIntoView({block:'center'});", submit_button)
-            time.sleep(0.3)
-            driver.execute_script("arguments[0].click();", submit_button)
-            print("✓ Submit button clicked - proceeding to next page")
+            dom.click(driver, submit_button)
+            log("✓ Submit button clicked - proceeding to next page")
             return True
         except Exception as e:
-            print("✗ Could not click Submit:", str(e))
+            log("✗ Could not click Submit:", str(e))
             return False
 
     # Try once; if fail, reload post page and retry once
     success = try_fill_once()
     if not success:
         try:
-            driver.get("https://homehni.in/post-property")
+            driver.get(f"{BASE_URL}/post-property")
             WebDriverWait(driver, 15).until(
                 EC.presence_of_element_located((By.XPATH, "//button[@role='combobox' and contains(., 'Select city')] | //button[contains(., 'Start Posting Your Ad For FREE')]"))
             )
-            print("↻ Retrying first page after reload...")
+            log("↻ Retrying first page after reload...")
             try_fill_once()
         except Exception:
             pass
 
+@log.step
 def fill_property_details(driver):
     """Fill the property details page form."""
-    print("Starting to fill property details page...")
+    log("Starting to fill property details page...")
     
     # Wait for page transition
-    time.sleep(3)
+    waits.settled(driver)
     
     # Super Built Up Area - Direct approach
     try:
-        all_inputs = driver.find_elements(By.XPATH, "//input[@name='superBuiltUpArea']")
-        visible_inputs = [inp for inp in all_inputs if inp.is_displayed()]
+        visible_inputs = dom.visible(driver, "//input[@name='superBuiltUpArea']")
         if visible_inputs:
             visible_inputs[0].clear()
             visible_inputs[0].send_keys(SUPER_BUILT_UP_AREA)
-            print("✓ Super Built Up Area filled:", SUPER_BUILT_UP_AREA)
+            log("✓ Super Built Up Area filled:", SUPER_BUILT_UP_AREA)
     except Exception as e:
-        print("✗ Could not fill Super Built Up Area field:", str(e))
+        log("✗ Could not fill Super Built Up Area field:", str(e))
 
     # Dropdowns on this page - target specific dropdowns by their text/label
     try:
@@ -211,27 +210,25 @@ def fill_property_details(driver):
                 
                 # Check if it's visible
                 if not combobox.is_displayed():
-                    print(f"⚠️  {dropdown_name} combobox not visible")
+                    log(f"⚠️  {dropdown_name} combobox not visible")
                     continue
                 
                 # Scroll and click
-                driver.execute_script("arguments[0].scrollIntoView({block:'center'});", combobox)
-                time.sleep(0.2)
-                driver.execute_script("arguments[0].click();", combobox)
+                dom.click(driver, combobox)
                 
                 # Select first option
                 first_option = WebDriverWait(driver, 5).until(
                     EC.element_to_be_clickable((By.XPATH, "//div[@role='option'][1]"))
                 )
                 driver.execute_script("arguments[0].click();", first_option)
-                print(f"✓ {dropdown_name} selected (first option)")
+                log(f"✓ {dropdown_name} selected (first option)")
                 time.sleep(0.2)
             except Exception as inner_e:
-                print(f"⚠️  {dropdown_name} selection failed:", str(inner_e))
+                log(f"⚠️  {dropdown_name} selection failed:", str(inner_e))
                 driver.execute_script("document.body.click();")
                 time.sleep(0.2)
     except Exception as e:
-        print("✗ Could not process dropdown selections:", str(e))
+        log("✗ Could not process dropdown selections:", str(e))
 
     # Click Save & Continue button
     try:
@@ -246,8 +243,7 @@ def fill_property_details(driver):
         
         for selector in selectors:
             try:
-                elements = driver.find_elements(By.XPATH, selector)
-                visible_elements = [el for el in elements if el.is_displayed()]
+                visible_elements = dom.visible(driver, selector)
                 if visible_elements:
                     save_button = visible_elements[0]
                     break
@@ -255,19 +251,21 @@ def fill_property_details(driver):
                 continue
         
         if save_button:
-            driver.execute_script("arguments[0].click();", save_button)
-            print("✓ Save & Continue button clicked - proceeding to next page")
+            with waits.acknowledged(driver, "Save & Continue"):
+                driver.execute_script("arguments[0].click();", save_button)
+            log("✓ Save & Continue button clicked - proceeding to next page")
         else:
-            print("✗ Could not find Save & Continue button with any selector")
+            log("✗ Could not find Save & Continue button with any selector")
     except Exception as e:
-        print("✗ Could not find Save & Continue button:", str(e))
+        log("✗ Could not find Save & Continue button:", str(e))
 
+@log.step
 def fill_locality_details_page(driver):
     """Fill the locality details page - city and locality with autocomplete."""
-    print("Starting to fill locality details page...")
+    log("Starting to fill locality details page...")
     
     # Wait for page transition
-    time.sleep(3)
+    waits.settled(driver)
     
     # City input - Type "Bangalore" and select first suggestion
     try:
@@ -283,9 +281,9 @@ def fill_locality_details_page(driver):
             EC.presence_of_element_located((By.XPATH, "//div[@class='pac-item'][1]"))
         )
         driver.execute_script("arguments[0].click();", first_suggestion)
-        print("✓ City selected: Bangalore")
+        log("✓ City selected: Bangalore")
     except Exception as e:
-        print("✗ Could not fill City field:", str(e))
+        log("✗ Could not fill City field:", str(e))
     
     # Locality input - Type "Bellandur" and select first suggestion
     try:
@@ -301,9 +299,9 @@ def fill_locality_details_page(driver):
             EC.presence_of_element_located((By.XPATH, "//div[@class='pac-item'][1]"))
         )
         driver.execute_script("arguments[0].click();", first_suggestion)
-        print("✓ Locality selected: Bellandur")
+        log("✓ Locality selected: Bellandur")
     except Exception as e:
-        print("✗ Could not fill Locality field:", str(e))
+        log("✗ Could not fill Locality field:", str(e))
     
     # Click Save & Continue button
     try:
@@ -318,8 +316,7 @@ def fill_locality_details_page(driver):
         
         for selector in selectors:
             try:
-                elements = driver.find_elements(By.XPATH, selector)
-                visible_elements = [el for el in elements if el.is_displayed()]
+                visible_elements = dom.visible(driver, selector)
                 if visible_elements:
                     save_button = visible_elements[0]
                     break
@@ -327,44 +324,44 @@ def fill_locality_details_page(driver):
                 continue
         
         if save_button:
-            driver.execute_script("arguments[0].click();", save_button)
-            print("✓ Save & Continue button clicked - proceeding to next page")
+            with waits.acknowledged(driver, "Save & Continue"):
+                driver.execute_script("arguments[0].click();", save_button)
+            log("✓ Save & Continue button clicked - proceeding to next page")
         else:
-            print("✗ Could not find Save & Continue button with any selector")
+            log("✗ Could not find Save & Continue button with any selector")
     except Exception as e:
-        print("✗ Could not find Save & Continue button:", str(e))
+        log("✗ Could not find Save & Continue button:", str(e))
 
+@log.step
 def fill_rental_details_page(driver):
     """Fill the rental details page - rent, deposit, lease duration, lock-in period, and amenities."""
-    print("Starting to fill rental details page...")
+    log("Starting to fill rental details page...")
     
     # Wait for page transition
-    time.sleep(3)
+    waits.settled(driver)
     
     # Expected Rent - Direct approach using placeholder
     try:
-        all_inputs = driver.find_elements(By.XPATH, "//input[@placeholder='Enter Amount']")
-        # Get all inputs with type='number'
-        number_inputs = [inp for inp in all_inputs if inp.get_attribute('type') == 'number' and inp.is_displayed()]
+        # Get all visible inputs with type='number'
+        number_inputs = dom.visible(driver, "//input[@placeholder='Enter Amount' and @type='number']")
         
         if len(number_inputs) >= 1:
             number_inputs[0].clear()
             number_inputs[0].send_keys(EXPECTED_RENT)
-            print("✓ Expected Rent filled:", EXPECTED_RENT)
+            log("✓ Expected Rent filled:", EXPECTED_RENT)
     except Exception as e:
-        print("✗ Could not fill Expected Rent field:", str(e))
+        log("✗ Could not fill Expected Rent field:", str(e))
     
     # Expected Deposit - Second input with type='number'
     try:
-        all_inputs = driver.find_elements(By.XPATH, "//input[@placeholder='Enter Amount']")
-        number_inputs = [inp for inp in all_inputs if inp.get_attribute('type') == 'number' and inp.is_displayed()]
+        number_inputs = dom.visible(driver, "//input[@placeholder='Enter Amount' and @type='number']")
         
         if len(number_inputs) >= 2:
             number_inputs[1].clear()
             number_inputs[1].send_keys(EXPECTED_DEPOSIT)
-            print("✓ Expected Deposit filled:", EXPECTED_DEPOSIT)
+            log("✓ Expected Deposit filled:", EXPECTED_DEPOSIT)
     except Exception as e:
-        print("✗ Could not fill Expected Deposit field:", str(e))
+        log("✗ Could not fill Expected Deposit field:", str(e))
     
     # Lease Duration and Lock-in Period dropdowns
     try:
@@ -383,25 +380,23 @@ def fill_rental_details_page(driver):
                 combobox = driver.find_element(By.XPATH, xpath_selector)
                 
                 if not combobox.is_displayed():
-                    print(f"⚠️  {dropdown_name} combobox not visible")
+                    log(f"⚠️  {dropdown_name} combobox not visible")
                     continue
                 
-                driver.execute_script("arguments[0].scrollIntoView({block:'center'});", combobox)
-                time.sleep(0.2)
-                driver.execute_script("arguments[0].click();", combobox)
+                dom.click(driver, combobox)
                 
                 first_option = WebDriverWait(driver, 5).until(
                     EC.element_to_be_clickable((By.XPATH, "//div[@role='option'][1]"))
                 )
                 driver.execute_script("arguments[0].click();", first_option)
-                print(f"✓ {dropdown_name} selected (first option)")
+                log(f"✓ {dropdown_name} selected (first option)")
                 time.sleep(0.2)
             except Exception as inner_e:
-                print(f"⚠️  {dropdown_name} selection failed:", str(inner_e))
+                log(f"⚠️  {dropdown_name} selection failed:", str(inner_e))
                 driver.execute_script("document.body.click();")
                 time.sleep(0.2)
     except Exception as e:
-        print("✗ Could not process dropdown selections:", str(e))
+        log("✗ Could not process dropdown selections:", str(e))
     
     # Select checkboxes: Bank and ATM
     checkbox_ids = ["Bank", "ATM"]
@@ -412,9 +407,9 @@ def fill_rental_details_page(driver):
                 EC.element_to_be_clickable((By.XPATH, f"//button[@id='{checkbox_id}']"))
             )
             driver.execute_script("arguments[0].click();", checkbox)
-            print(f"✓ {checkbox_id} selected")
+            log(f"✓ {checkbox_id} selected")
         except Exception as e:
-            print(f"✗ Could not select {checkbox_id}:", str(e))
+            log(f"✗ Could not select {checkbox_id}:", str(e))
     
     # Click Save & Continue button
     try:
@@ -429,8 +424,7 @@ def fill_rental_details_page(driver):
         
         for selector in selectors:
             try:
-                elements = driver.find_elements(By.XPATH, selector)
-                visible_elements = [el for el in elements if el.is_displayed()]
+                visible_elements = dom.visible(driver, selector)
                 if visible_elements:
                     save_button = visible_elements[0]
                     break
@@ -438,19 +432,21 @@ def fill_rental_details_page(driver):
                 continue
         
         if save_button:
-            driver.execute_script("arguments[0].click();", save_button)
-            print("✓ Save & Continue button clicked - proceeding to next page")
+            with waits.acknowledged(driver, "Save & Continue"):
+                driver.execute_script("arguments[0].click();", save_button)
+            log("✓ Save & Continue button clicked - proceeding to next page")
         else:
-            print("✗ Could not find Save & Continue button with any selector")
+            log("✗ Could not find Save & Continue button with any selector")
     except Exception as e:
-        print("✗ Could not find Save & Continue button:", str(e))
+        log("✗ Could not find Save & Continue button:", str(e))
 
+@log.step
 def fill_amenities_page(driver):
     """Fill the amenities page - dropdowns and directions."""
-    print("Starting to fill amenities page...")
+    log("Starting to fill amenities page...")
     
     # Wait for page transition
-    time.sleep(3)
+    waits.settled(driver)
     
     # Handle all dropdowns - select first option for each
     try:
@@ -473,36 +469,35 @@ def fill_amenities_page(driver):
                 combobox = driver.find_element(By.XPATH, xpath_selector)
                 
                 if not combobox.is_displayed():
-                    print(f"⚠️  {dropdown_name} combobox not visible")
+                    log(f"⚠️  {dropdown_name} combobox not visible")
                     continue
                 
-                driver.execute_script("arguments[0].scrollIntoView({block:'center'});", combobox)
-                time.sleep(0.2)
-                driver.execute_script("arguments[0].click();", combobox)
+                dom.click(driver, combobox)
                 
                 first_option = WebDriverWait(driver, 5).until(
                     EC.element_to_be_clickable((By.XPATH, "//div[@role='option'][1]"))
                 )
                 driver.execute_script("arguments[0].click();", first_option)
-                print(f"✓ {dropdown_name} selected (first option)")
+                log(f"✓ {dropdown_name} selected (first option)")
                 time.sleep(0.2)
             except Exception as inner_e:
-                print(f"⚠️  {dropdown_name} selection failed:", str(inner_e))
+                log(f"⚠️  {dropdown_name} selection failed:", str(inner_e))
                 driver.execute_script("document.body.click();")
                 time.sleep(0.2)
     except Exception as e:
-        print("✗ Could not process dropdown selections:", str(e))
+        log("✗ Could not process dropdown selections:", str(e))
     
     # Directions to Property textarea
     try:
         directions_textarea = WebDriverWait(driver, 10).until(
             EC.element_to_be_clickable((By.XPATH, "//textarea[@name='directionsTip']"))
         )
-        directions_textarea.clear()
-        directions_textarea.send_keys(DIRECTIONS_TIP)
-        print(f"✓ Directions to Property filled: {DIRECTIONS_TIP}")
+        if forms.set_text(driver, directions_textarea, DIRECTIONS_TIP):
+            log(f"✓ Directions to Property filled: {DIRECTIONS_TIP}")
+        else:
+            log("✗ Directions to Property does not hold the text")
     except Exception as e:
-        print("✗ Could not fill Directions to Property field:", str(e))
+        log("✗ Could not fill Directions to Property field:", str(e))
     
     # Click Save & Continue button
     try:
@@ -517,8 +512,7 @@ def fill_amenities_page(driver):
         
         for selector in selectors:
             try:
-                elements = driver.find_elements(By.XPATH, selector)
-                visible_elements = [el for el in elements if el.is_displayed()]
+                visible_elements = dom.visible(driver, selector)
                 if visible_elements:
                     save_button = visible_elements[0]
                     break
@@ -526,16 +520,18 @@ def fill_amenities_page(driver):
                 continue
         
         if save_button:
-            driver.execute_script("arguments[0].click();", save_button)
-            print("✓ Save & Continue button clicked - proceeding to next page")
+            with waits.acknowledged(driver, "Save & Continue"):
+                driver.execute_script("arguments[0].click();", save_button)
+            log("✓ Save & Continue button clicked - proceeding to next page")
         else:
-            print("✗ Could not find Save & Continue button with any selector")
+            log("✗ Could not find Save & Continue button with any selector")
     except Exception as e:
-        print("✗ Could not find Save & Continue button:", str(e))
+        log("✗ Could not find Save & Continue button:", str(e))
 
+@log.step
 def fill_gallery_page(driver):
     """Fill the gallery page by uploading images to all categories."""
-    print("Starting to fill gallery page...")
+    log("Starting to fill gallery page...")
     
     # Get absolute path to the image file
     current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -543,21 +539,20 @@ def fill_gallery_page(driver):
     
     # Check if image exists
     if not os.path.exists(image_absolute_path):
-        print(f"✗ Image file not found: {image_absolute_path}")
-        print("⚠️  Skipping gallery upload")
+        log(f"✗ Image file not found: {image_absolute_path}")
+        log("⚠️  Skipping gallery upload")
     else:
-        print(f"✓ Found image file: {image_absolute_path}")
+        log(f"✓ Found image file: {image_absolute_path}")
         
         # Wait for page transition
-        time.sleep(3)
+        waits.settled(driver)
         
         # Find all file inputs and upload images
         try:
             # Find all file inputs that accept images
-            file_inputs = driver.find_elements(By.XPATH, "//input[@type='file' and @accept='image/*']")
-            visible_file_inputs = [inp for inp in file_inputs if inp.is_displayed()]
+            visible_file_inputs = dom.visible(driver, "//input[@type='file' and @accept='image/*']")
             
-            print(f"Found {len(file_inputs)} total file inputs, {len(visible_file_inputs)} visible")
+            log(f"Found {len(visible_file_inputs)} visible file inputs")
             
             # Upload to the first 3 visible file inputs (Front View, Interior View, Others)
             gallery_categories = ["Front View", "Interior View", "Others"]
@@ -572,14 +567,14 @@ def fill_gallery_page(driver):
                     
                     # Upload the image
                     file_input.send_keys(image_absolute_path)
-                    print(f"✓ Uploaded image to {gallery_categories[i]}")
+                    log(f"✓ Uploaded image to {gallery_categories[i]}")
                     time.sleep(1)
                     
                 except Exception as e:
-                    print(f"✗ Could not upload image to {gallery_categories[i]}:", str(e))
+                    log(f"✗ Could not upload image to {gallery_categories[i]}:", str(e))
                     
         except Exception as e:
-            print("✗ Could not find file inputs for images:", str(e))
+            log("✗ Could not find file inputs for images:", str(e))
     
     # Click Save & Continue button
     try:
@@ -594,8 +589,7 @@ def fill_gallery_page(driver):
         
         for selector in selectors:
             try:
-                elements = driver.find_elements(By.XPATH, selector)
-                visible_elements = [el for el in elements if el.is_displayed()]
+                visible_elements = dom.visible(driver, selector)
                 if visible_elements:
                     save_button = visible_elements[0]
                     break
@@ -603,90 +597,90 @@ def fill_gallery_page(driver):
                 continue
         
         if save_button:
-            driver.execute_script("arguments[0].click();", save_button)
-            print("✓ Save & Continue button clicked - proceeding to next page")
+            with waits.acknowledged(driver, "Save & Continue"):
+                driver.execute_script("arguments[0].click();", save_button)
+            log("✓ Save & Continue button clicked - proceeding to next page")
         else:
-            print("✗ Could not find Save & Continue button with any selector")
+            log("✗ Could not find Save & Continue button with any selector")
     except Exception as e:
-        print("✗ Could not find Save & Continue button:", str(e))
+        log("✗ Could not find Save & Continue button:", str(e))
 
+@log.step
 def fill_schedule_and_submit(driver):
     """Fill the schedule page and submit the property."""
-    print("Starting to fill schedule page...")
+    log("Starting to fill schedule page...")
     
     # Wait for page transition
-    time.sleep(3)
+    waits.settled(driver)
     
     # Click Submit Property button
     try:
         submit_button = WebDriverWait(driver, 10).until(
             EC.element_to_be_clickable((By.XPATH, "//button[contains(text(), 'Submit Property')]"))
         )
-        driver.execute_script("arguments[0].scrollIntoView({block:'center'});", submit_button)
-        time.sleep(0.5)
-        driver.execute_script("arguments[0].click();", submit_button)
-        print("✓ Submit Property button clicked - property submitted!")
-        
-        # Wait for submission to complete
-        time.sleep(3)
+        with waits.acknowledged(driver, "Submit Property", submit=True):
+            dom.click(driver, submit_button)
+        log("✓ Submit Property button clicked - property submitted!")
         
     except Exception as e:
-        print("✗ Could not find or click Submit Property button:", str(e))
+        log("✗ Could not find or click Submit Property button:", str(e))
 
+@log.step
 def start_new_post(driver):
     """Navigate to post property page to start a new property posting."""
-    print("Starting new property posting...")
+    log("Starting new property posting...")
     
     try:
-        driver.get("https://homehni.in/post-property")
+        driver.get(f"{BASE_URL}/post-property")
         WebDriverWait(driver, 15).until(
             EC.presence_of_element_located((By.XPATH, "//button[@role='combobox' and contains(., 'Select city')] | //button[contains(., 'Start Posting Your Ad For FREE')]"))
         )
-        print("✓ Navigated to post property page - ready for next property")
+        log("✓ Navigated to post property page - ready for next property")
         time.sleep(2)
     except Exception as e:
-        print("✗ Could not navigate to post property page:", str(e))
+        log("✗ Could not navigate to post property page:", str(e))
 
 def run_full_post_flow(driver, property_index):
     """Run the complete property posting flow for one property."""
-    print(f"\n{'='*50}")
-    print(f"COMMERCIAL RENT PROPERTY {property_index} - Starting posting flow")
-    print(f"{'='*50}")
+    with log.listing(property_index):
+        log(f"\n{'='*50}")
+        log(f"COMMERCIAL RENT PROPERTY {property_index} - Starting posting flow")
+        log(f"{'='*50}")
     
-    try:
-        # Fill the first page form
-        fill_first_page(driver)
-        time.sleep(3)
+        try:
+            # Fill the first page form
+            fill_first_page(driver)
+            waits.settled(driver)
 
-        # Fill the property details page
-        fill_property_details(driver)
-        time.sleep(3)
+            # Fill the property details page
+            fill_property_details(driver)
+            waits.settled(driver)
 
-        # Fill the locality details page
-        fill_locality_details_page(driver)
-        time.sleep(3)
+            # Fill the locality details page
+            fill_locality_details_page(driver)
+            waits.settled(driver)
 
-        # Fill the rental details page
-        fill_rental_details_page(driver)
-        time.sleep(3)
+            # Fill the rental details page
+            fill_rental_details_page(driver)
+            waits.settled(driver)
 
-        # Fill the amenities page
-        fill_amenities_page(driver)
-        time.sleep(3)
+            # Fill the amenities page
+            fill_amenities_page(driver)
+            waits.settled(driver)
 
-        # Fill the gallery page
-        fill_gallery_page(driver)
-        time.sleep(3)
+            # Fill the gallery page
+            fill_gallery_page(driver)
+            waits.settled(driver)
 
-        # Fill the schedule page and submit
-        fill_schedule_and_submit(driver)
+            # Fill the schedule page and submit
+            fill_schedule_and_submit(driver)
         
-        print(f"✓ Commercial Rent Property {property_index} submitted successfully!")
-        return True
+            log(f"✓ Commercial Rent Property {property_index} submitted successfully!")
+            return True
         
-    except Exception as e:
-        print(f"✗ Error posting Commercial Rent property {property_index}: {str(e)}")
-        return False
+        except Exception as e:
+            log(f"✗ Error posting Commercial Rent property {property_index}: {str(e)}")
+            return False
 
 def main():
     """Main entry point."""
@@ -694,14 +688,14 @@ def main():
     try:
         num_properties = int(input("How many Commercial Rent properties do you want to post? Enter a number: "))
         if num_properties <= 0:
-            print("Please enter a positive number.")
+            log("Please enter a positive number.")
             return
     except ValueError:
-        print("Please enter a valid number.")
+        log("Please enter a valid number.")
         return
 
     # Initialize Chrome WebDriver
-    driver = webdriver.Chrome()
+    driver = create_driver()
     driver.maximize_window()
 
     try:
@@ -709,30 +703,45 @@ def main():
         login_and_wait(driver)
 
         successful_posts = 0
+        partial_posts = 0
         failed_posts = 0
+        watch = Watchdog(landing_url=f"{BASE_URL}/post-property")
+        retries = retry.RetryQueue()
 
         # Post each property
         for i in range(1, num_properties + 1):
+            submitted = None
             try:
-                # Run the complete flow for one property
-                success = run_full_post_flow(driver, i)
+                # Run the complete flow for one property; only an unsubmitted one is retried
+                submits_before, failures_before = eventlog.submits(), eventlog.failures()
+                run_full_post_flow(driver, i)
+                submitted = eventlog.submits() > submits_before
                 
-                if success:
+                if submitted:
                     successful_posts += 1
-                    print(f"✓ Commercial Rent Property {i} completed successfully!")
+                    if eventlog.failures() > failures_before:
+                        partial_posts += 1
+                        log(f"⚠️  Commercial Rent Property {i} submitted with failed steps")
+                    else:
+                        log(f"✓ Commercial Rent Property {i} completed successfully!")
                 else:
                     failed_posts += 1
-                    print(f"✗ Commercial Rent Property {i} failed!")
+                    log(f"✗ Commercial Rent Property {i} was not submitted!")
+                    retries.park("commercial_rent", i, "NotSubmitted")
                 
                 # If not the last property, start a new post
                 if i < num_properties:
-                    print(f"\nStarting Commercial Rent property {i+1}...")
+                    log(f"\nStarting Commercial Rent property {i+1}...")
                     start_new_post(driver)
+                    # Fresh tab/browser every N listings or when memory runs high
+                    driver = watch.check(driver)
                     time.sleep(2)
                     
             except Exception as e:
-                print(f"✗ Error with Commercial Rent property {i}: {str(e)}")
-                failed_posts += 1
+                log(f"✗ Error with Commercial Rent property {i}: {str(e)}")
+                if submitted is None:
+                    failed_posts += 1
+                    retries.park("commercial_rent", i, type(e).__name__)
                 
                 # If not the last property, try to start a new post
                 if i < num_properties:
@@ -740,25 +749,36 @@ def main():
                         start_new_post(driver)
                         time.sleep(2)
                     except:
-                        print("Could not start new post. Please check the browser manually.")
+                        log("Could not start new post. Please check the browser manually.")
                         break
 
-        # Final summary
-        print(f"\n{'='*60}")
-        print(f"COMMERCIAL RENT POSTING COMPLETE!")
-        print(f"{'='*60}")
-        print(f"Total properties requested: {num_properties}")
-        print(f"Successfully posted: {successful_posts}")
-        print(f"Failed posts: {failed_posts}")
-        print(f"Success rate: {(successful_posts/num_properties)*100:.1f}%")
-        print(f"{'='*60}")
+        # Retry the failed properties on a fresh tab, backing off between attempts
+        if len(retries):
+            log(f"\nRetrying {len(retries)} failed Commercial Rent properties...")
+            driver, recovered = retry.drain(driver, retries, watch)
+            successful_posts += recovered
+            failed_posts -= recovered
 
+        # Final summary
+        log(f"\n{'='*60}")
+        log(f"COMMERCIAL RENT POSTING COMPLETE!")
+        log(f"{'='*60}")
+        log(f"Total properties requested: {num_properties}")
+        log(f"Successfully posted: {successful_posts}")
+        log(f"Submitted with failed steps: {partial_posts}")
+        log(f"Failed posts: {failed_posts}")
+        log(f"Success rate: {(successful_posts/num_properties)*100:.1f}%")
+        if retries.dead:
+            log(f"Dead letters: {retries.path}")
+        log(f"{'='*60}")
+
+        log.flush()
         input("Press Enter to close the browser...")
 
     except Exception as e:
-        print(f"An error occurred: {str(e)}")
+        log(f"An error occurred: {str(e)}")
     finally:
-        driver.quit()
+        release(driver)
 
 if __name__ == "__main__":
     main()
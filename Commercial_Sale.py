@@ -15,15 +15,22 @@ Usage:
 
 import time
 import os
-import random
 from datetime import datetime
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait, Select
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.keys import Keys
 
+from drivers import BASE_URL, create_driver, release
+import dom
+import forms
+import options
+import waits
+from eventlog import get_logger
+
+log = get_logger("commercial_sale")
+
 # Configuration
 PRIMARY_NAME = "Tanish"
 PRIMARY_MOBILE = "9902978675"
@@ -72,42 +79,37 @@ def login_and_wait(driver):
     Once you are logged in and have clicked on 'Post Property' to reach the
     first page form, press Enter in your terminal to continue.
     """
-    driver.get("https://homehni.in")
+    driver.get(BASE_URL)
     input("Please complete the login process, click on 'Post Property', and when you reach the first page form, press Enter here to continue...")
 
+@log.step
 def fill_first_page(driver):
     """Fill the first page form - select city, Commercial option, Sale option, and submit.
     More robust with retries, scrolling, and JS clicks to avoid interceptions.
     """
-    print("Starting to fill first page...")
-    print("Note: Name and Mobile are pre-filled automatically")
+    log("Starting to fill first page...")
+    log("Note: Name and Mobile are pre-filled automatically")
 
     def try_fill_once():
         # Mobile Number - Fill with phone number
         try:
-            mobile_input = WebDriverWait(driver, 10).until(
-                EC.element_to_be_clickable((By.XPATH, "//input[@id='mobile']"))
-            )
-            mobile_input.clear()
-            mobile_input.send_keys(PRIMARY_MOBILE)
-            print(f"✓ Mobile Number filled: {PRIMARY_MOBILE}")
+            forms.fill_fields(driver, {"Mobile Number": ("//input[@id='mobile']", PRIMARY_MOBILE)}, timeout=10)
         except Exception as e:
-            print("✗ Could not fill Mobile Number field:", str(e))
+            log("✗ Could not fill Mobile Number field:", str(e))
 
         # City dropdown - always select first option in the list
         try:
             city_combobox = WebDriverWait(driver, 10).until(
                 EC.element_to_be_clickable((By.XPATH, "//button[@role='combobox' and contains(., 'Select city')]"))
             )
-            driver.execute_script("arguments[0].scrollIntoView({block:'center'});", city_combobox)
-            driver.execute_script("arguments[0].click();", city_combobox)
+            dom.click(driver, city_combobox)
             time.sleep(1)
             try:
                 first_opt = WebDriverWait(driver, 5).until(
                     EC.element_to_be_clickable((By.XPATH, "(//div[@role='option'] | //li[@role='option'])[1]"))
                 )
                 driver.execute_script("arguments[0].click();", first_opt)
-                print("✓ City selected (first option)")
+                log("✓ City selected (first option)")
             except:
                 # Fallback: type any character and pick first suggestion
                 try:
@@ -121,35 +123,31 @@ def fill_first_page(driver):
                         EC.element_to_be_clickable((By.XPATH, "(//div[@role='option'] | //li[@role='option'])[1]"))
                     )
                     driver.execute_script("arguments[0].click();", first_opt)
-                    print("✓ City selected (typed, first option)")
+                    log("✓ City selected (typed, first option)")
                 except:
-                    print("⚠️  Skipping city selection this attempt")
+                    log("⚠️  Skipping city selection this attempt")
         except Exception as e:
-            print("⚠️  City combobox not ready:", str(e))
+            log("⚠️  City combobox not ready:", str(e))
 
         # Commercial button (scoped within the same form section as the submit button)
         try:
             commercial_button = WebDriverWait(driver, 10).until(
                 EC.presence_of_element_located((By.XPATH, "//div[.//button[normalize-space()='Start Posting Your Ad For FREE']]//button[normalize-space()='Commercial']"))
             )
-            driver.execute_script("arguments[0].scrollIntoView({block:'center'});", commercial_button)
-            time.sleep(0.3)
-            driver.execute_script("arguments[0].click();", commercial_button)
-            print("✓ Commercial button clicked")
+            dom.click(driver, commercial_button)
+            log("✓ Commercial button clicked")
         except Exception as e:
-            print("✗ Could not click Commercial:", str(e))
+            log("✗ Could not click Commercial:", str(e))
 
         # Sale button (after clicking Commercial)
         try:
             sale_button = WebDriverWait(driver, 10).until(
                 EC.presence_of_element_located((By.XPATH, "//button[normalize-space()='Sale']"))
             )
-            driver.execute_script("arguments[0].scrollIntoView({block:'center'});", sale_button)
-            time.sleep(0.3)
-            driver.execute_script("arguments[0].click();", sale_button)
-            print("✓ Sale button clicked")
+            dom.click(driver, sale_button)
+            log("✓ Sale button clicked")
         except Exception as e:
-            print("✗ Could not click Sale:", str(e))
+            log("✗ Could not click Sale:", str(e))
 
         # Submit button: wait until enabled (no disabled attribute), then click
         try:
@@ -158,56 +156,53 @@ def fill_first_page(driver):
             )
             # wait until button is enabled
             WebDriverWait(driver, 10).until(lambda d: submit_button.get_attribute('disabled') is None)
-            driver.execute_script("arguments[0].scrollIntoView({block:'center'});", submit_button)
-            time.sleep(0.3)
-            driver.execute_script("arguments[0].click();", submit_button)
-            print("✓ Submit button clicked - proceeding to next page")
+            dom.click(driver, submit_button)
+            log("✓ Submit button clicked - proceeding to next page")
             return True
         except Exception as e:
-            print("✗ Could not click Submit:", str(e))
+            log("✗ Could not click Submit:", str(e))
             return False
 
     # Try once; if fail, reload post page and retry once
     success = try_fill_once()
     if not success:
         try:
-            driver.get("https://homehni.in/post-property")
+            driver.get(f"{BASE_URL}/post-property")
             WebDriverWait(driver, 15).until(
                 EC.presence_of_element_located((By.XPATH, "//button[@role='combobox' and contains(., 'Select city')] | //button[contains(., 'Start Posting Your Ad For FREE')]"))
             )
-            print("↻ Retrying first page after reload...")
+            log("↻ Retrying first page after reload...")
             try_fill_once()
         except Exception:
             pass
 
+@log.step
 def fill_property_details(driver, property_name):
     """Fill the property details page form."""
-    print("Starting to fill property details page...")
+    log("Starting to fill property details page...")
     
     # Wait for page transition
-    time.sleep(3)
+    waits.settled(driver)
     
     # Property Name - Direct approach
     try:
-        all_inputs = driver.find_elements(By.XPATH, "//input[@name='title']")
-        visible_inputs = [inp for inp in all_inputs if inp.is_displayed()]
+        visible_inputs = dom.visible(driver, "//input[@name='title']")
         if visible_inputs:
             visible_inputs[0].clear()
             visible_inputs[0].send_keys(property_name)
-            print("✓ Property Name filled:", property_name)
+            log("✓ Property Name filled:", property_name)
     except Exception as e:
-        print("✗ Could not fill Property Name field:", str(e))
+        log("✗ Could not fill Property Name field:", str(e))
 
     # Super Built Up Area - Direct approach
     try:
-        all_inputs = driver.find_elements(By.XPATH, "//input[@name='superBuiltUpArea']")
-        visible_inputs = [inp for inp in all_inputs if inp.is_displayed()]
+        visible_inputs = dom.visible(driver, "//input[@name='superBuiltUpArea']")
         if visible_inputs:
             visible_inputs[0].clear()
             visible_inputs[0].send_keys(SUPER_BUILT_UP_AREA)
-            print("✓ Super Built Up Area filled:", SUPER_BUILT_UP_AREA)
+            log("✓ Super Built Up Area filled:", SUPER_BUILT_UP_AREA)
     except Exception as e:
-        print("✗ Could not fill Super Built Up Area field:", str(e))
+        log("✗ Could not fill Super Built Up Area field:", str(e))
 
     # Dropdowns on this page - select first option for each visible combobox
     try:
@@ -217,7 +212,7 @@ def fill_property_details(driver, property_name):
         
         # Collect visible combobox buttons on the page
         comboboxes = WebDriverWait(driver, 10).until(
-            lambda d: [el for el in d.find_elements(By.XPATH, "//button[@role='combobox']") if el.is_displayed()]
+            lambda d: dom.visible(d, "//button[@role='combobox']")
         )
         
         # We expect 3 dropdowns: Space Type (already has default "Office"), Building Type, Furnishing Status
@@ -236,21 +231,19 @@ def fill_property_details(driver, property_name):
         
         for idx, cb in enumerate(filtered_comboboxes[:2], start=1):
             try:
-                driver.execute_script("arguments[0].scrollIntoView({block:'center'});", cb)
-                time.sleep(0.2)
-                driver.execute_script("arguments[0].click();", cb)
+                dom.click(driver, cb)
                 first_option = WebDriverWait(driver, 5).until(
                     EC.element_to_be_clickable((By.XPATH, "//div[@role='option'][1]"))
                 )
                 driver.execute_script("arguments[0].click();", first_option)
-                print(f"✓ Dropdown {idx} ({dropdown_names[idx-1]}) selected (first option)")
+                log(f"✓ Dropdown {idx} ({dropdown_names[idx-1]}) selected (first option)")
                 time.sleep(0.2)
             except Exception as inner_e:
-                print(f"⚠️  Dropdown {idx} ({dropdown_names[idx-1]}) selection failed:", str(inner_e))
+                log(f"⚠️  Dropdown {idx} ({dropdown_names[idx-1]}) selection failed:", str(inner_e))
                 driver.execute_script("document.body.click();")
                 time.sleep(0.2)
     except Exception as e:
-        print("✗ Could not process dropdown selections:", str(e))
+        log("✗ Could not process dropdown selections:", str(e))
 
     # Click Save & Continue button
     try:
@@ -265,8 +258,7 @@ def fill_property_details(driver, property_name):
         
         for selector in selectors:
             try:
-                elements = driver.find_elements(By.XPATH, selector)
-                visible_elements = [el for el in elements if el.is_displayed()]
+                visible_elements = dom.visible(driver, selector)
                 if visible_elements:
                     save_button = visible_elements[0]
                     break
@@ -274,19 +266,21 @@ def fill_property_details(driver, property_name):
                 continue
         
         if save_button:
-            driver.execute_script("arguments[0].click();", save_button)
-            print("✓ Save & Continue button clicked - proceeding to next page")
+            with waits.acknowledged(driver, "Save & Continue"):
+                driver.execute_script("arguments[0].click();", save_button)
+            log("✓ Save & Continue button clicked - proceeding to next page")
         else:
-            print("✗ Could not find Save & Continue button with any selector")
+            log("✗ Could not find Save & Continue button with any selector")
     except Exception as e:
-        print("✗ Could not find Save & Continue button:", str(e))
+        log("✗ Could not find Save & Continue button:", str(e))
 
+@log.step
 def fill_locality_details_page(driver, city_name, locality_name):
     """Fill the locality details page - city and locality using autocomplete."""
-    print("Starting to fill locality details page...")
+    log("Starting to fill locality details page...")
     
     # Wait for page transition
-    time.sleep(3)
+    waits.settled(driver)
     
     # City field - Type and select first suggestion
     try:
@@ -295,7 +289,7 @@ def fill_locality_details_page(driver, city_name, locality_name):
         )
         city_input.clear()
         city_input.send_keys(city_name)
-        print(f"✓ Typed city: {city_name}")
+        log(f"✓ Typed city: {city_name}")
         time.sleep(2)  # Wait for autocomplete suggestions
         
         # Click first suggestion (Google Places autocomplete)
@@ -304,11 +298,11 @@ def fill_locality_details_page(driver, city_name, locality_name):
                 EC.element_to_be_clickable((By.XPATH, "//div[contains(@class, 'pac-item')][1]"))
             )
             driver.execute_script("arguments[0].click();", first_suggestion)
-            print(f"✓ City selected: {city_name}")
+            log(f"✓ City selected: {city_name}")
         except:
-            print("⚠️  Could not click city suggestion, but city typed")
+            log("⚠️  Could not click city suggestion, but city typed")
     except Exception as e:
-        print("✗ Could not fill city field:", str(e))
+        log("✗ Could not fill city field:", str(e))
     
     time.sleep(1)
     
@@ -319,7 +313,7 @@ def fill_locality_details_page(driver, city_name, locality_name):
         )
         locality_input.clear()
         locality_input.send_keys(locality_name)
-        print(f"✓ Typed locality: {locality_name}")
+        log(f"✓ Typed locality: {locality_name}")
         time.sleep(2)  # Wait for autocomplete suggestions
         
         # Click first suggestion (Google Places autocomplete)
@@ -328,11 +322,11 @@ def fill_locality_details_page(driver, city_name, locality_name):
                 EC.element_to_be_clickable((By.XPATH, "//div[contains(@class, 'pac-item')][1]"))
             )
             driver.execute_script("arguments[0].click();", first_suggestion)
-            print(f"✓ Locality selected: {locality_name}")
+            log(f"✓ Locality selected: {locality_name}")
         except:
-            print("⚠️  Could not click locality suggestion, but locality typed")
+            log("⚠️  Could not click locality suggestion, but locality typed")
     except Exception as e:
-        print("✗ Could not fill locality field:", str(e))
+        log("✗ Could not fill locality field:", str(e))
     
     # Click Save & Continue button
     try:
@@ -347,8 +341,7 @@ def fill_locality_details_page(driver, city_name, locality_name):
         
         for selector in selectors:
             try:
-                elements = driver.find_elements(By.XPATH, selector)
-                visible_elements = [el for el in elements if el.is_displayed()]
+                visible_elements = dom.visible(driver, selector)
                 if visible_elements:
                     save_button = visible_elements[0]
                     break
@@ -356,19 +349,21 @@ def fill_locality_details_page(driver, city_name, locality_name):
                 continue
         
         if save_button:
-            driver.execute_script("arguments[0].click();", save_button)
-            print("✓ Save & Continue button clicked - proceeding to next page")
+            with waits.acknowledged(driver, "Save & Continue"):
+                driver.execute_script("arguments[0].click();", save_button)
+            log("✓ Save & Continue button clicked - proceeding to next page")
         else:
-            print("✗ Could not find Save & Continue button with any selector")
+            log("✗ Could not find Save & Continue button with any selector")
     except Exception as e:
-        print("✗ Could not find Save & Continue button:", str(e))
+        log("✗ Could not find Save & Continue button:", str(e))
 
+@log.step
 def fill_sale_details_page(driver):
     """Fill the sale details page - expected price, ownership type, and suitable business types."""
-    print("Starting to fill sale details page...")
+    log("Starting to fill sale details page...")
     
     # Wait for page transition
-    time.sleep(3)
+    waits.settled(driver)
     
     # Expected Price
     try:
@@ -377,45 +372,22 @@ def fill_sale_details_page(driver):
         )
         price_input.clear()
         price_input.send_keys(EXPECTED_PRICE)
-        print("✓ Expected Price filled:", EXPECTED_PRICE)
+        log("✓ Expected Price filled:", EXPECTED_PRICE)
     except Exception as e:
-        print("✗ Could not fill Expected Price field:", str(e))
+        log("✗ Could not fill Expected Price field:", str(e))
     
     # Ownership Type - Random selection
     try:
         ownership_combobox = WebDriverWait(driver, 10).until(
             EC.element_to_be_clickable((By.XPATH, "//button[@role='combobox' and contains(@id, 'form-item') and .//span[text()='Select']]"))
         )
-        driver.execute_script("arguments[0].scrollIntoView({block:'center'});", ownership_combobox)
-        time.sleep(0.2)
-        driver.execute_script("arguments[0].click();", ownership_combobox)
-        time.sleep(0.5)
-        
-        # Get all options
-        options = driver.find_elements(By.XPATH, "//div[@role='option']")
-        if options and len(options) >= 4:
-            # Randomly select one of the 4 options (0, 1, 2, or 3)
-            selected_index = random.randint(0, 3)
-            selected_option = options[selected_index]
-            ownership_type = selected_option.text
-            driver.execute_script("arguments[0].click();", selected_option)
-            print(f"✓ Ownership Type selected (random index {selected_index}): {ownership_type}")
-        elif options:
-            # If less than 4 options, randomly select from available
-            selected_index = random.randint(0, len(options) - 1)
-            selected_option = options[selected_index]
-            ownership_type = selected_option.text
-            driver.execute_script("arguments[0].click();", selected_option)
-            print(f"✓ Ownership Type selected (random index {selected_index}): {ownership_type}")
+        ownership_type = options.select(driver, ownership_combobox, "commercial_sale.ownership_type")
+        if ownership_type:
+            log(f"✓ Ownership Type selected: {ownership_type}")
         else:
-            # Fallback: select first option if can't get all options
-            first_option = WebDriverWait(driver, 5).until(
-                EC.element_to_be_clickable((By.XPATH, "//div[@role='option'][1]"))
-            )
-            driver.execute_script("arguments[0].click();", first_option)
-            print("✓ Ownership Type selected (first option as fallback)")
+            log("✗ Could not select Ownership Type option")
     except Exception as e:
-        print("✗ Could not select Ownership Type:", str(e))
+        log("✗ Could not select Ownership Type:", str(e))
     
     time.sleep(0.5)
     
@@ -424,11 +396,12 @@ def fill_sale_details_page(driver):
         business_types_textarea = WebDriverWait(driver, 10).until(
             EC.element_to_be_clickable((By.XPATH, "//textarea[contains(@placeholder, 'Retail, Office, Restaurant')]"))
         )
-        business_types_textarea.clear()
-        business_types_textarea.send_keys(SUITABLE_BUSINESS_TYPES)
-        print("✓ Suitable Business Types filled")
+        if forms.set_text(driver, business_types_textarea, SUITABLE_BUSINESS_TYPES):
+            log("✓ Suitable Business Types filled")
+        else:
+            log("✗ Suitable Business Types does not hold the text")
     except Exception as e:
-        print("✗ Could not fill Suitable Business Types field:", str(e))
+        log("✗ Could not fill Suitable Business Types field:", str(e))
     
     # Click Save & Continue button
     try:
@@ -443,8 +416,7 @@ def fill_sale_details_page(driver):
         
         for selector in selectors:
             try:
-                elements = driver.find_elements(By.XPATH, selector)
-                visible_elements = [el for el in elements if el.is_displayed()]
+                visible_elements = dom.visible(driver, selector)
                 if visible_elements:
                     save_button = visible_elements[0]
                     break
@@ -452,19 +424,21 @@ def fill_sale_details_page(driver):
                 continue
         
         if save_button:
-            driver.execute_script("arguments[0].click();", save_button)
-            print("✓ Save & Continue button clicked - proceeding to next page")
+            with waits.acknowledged(driver, "Save & Continue"):
+                driver.execute_script("arguments[0].click();", save_button)
+            log("✓ Save & Continue button clicked - proceeding to next page")
         else:
-            print("✗ Could not find Save & Continue button with any selector")
+            log("✗ Could not find Save & Continue button with any selector")
     except Exception as e:
-        print("✗ Could not find Save & Continue button:", str(e))
+        log("✗ Could not find Save & Continue button:", str(e))
 
+@log.step
 def fill_amenities_page(driver):
     """Fill the amenities page - dropdowns and directions."""
-    print("Starting to fill amenities page...")
+    log("Starting to fill amenities page...")
     
     # Wait for page transition
-    time.sleep(3)
+    waits.settled(driver)
 
     def select_dropdown_option(driver, label_text, select_random=False):
         """Helper function to select an option from a dropdown."""
@@ -500,36 +474,17 @@ def fill_amenities_page(driver):
                         continue
             
             if target_combobox:
-                driver.execute_script("arguments[0].scrollIntoView({block:'center'});", target_combobox)
-                time.sleep(0.2)
-                driver.execute_script("arguments[0].click();", target_combobox)
-                time.sleep(0.5)
-                
-                # Get all options
-                options = WebDriverWait(driver, 5).until(
-                    EC.presence_of_all_elements_located((By.XPATH, "//div[@role='option']"))
-                )
-                
-                if options:
-                    if select_random and len(options) > 1:
-                        selected_index = random.randint(0, len(options) - 1)
-                        selected_option = options[selected_index]
-                        option_text = selected_option.text
-                        driver.execute_script("arguments[0].click();", selected_option)
-                        print(f"✓ {label_text} selected (random index {selected_index}): {option_text}")
-                    else:
-                        # Select the first option
-                        selected_option = options[0]
-                        option_text = selected_option.text
-                        driver.execute_script("arguments[0].click();", selected_option)
-                        print(f"✓ {label_text} selected (first option): {option_text}")
+                strategy = "random" if select_random else "first"
+                option_text = options.select(driver, target_combobox, f"commercial_sale.{label_text}", strategy)
+                if option_text:
+                    log(f"✓ {label_text} selected ({strategy} option): {option_text}")
                 else:
-                    print(f"✗ No options found for {label_text} dropdown.")
+                    log(f"✗ No options found for {label_text} dropdown.")
             else:
-                print(f"✗ Could not find {label_text} dropdown.")
+                log(f"✗ Could not find {label_text} dropdown.")
                 
         except Exception as e:
-            print(f"✗ Could not select {label_text}: {str(e)}")
+            log(f"✗ Could not select {label_text}: {str(e)}")
             # Close any open dropdowns
             driver.execute_script("document.body.click();")
             time.sleep(0.2)
@@ -572,11 +527,12 @@ def fill_amenities_page(driver):
         directions_textarea = WebDriverWait(driver, 10).until(
             EC.element_to_be_clickable((By.XPATH, "//textarea[@name='directionsTip']"))
         )
-        directions_textarea.clear()
-        directions_textarea.send_keys(DIRECTIONS_TIP)
-        print("✓ Directions for Buyers filled:", DIRECTIONS_TIP)
+        if forms.set_text(driver, directions_textarea, DIRECTIONS_TIP):
+            log("✓ Directions for Buyers filled:", DIRECTIONS_TIP)
+        else:
+            log("✗ Directions for Buyers does not hold the text")
     except Exception as e:
-        print("✗ Could not fill Directions for Buyers:", str(e))
+        log("✗ Could not fill Directions for Buyers:", str(e))
     
     # Click Save & Continue button
     try:
@@ -590,8 +546,7 @@ def fill_amenities_page(driver):
         
         for selector in selectors:
             try:
-                elements = driver.find_elements(By.XPATH, selector)
-                visible_elements = [el for el in elements if el.is_displayed()]
+                visible_elements = dom.visible(driver, selector)
                 if visible_elements:
                     save_button = visible_elements[0]
                     break
@@ -599,16 +554,18 @@ def fill_amenities_page(driver):
                 continue
         
         if save_button:
-            driver.execute_script("arguments[0].click();", save_button)
-            print("✓ Save & Continue button clicked - proceeding to next page")
+            with waits.acknowledged(driver, "Save & Continue"):
+                driver.execute_script("arguments[0].click();", save_button)
+            log("✓ Save & Continue button clicked - proceeding to next page")
         else:
-            print("✗ Could not find Save & Continue button with any selector")
+            log("✗ Could not find Save & Continue button with any selector")
     except Exception as e:
-        print("✗ Could not find Save & Continue button:", str(e))
+        log("✗ Could not find Save & Continue button:", str(e))
 
+@log.step
 def fill_gallery_page(driver):
     """Fill the gallery page by uploading images to all categories."""
-    print("Starting to fill gallery page...")
+    log("Starting to fill gallery page...")
     
     # Get absolute path to the image file
     current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -616,13 +573,13 @@ def fill_gallery_page(driver):
     
     # Check if image exists
     if not os.path.exists(image_absolute_path):
-        print(f"✗ Image file not found: {image_absolute_path}")
-        print("⚠️  Skipping gallery upload")
+        log(f"✗ Image file not found: {image_absolute_path}")
+        log("⚠️  Skipping gallery upload")
     else:
-        print(f"✓ Found image file: {image_absolute_path}")
+        log(f"✓ Found image file: {image_absolute_path}")
         
         # Wait for page transition
-        time.sleep(3)
+        waits.settled(driver)
         
         # Gallery categories for Commercial Sale (3 fields)
         gallery_categories = ["Front View", "Interior View", "Others"]
@@ -645,12 +602,12 @@ def fill_gallery_page(driver):
                     file_input.send_keys(image_absolute_path)
                     time.sleep(1)
                     
-                    print(f"✓ Uploaded image to {category}")
+                    log(f"✓ Uploaded image to {category}")
                 else:
-                    print(f"✗ Could not find file input for {category} (position {i})")
+                    log(f"✗ Could not find file input for {category} (position {i})")
                     
             except Exception as e:
-                print(f"✗ Could not upload image to {category}:", str(e))
+                log(f"✗ Could not upload image to {category}:", str(e))
     
     # Click Save & Continue button
     try:
@@ -664,8 +621,7 @@ def fill_gallery_page(driver):
         
         for selector in selectors:
             try:
-                elements = driver.find_elements(By.XPATH, selector)
-                visible_elements = [el for el in elements if el.is_displayed()]
+                visible_elements = dom.visible(driver, selector)
                 if visible_elements:
                     save_button = visible_elements[0]
                     break
@@ -673,96 +629,96 @@ def fill_gallery_page(driver):
                 continue
         
         if save_button:
-            driver.execute_script("arguments[0].click();", save_button)
-            print("✓ Save & Continue button clicked - proceeding to next page")
+            with waits.acknowledged(driver, "Save & Continue"):
+                driver.execute_script("arguments[0].click();", save_button)
+            log("✓ Save & Continue button clicked - proceeding to next page")
         else:
-            print("✗ Could not find Save & Continue button with any selector")
+            log("✗ Could not find Save & Continue button with any selector")
     except Exception as e:
-        print("✗ Could not find Save & Continue button:", str(e))
+        log("✗ Could not find Save & Continue button:", str(e))
 
+@log.step
 def fill_schedule_and_submit(driver):
     """Fill the schedule page and submit the property."""
-    print("Starting to fill schedule page...")
+    log("Starting to fill schedule page...")
     
     # Wait for page transition
-    time.sleep(3)
+    waits.settled(driver)
     
     # Click Submit Property button
     try:
         submit_button = WebDriverWait(driver, 10).until(
             EC.element_to_be_clickable((By.XPATH, "//button[contains(text(), 'Submit Property')]"))
         )
-        driver.execute_script("arguments[0].scrollIntoView({block:'center'});", submit_button)
-        time.sleep(0.5)
-        driver.execute_script("arguments[0].click();", submit_button)
-        print("✓ Submit Property button clicked - property submitted!")
-        
-        # Wait for submission to complete
-        time.sleep(3)
+        with waits.acknowledged(driver, "Submit Property", submit=True):
+            dom.click(driver, submit_button)
+        log("✓ Submit Property button clicked - property submitted!")
         
     except Exception as e:
-        print("✗ Could not find or click Submit Property button:", str(e))
+        log("✗ Could not find or click Submit Property button:", str(e))
 
+@log.step
 def start_new_post(driver):
     """Navigate to post property page to start a new property posting."""
-    print("Starting new property posting...")
+    log("Starting new property posting...")
     
     try:
-        driver.get("https://homehni.in/post-property")
+        driver.get(f"{BASE_URL}/post-property")
         WebDriverWait(driver, 15).until(
             EC.presence_of_element_located((By.XPATH, "//button[@role='combobox' and contains(., 'Select city')] | //button[contains(., 'Start Posting Your Ad For FREE')]"))
         )
-        print("✓ Navigated to post property page - ready for next property")
+        log("✓ Navigated to post property page - ready for next property")
         time.sleep(2)
     except Exception as e:
-        print("✗ Could not navigate to post property page:", str(e))
+        log("✗ Could not navigate to post property page:", str(e))
 
 def run_full_post_flow(driver, property_index):
     """Run the complete property posting flow for one property."""
-    # Get city and locality for this property
-    city_index = (property_index - 1) % len(CITIES_LOCALITIES)
-    city_name, locality_name = CITIES_LOCALITIES[city_index]
-    property_name = f"Commercial Property {property_index}"
+    with log.listing(property_index):
+        # Get city and locality for this property
+        city_index = (property_index - 1) % len(CITIES_LOCALITIES)
+        city_name, locality_name = CITIES_LOCALITIES[city_index]
+        property_name = f"Commercial Property {property_index}"
     
-    print(f"\n{'='*50}")
-    print(f"COMMERCIAL SALE PROPERTY {property_index} - Starting posting flow")
-    print(f"City: {city_name}, Locality: {locality_name}")
-    print(f"{'='*50}")
+        log(f"\n{'='*50}")
+        log(f"COMMERCIAL SALE PROPERTY {property_index} - Starting posting flow")
+        log(f"City: {city_name}, Locality: {locality_name}")
+        log(f"{'='*50}")
     
-    try:
-        # Fill the first page form
-        fill_first_page(driver)
-        time.sleep(3)
+        try:
+            # Fill the first page form
+            fill_first_page(driver)
+            waits.settled(driver)
 
-        # Fill the property details page
-        fill_property_details(driver, property_name)
-        time.sleep(3)
+            # Fill the property details page
+            fill_property_details(driver, property_name)
+            waits.settled(driver)
 
-        # Fill the locality details page
-        fill_locality_details_page(driver, city_name, locality_name)
-        time.sleep(3)
+            # Fill the locality details page
+            fill_locality_details_page(driver, city_name, locality_name)
+            waits.settled(driver)
 
-        # Fill the sale details page
-        fill_sale_details_page(driver)
-        time.sleep(3)
+            # Fill the sale details page
+            fill_sale_details_page(driver)
+            waits.settled(driver)
 
-        # Fill the amenities page
-        fill_amenities_page(driver)
-        time.sleep(3)
+            # Fill the amenities page
+            fill_amenities_page(driver)
+            waits.settled(driver)
 
-        # Fill the gallery page
-        fill_gallery_page(driver)
-        time.sleep(3)
+            # Fill the gallery page
+            fill_gallery_page(driver)
+            waits.settled(driver)
 
-        # Fill the schedule page and submit
-        fill_schedule_and_submit(driver)
+            # Fill the schedule page and submit
+            fill_schedule_and_submit(driver)
         
-        print(f"✓ Commercial Sale Property {property_index} submitted successfully!")
-        return True
+            log(f"✓ Commercial Sale Property {property_index} submitted successfully!")
+            return True
         
-    except Exception as e:
-        print(f"✗ Error posting Commercial Sale property {property_index}: {str(e)}")
-        return False
+        except Exception as e:
+            log(f"✗ Error posting Commercial Sale property {property_index}: {str(e)}")
+            return False
 
 def main():
     """Main entry point."""
@@ -770,14 +726,14 @@ def main():
     try:
         num_properties = int(input("How many Commercial Sale properties do you want to post? Enter a number: "))
         if num_properties <= 0:
-            print("Please enter a positive number.")
+            log("Please enter a positive number.")
             return
     except ValueError:
-        print("Please enter a valid number.")
+        log("Please enter a valid number.")
         return
 
     # Initialize Chrome WebDriver
-    driver = webdriver.Chrome()
+    driver = create_driver()
     driver.maximize_window()
 
     try:
@@ -795,19 +751,19 @@ def main():
                 
                 if success:
                     successful_posts += 1
-                    print(f"✓ Commercial Sale Property {i} completed successfully!")
+                    log(f"✓ Commercial Sale Property {i} completed successfully!")
                 else:
                     failed_posts += 1
-                    print(f"✗ Commercial Sale Property {i} failed!")
+                    log(f"✗ Commercial Sale Property {i} failed!")
                 
                 # If not the last property, start a new post
                 if i < num_properties:
-                    print(f"\nStarting Commercial Sale property {i+1}...")
+                    log(f"\nStarting Commercial Sale property {i+1}...")
                     start_new_post(driver)
                     time.sleep(2)
                     
             except Exception as e:
-                print(f"✗ Error with Commercial Sale property {i}: {str(e)}")
+                log(f"✗ Error with Commercial Sale property {i}: {str(e)}")
                 failed_posts += 1
                 
                 # If not the last property, try to start a new post
@@ -816,25 +772,26 @@ def main():
                         start_new_post(driver)
                         time.sleep(2)
                     except:
-                        print("Could not start new post. Please check the browser manually.")
+                        log("Could not start new post. Please check the browser manually.")
                         break
 
         # Final summary
-        print(f"\n{'='*60}")
-        print(f"COMMERCIAL SALE POSTING COMPLETE!")
-        print(f"{'='*60}")
-        print(f"Total properties requested: {num_properties}")
-        print(f"Successfully posted: {successful_posts}")
-        print(f"Failed posts: {failed_posts}")
-        print(f"Success rate: {(successful_posts/num_properties)*100:.1f}%")
-        print(f"{'='*60}")
-
+        log(f"\n{'='*60}")
+        log(f"COMMERCIAL SALE POSTING COMPLETE!")
+        log(f"{'='*60}")
+        log(f"Total properties requested: {num_properties}")
+        log(f"Successfully posted: {successful_posts}")
+        log(f"Failed posts: {failed_posts}")
+        log(f"Success rate: {(successful_posts/num_properties)*100:.1f}%")
+        log(f"{'='*60}")
+
+        log.flush()
         input("Press Enter to close the browser...")
 
     except Exception as e:
-        print(f"An error occurred: {str(e)}")
+        log(f"An error occurred: {str(e)}")
     finally:
-        driver.quit()
+        release(driver)
 
 if __name__ == "__main__":
     main()
@@ -15,15 +15,22 @@ Usage:
 
 import time
 import os
-import random
 from datetime import datetime
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait, Select
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.keys import Keys
 
+from drivers import BASE_URL, create_driver, release
+import dom
+import forms
+import replay
+import waits
+from eventlog import get_logger
+
+log = get_logger("industrial")
+
 # Configuration
 PRIMARY_NAME = "Tanish"
 PRIMARY_MOBILE = "9902978675"
@@ -75,42 +82,37 @@ def login_and_wait(driver):
     Once you are logged in and have clicked on 'Post Property' to reach the
     first page form, press Enter in your terminal to continue.
     """
-    driver.get("https://homehni.in")
+    driver.get(BASE_URL)
     input("Please complete the login process, click on 'Post Property', and when you reach the first page form, press Enter here to continue...")
 
+@log.step
 def fill_first_page(driver):
     """Fill the first page form - select city, Land/Plot option, Industrial Land option, and submit.
     More robust with retries, scrolling, and JS clicks to avoid interceptions.
     """
-    print("Starting to fill first page...")
-    print("Note: Name and Mobile are pre-filled automatically")
+    log("Starting to fill first page...")
+    log("Note: Name and Mobile are pre-filled automatically")
 
     def try_fill_once():
         # Mobile Number - Fill with phone number
         try:
-            mobile_input = WebDriverWait(driver, 10).until(
-                EC.element_to_be_clickable((By.XPATH, "//input[@id='mobile']"))
-            )
-            mobile_input.clear()
-            mobile_input.send_keys(PRIMARY_MOBILE)
-            print(f"✓ Mobile Number filled: {PRIMARY_MOBILE}")
+            forms.fill_fields(driver, {"Mobile Number": ("//input[@id='mobile']", PRIMARY_MOBILE)}, timeout=10)
         except Exception as e:
-            print("✗ Could not fill Mobile Number field:", str(e))
+            log("✗ Could not fill Mobile Number field:", str(e))
 
         # City dropdown - always select first option in the list
         try:
             city_combobox = WebDriverWait(driver, 10).until(
                 EC.element_to_be_clickable((By.XPATH, "//button[@role='combobox' and contains(., 'Select city')]"))
             )
-            driver.execute_script("arguments[0].scrollIntoView({block:'center'});", city_combobox)
-            driver.execute_script("arguments[0].click();", city_combobox)
+            dom.click(driver, city_combobox)
             time.sleep(1)
             try:
                 first_opt = WebDriverWait(driver, 5).until(
                     EC.element_to_be_clickable((By.XPATH, "(//div[@role='option'] | //li[@role='option'])[1]"))
                 )
                 driver.execute_script("arguments[0].click();", first_opt)
-                print("✓ City selected (first option)")
+                log("✓ City selected (first option)")
             except:
                 # Fallback: type any character and pick first suggestion
                 try:
@@ -124,11 +126,11 @@ def fill_first_page(driver):
                         EC.element_to_be_clickable((By.XPATH, "(//div[@role='option'] | //li[@role='option'])[1]"))
                     )
                     driver.execute_script("arguments[0].click();", first_opt)
-                    print("✓ City selected (typed, first option)")
+                    log("✓ City selected (typed, first option)")
                 except:
-                    print("⚠️  Skipping city selection this attempt")
+                    log("⚠️  Skipping city selection this attempt")
         except Exception as e:
-            print("⚠️  City combobox not ready:", str(e))
+            log("⚠️  City combobox not ready:", str(e))
 
         # Land/Plot button - try multiple approaches
         try:
@@ -143,25 +145,19 @@ def fill_first_page(driver):
             
             for selector in selectors:
                 try:
-                    elements = driver.find_elements(By.XPATH, selector)
-                    for element in elements:
-                        if element.is_displayed():
-                            land_plot_button = element
-                            break
+                    land_plot_button = dom.first_visible(driver, selector)
                     if land_plot_button:
                         break
                 except:
                     continue
             
             if land_plot_button:
-                driver.execute_script("arguments[0].scrollIntoView({block:'center'});", land_plot_button)
-                time.sleep(0.3)
-                driver.execute_script("arguments[0].click();", land_plot_button)
-                print("✓ Land/Plot button clicked")
+                dom.click(driver, land_plot_button)
+                log("✓ Land/Plot button clicked")
             else:
-                print("✗ Could not find Land/Plot button")
+                log("✗ Could not find Land/Plot button")
         except Exception as e:
-            print("✗ Could not click Land/Plot button:", str(e))
+            log("✗ Could not click Land/Plot button:", str(e))
 
         # Wait for Industrial Land options to appear
         time.sleep(0.5)
@@ -178,25 +174,19 @@ def fill_first_page(driver):
             
             for selector in selectors:
                 try:
-                    elements = driver.find_elements(By.XPATH, selector)
-                    for element in elements:
-                        if element.is_displayed():
-                            industrial_land_button = element
-                            break
+                    industrial_land_button = dom.first_visible(driver, selector)
                     if industrial_land_button:
                         break
                 except:
                     continue
             
             if industrial_land_button:
-                driver.execute_script("arguments[0].scrollIntoView({block:'center'});", industrial_land_button)
-                time.sleep(0.3)
-                driver.execute_script("arguments[0].click();", industrial_land_button)
-                print("✓ Industrial Land button clicked")
+                dom.click(driver, industrial_land_button)
+                log("✓ Industrial Land button clicked")
             else:
-                print("✗ Could not find Industrial Land button")
+                log("✗ Could not find Industrial Land button")
         except Exception as e:
-            print("✗ Could not click Industrial Land button:", str(e))
+            log("✗ Could not click Industrial Land button:", str(e))
 
         # Submit button: wait until enabled (no disabled attribute), then click
         try:
@@ -205,97 +195,40 @@ def fill_first_page(driver):
             )
             # wait until button is enabled
             WebDriverWait(driver, 10).until(lambda d: submit_button.get_attribute('disabled') is None)
-            driver.execute_script("arguments[0].scrollIntoView({block:'center'});", submit_button)
-            time.sleep(0.3)
-            driver.execute_script("arguments[0].click();", submit_button)
-            print("✓ Submit button clicked - proceeding to next page")
+            dom.click(driver, submit_button)
+            log("✓ Submit button clicked - proceeding to next page")
             return True
         except Exception as e:
-            print("✗ Could not click Submit:", str(e))
+            log("✗ Could not click Submit:", str(e))
             return False
 
     # Try once; if fail, reload post page and retry once
     success = try_fill_once()
     if not success:
         try:
-            driver.get("https://homehni.in/post-property")
+            driver.get(f"{BASE_URL}/post-property")
             WebDriverWait(driver, 15).until(
                 EC.presence_of_element_located((By.XPATH, "//button[@role='combobox' and contains(., 'Select city')] | //button[contains(., 'Start Posting Your Ad For FREE')]"))
             )
-            print("↻ Retrying first page after reload...")
+            log("↻ Retrying first page after reload...")
             try_fill_once()
         except Exception:
             pass
 
+@log.step
 def fill_plot_details_page(driver):
     """Fill the plot details page form - plot area, length, width, and gated property."""
-    print("Starting to fill plot details page...")
+    log("Starting to fill plot details page...")
     
     # Wait for page transition
-    time.sleep(3)
+    waits.settled(driver)
     
-    # Plot Area
-    try:
-        plot_area_input = WebDriverWait(driver, 10).until(
-            EC.element_to_be_clickable((By.XPATH, "//input[@name='plotArea']"))
-        )
-        plot_area_input.clear()
-        plot_area_input.send_keys(PLOT_AREA)
-        print(f"✓ Plot Area filled: {PLOT_AREA}")
-    except Exception as e:
-        print("✗ Could not fill Plot Area field:", str(e))
-
-    # Plot Length
-    try:
-        plot_length_input = WebDriverWait(driver, 10).until(
-            EC.element_to_be_clickable((By.XPATH, "//input[@name='plotLength']"))
-        )
-        plot_length_input.clear()
-        plot_length_input.send_keys(PLOT_LENGTH)
-        print(f"✓ Plot Length filled: {PLOT_LENGTH}")
-    except Exception as e:
-        print("✗ Could not fill Plot Length field:", str(e))
-
-    # Plot Width
-    try:
-        plot_width_input = WebDriverWait(driver, 10).until(
-            EC.element_to_be_clickable((By.XPATH, "//input[@name='plotWidth']"))
-        )
-        plot_width_input.clear()
-        plot_width_input.send_keys(PLOT_WIDTH)
-        print(f"✓ Plot Width filled: {PLOT_WIDTH}")
-    except Exception as e:
-        print("✗ Could not fill Plot Width field:", str(e))
-
-    # Gated Property? - Select Yes or No randomly
-    try:
-        gated_combobox = WebDriverWait(driver, 10).until(
-            EC.element_to_be_clickable((By.XPATH, "//button[@role='combobox' and contains(., 'Select')]"))
-        )
-        driver.execute_script("arguments[0].scrollIntoView({block:'center'});", gated_combobox)
-        time.sleep(0.2)
-        driver.execute_script("arguments[0].click();", gated_combobox)
-        time.sleep(0.5)
-        
-        # Get all options
-        options = driver.find_elements(By.XPATH, "//div[@role='option']")
-        if options and len(options) >= 2:
-            # Randomly select either Yes (index 1) or No (index 0)
-            selected_index = random.randint(0, 1)
-            selected_option = options[selected_index]
-            gated_value = selected_option.text
-            driver.execute_script("arguments[0].click();", selected_option)
-            print(f"✓ Gated Property? selected (random): {gated_value}")
-        elif options:
-            # If only one option available, select it
-            selected_option = options[0]
-            gated_value = selected_option.text
-            driver.execute_script("arguments[0].click();", selected_option)
-            print(f"✓ Gated Property? selected: {gated_value}")
-        else:
-            print("✗ No options found for Gated Property? dropdown")
-    except Exception as e:
-        print("✗ Could not select Gated Property?:", str(e))
+    forms.fill_page(driver, "industrial.plot_details", {
+        "Plot Area": (forms.NUMBER, "//input[@name='plotArea']", PLOT_AREA),
+        "Plot Length": (forms.NUMBER, "//input[@name='plotLength']", PLOT_LENGTH),
+        "Plot Width": (forms.NUMBER, "//input[@name='plotWidth']", PLOT_WIDTH),
+        "Gated Property?": (forms.COMBOBOX, "//button[@role='combobox' and contains(., 'Select')]", forms.RANDOM),
+    })
     
     # Click Save & Continue button
     try:
@@ -309,8 +242,7 @@ def fill_plot_details_page(driver):
         
         for selector in selectors:
             try:
-                elements = driver.find_elements(By.XPATH, selector)
-                visible_elements = [el for el in elements if el.is_displayed()]
+                visible_elements = dom.visible(driver, selector)
                 if visible_elements:
                     save_button = visible_elements[0]
                     break
@@ -318,19 +250,21 @@ def fill_plot_details_page(driver):
                 continue
         
         if save_button:
-            driver.execute_script("arguments[0].click();", save_button)
-            print("✓ Save & Continue button clicked - proceeding to next page")
+            with waits.acknowledged(driver, "Save & Continue"):
+                driver.execute_script("arguments[0].click();", save_button)
+            log("✓ Save & Continue button clicked - proceeding to next page")
         else:
-            print("✗ Could not find Save & Continue button with any selector")
+            log("✗ Could not find Save & Continue button with any selector")
     except Exception as e:
-        print("✗ Could not find Save & Continue button:", str(e))
+        log("✗ Could not find Save & Continue button:", str(e))
 
+@log.step
 def fill_location_details_page(driver, city_name, locality_name):
     """Fill the location details page - city and locality using autocomplete."""
-    print("Starting to fill location details page...")
+    log("Starting to fill location details page...")
     
     # Wait for page transition
-    time.sleep(3)
+    waits.settled(driver)
     
     # City field - Type and select first suggestion
     try:
@@ -339,7 +273,7 @@ def fill_location_details_page(driver, city_name, locality_name):
         )
         city_input.clear()
         city_input.send_keys(city_name)
-        print(f"✓ Typed city: {city_name}")
+        log(f"✓ Typed city: {city_name}")
         time.sleep(1.5)  # Wait for autocomplete suggestions
         
         # Click first suggestion (Google Places autocomplete)
@@ -348,11 +282,11 @@ def fill_location_details_page(driver, city_name, locality_name):
                 EC.element_to_be_clickable((By.XPATH, "//div[contains(@class, 'pac-item')][1]"))
             )
             driver.execute_script("arguments[0].click();", first_suggestion)
-            print(f"✓ City selected: {city_name}")
+            log(f"✓ City selected: {city_name}")
         except:
-            print("⚠️  Could not click city suggestion, but city typed")
+            log("⚠️  Could not click city suggestion, but city typed")
     except Exception as e:
-        print("✗ Could not fill city field:", str(e))
+        log("✗ Could not fill city field:", str(e))
     
     # Locality field - Type and select first suggestion
     try:
@@ -361,7 +295,7 @@ def fill_location_details_page(driver, city_name, locality_name):
         )
         locality_input.clear()
         locality_input.send_keys(locality_name)
-        print(f"✓ Typed locality: {locality_name}")
+        log(f"✓ Typed locality: {locality_name}")
         time.sleep(1.5)  # Wait for autocomplete suggestions
         
         # Click first suggestion (Google Places autocomplete)
@@ -370,11 +304,11 @@ def fill_location_details_page(driver, city_name, locality_name):
                 EC.element_to_be_clickable((By.XPATH, "//div[contains(@class, 'pac-item')][1]"))
             )
             driver.execute_script("arguments[0].click();", first_suggestion)
-            print(f"✓ Locality selected: {locality_name}")
+            log(f"✓ Locality selected: {locality_name}")
         except:
-            print("⚠️  Could not click locality suggestion, but locality typed")
+            log("⚠️  Could not click locality suggestion, but locality typed")
     except Exception as e:
-        print("✗ Could not fill locality field:", str(e))
+        log("✗ Could not fill locality field:", str(e))
     
     # Click Save & Continue button
     try:
@@ -388,8 +322,7 @@ def fill_location_details_page(driver, city_name, locality_name):
         
         for selector in selectors:
             try:
-                elements = driver.find_elements(By.XPATH, selector)
-                visible_elements = [el for el in elements if el.is_displayed()]
+                visible_elements = dom.visible(driver, selector)
                 if visible_elements:
                     save_button = visible_elements[0]
                     break
@@ -397,19 +330,21 @@ def fill_location_details_page(driver, city_name, locality_name):
                 continue
         
         if save_button:
-            driver.execute_script("arguments[0].click();", save_button)
-            print("✓ Save & Continue button clicked - proceeding to next page")
+            with waits.acknowledged(driver, "Save & Continue"):
+                driver.execute_script("arguments[0].click();", save_button)
+            log("✓ Save & Continue button clicked - proceeding to next page")
         else:
-            print("✗ Could not find Save & Continue button with any selector")
+            log("✗ Could not find Save & Continue button with any selector")
     except Exception as e:
-        print("✗ Could not find Save & Continue button:", str(e))
+        log("✗ Could not find Save & Continue button:", str(e))
 
+@log.step
 def fill_sale_details_page(driver):
     """Fill the sale details page - expected price, approved by authority, and description."""
-    print("Starting to fill sale details page...")
+    log("Starting to fill sale details page...")
     
     # Wait for page transition
-    time.sleep(3)
+    waits.settled(driver)
     
     # Expected Price
     try:
@@ -418,9 +353,9 @@ def fill_sale_details_page(driver):
         )
         price_input.clear()
         price_input.send_keys(EXPECTED_PRICE)
-        print(f"✓ Expected Price filled: {EXPECTED_PRICE}")
+        log(f"✓ Expected Price filled: {EXPECTED_PRICE}")
     except Exception as e:
-        print("✗ Could not fill Expected Price field:", str(e))
+        log("✗ Could not fill Expected Price field:", str(e))
     
     # Which authority the property is posted by
     try:
@@ -429,20 +364,21 @@ def fill_sale_details_page(driver):
         )
         approved_by_input.clear()
         approved_by_input.send_keys(APPROVED_BY)
-        print(f"✓ Approved By filled: {APPROVED_BY}")
+        log(f"✓ Approved By filled: {APPROVED_BY}")
     except Exception as e:
-        print("✗ Could not fill Approved By field:", str(e))
+        log("✗ Could not fill Approved By field:", str(e))
     
     # Description
     try:
         description_textarea = WebDriverWait(driver, 10).until(
             EC.element_to_be_clickable((By.XPATH, "//textarea[@id='description']"))
         )
-        description_textarea.clear()
-        description_textarea.send_keys(DESCRIPTION)
-        print("✓ Description filled")
+        if forms.set_text(driver, description_textarea, DESCRIPTION):
+            log("✓ Description filled")
+        else:
+            log("✗ Description does not hold the text")
     except Exception as e:
-        print("✗ Could not fill Description field:", str(e))
+        log("✗ Could not fill Description field:", str(e))
     
     # Click Save & Continue button
     try:
@@ -456,8 +392,7 @@ def fill_sale_details_page(driver):
         
         for selector in selectors:
             try:
-                elements = driver.find_elements(By.XPATH, selector)
-                visible_elements = [el for el in elements if el.is_displayed()]
+                visible_elements = dom.visible(driver, selector)
                 if visible_elements:
                     save_button = visible_elements[0]
                     break
@@ -465,19 +400,21 @@ def fill_sale_details_page(driver):
                 continue
         
         if save_button:
-            driver.execute_script("arguments[0].click();", save_button)
-            print("✓ Save & Continue button clicked - proceeding to next page")
+            with waits.acknowledged(driver, "Save & Continue"):
+                driver.execute_script("arguments[0].click();", save_button)
+            log("✓ Save & Continue button clicked - proceeding to next page")
         else:
-            print("✗ Could not find Save & Continue button with any selector")
+            log("✗ Could not find Save & Continue button with any selector")
     except Exception as e:
-        print("✗ Could not find Save & Continue button:", str(e))
+        log("✗ Could not find Save & Continue button:", str(e))
 
+@log.step
 def fill_infrastructure_page(driver):
     """Fill the infrastructure page - water supply, electricity, sewage (random), road width, and directions."""
-    print("Starting to fill infrastructure page...")
+    log("Starting to fill infrastructure page...")
     
     # Wait for page transition
-    time.sleep(3)
+    waits.settled(driver)
     
     # Helper function to select a random dropdown option
     def select_random_dropdown_option(combobox_xpath):
@@ -486,54 +423,49 @@ def fill_infrastructure_page(driver):
             combobox = WebDriverWait(driver, 10).until(
                 EC.element_to_be_clickable((By.XPATH, combobox_xpath))
             )
-            driver.execute_script("arguments[0].scrollIntoView({block:'center'});", combobox)
-            time.sleep(0.2)
-            driver.execute_script("arguments[0].click();", combobox)
+            dom.click(driver, combobox)
             time.sleep(0.5)
             
             # Get all options
             options = driver.find_elements(By.XPATH, "//div[@role='option']")
             if options and len(options) >= 2:
                 # Randomly select one of the options
-                selected_index = random.randint(0, len(options) - 1)
+                selected_index = replay.randint(0, len(options) - 1, combobox_xpath)
                 selected_option = options[selected_index]
                 selected_value = selected_option.text
                 driver.execute_script("arguments[0].click();", selected_option)
-                print(f"✓ Selected: {selected_value}")
+                log(f"✓ Selected: {selected_value}")
                 return True
             elif options:
                 # If only one option, select it
                 driver.execute_script("arguments[0].click();", options[0])
-                print(f"✓ Selected: {options[0].text}")
+                log(f"✓ Selected: {options[0].text}")
                 return True
             else:
-                print("✗ No options found in dropdown")
+                log("✗ No options found in dropdown")
                 return False
         except Exception as e:
-            print(f"✗ Could not select dropdown option: {str(e)}")
+            log(f"✗ Could not select dropdown option: {str(e)}")
             # Close dropdown if open
             driver.execute_script("document.body.click();")
             time.sleep(0.2)
             return False
     
     # Water Supply - Select random option
-    print("Selecting Water Supply...")
+    log("Selecting Water Supply...")
     water_supply_xpath = "//button[@role='combobox' and contains(., 'water supply')]"
     select_random_dropdown_option(water_supply_xpath)
     time.sleep(0.5)
     
     # Electricity Connection - Select first option
-    print("Selecting Electricity Connection...")
+    log("Selecting Electricity Connection...")
     try:
         # Find all visible comboboxes and select the second one (Electricity Connection)
-        all_comboboxes = driver.find_elements(By.XPATH, "//button[@role='combobox']")
-        visible_comboboxes = [cb for cb in all_comboboxes if cb.is_displayed()]
+        visible_comboboxes = dom.visible(driver, "//button[@role='combobox']")
         
         if len(visible_comboboxes) >= 2:
             electricity_combobox = visible_comboboxes[1]  # Second combobox is Electricity
-            driver.execute_script("arguments[0].scrollIntoView({block:'center'});", electricity_combobox)
-            time.sleep(0.2)
-            driver.execute_script("arguments[0].click();", electricity_combobox)
+            dom.click(driver, electricity_combobox)
             time.sleep(0.5)
             
             # Select the first option
@@ -542,16 +474,16 @@ def fill_infrastructure_page(driver):
             )
             first_option_text = first_option.text
             driver.execute_script("arguments[0].click();", first_option)
-            print(f"✓ Electricity Connection selected: {first_option_text}")
+            log(f"✓ Electricity Connection selected: {first_option_text}")
         else:
-            print("✗ Could not find Electricity Connection combobox")
+            log("✗ Could not find Electricity Connection combobox")
     except Exception as e:
-        print("✗ Could not select Electricity Connection:", str(e))
+        log("✗ Could not select Electricity Connection:", str(e))
     
     time.sleep(0.5)
     
     # Sewage Connection - Select random option
-    print("Selecting Sewage Connection...")
+    log("Selecting Sewage Connection...")
     sewage_xpath = "//button[@role='combobox' and contains(., 'sewage')]"
     select_random_dropdown_option(sewage_xpath)
     time.sleep(0.5)
@@ -563,20 +495,21 @@ def fill_infrastructure_page(driver):
         )
         road_width_input.clear()
         road_width_input.send_keys(ROAD_WIDTH)
-        print(f"✓ Road Width filled: {ROAD_WIDTH}")
+        log(f"✓ Road Width filled: {ROAD_WIDTH}")
     except Exception as e:
-        print("✗ Could not fill Road Width field:", str(e))
+        log("✗ Could not fill Road Width field:", str(e))
     
     # Directions for buyers
     try:
         directions_textarea = WebDriverWait(driver, 10).until(
             EC.element_to_be_clickable((By.XPATH, "//textarea[@id='directionsToProperty']"))
         )
-        directions_textarea.clear()
-        directions_textarea.send_keys(DIRECTIONS_FOR_BUYERS)
-        print("✓ Directions for buyers filled")
+        if forms.set_text(driver, directions_textarea, DIRECTIONS_FOR_BUYERS):
+            log("✓ Directions for buyers filled")
+        else:
+            log("✗ Directions for buyers does not hold the text")
     except Exception as e:
-        print("✗ Could not fill Directions for buyers field:", str(e))
+        log("✗ Could not fill Directions for buyers field:", str(e))
     
     # Click Save & Continue button
     try:
@@ -590,8 +523,7 @@ def fill_infrastructure_page(driver):
         
         for selector in selectors:
             try:
-                elements = driver.find_elements(By.XPATH, selector)
-                visible_elements = [el for el in elements if el.is_displayed()]
+                visible_elements = dom.visible(driver, selector)
                 if visible_elements:
                     save_button = visible_elements[0]
                     break
@@ -599,19 +531,21 @@ def fill_infrastructure_page(driver):
                 continue
         
         if save_button:
-            driver.execute_script("arguments[0].click();", save_button)
-            print("✓ Save & Continue button clicked - proceeding to next page")
+            with waits.acknowledged(driver, "Save & Continue"):
+                driver.execute_script("arguments[0].click();", save_button)
+            log("✓ Save & Continue button clicked - proceeding to next page")
         else:
-            print("✗ Could not find Save & Continue button with any selector")
+            log("✗ Could not find Save & Continue button with any selector")
     except Exception as e:
-        print("✗ Could not find Save & Continue button:", str(e))
+        log("✗ Could not find Save & Continue button:", str(e))
 
+@log.step
 def fill_gallery_page(driver):
     """Fill the gallery page by uploading images."""
-    print("Starting to fill gallery page...")
+    log("Starting to fill gallery page...")
     
     # Wait for page transition
-    time.sleep(3)
+    waits.settled(driver)
     
     # Get absolute paths to the image files
     current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -622,12 +556,12 @@ def fill_gallery_page(driver):
     for img_path in image_paths:
         if os.path.exists(img_path):
             existing_images.append(img_path)
-            print(f"✓ Found image: {img_path}")
+            log(f"✓ Found image: {img_path}")
         else:
-            print(f"⚠️  Image not found: {img_path}")
+            log(f"⚠️  Image not found: {img_path}")
     
     if not existing_images:
-        print("✗ No images found. Skipping gallery upload.")
+        log("✗ No images found. Skipping gallery upload.")
         return
     
     # Upload all images at once
@@ -643,13 +577,13 @@ def fill_gallery_page(driver):
         
         # Send the file paths
         file_input.send_keys(image_files)
-        print(f"✓ Uploaded {len(existing_images)} image(s)")
+        log(f"✓ Uploaded {len(existing_images)} image(s)")
         
         # Wait a moment for uploads to process
         time.sleep(2)
         
     except Exception as e:
-        print("✗ Could not upload images:", str(e))
+        log("✗ Could not upload images:", str(e))
     
     # Click Save & Continue button
     try:
@@ -663,8 +597,7 @@ def fill_gallery_page(driver):
         
         for selector in selectors:
             try:
-                elements = driver.find_elements(By.XPATH, selector)
-                visible_elements = [el for el in elements if el.is_displayed()]
+                visible_elements = dom.visible(driver, selector)
                 if visible_elements:
                     save_button = visible_elements[0]
                     break
@@ -672,95 +605,95 @@ def fill_gallery_page(driver):
                 continue
         
         if save_button:
-            driver.execute_script("arguments[0].click();", save_button)
-            print("✓ Save & Continue button clicked - proceeding to next page")
+            with waits.acknowledged(driver, "Save & Continue"):
+                driver.execute_script("arguments[0].click();", save_button)
+            log("✓ Save & Continue button clicked - proceeding to next page")
         else:
-            print("✗ Could not find Save & Continue button with any selector")
+            log("✗ Could not find Save & Continue button with any selector")
     except Exception as e:
-        print("✗ Could not find Save & Continue button:", str(e))
+        log("✗ Could not find Save & Continue button:", str(e))
 
+@log.step
 def fill_schedule_and_submit(driver):
     """Fill the schedule page and submit the property."""
-    print("Starting to fill schedule page...")
+    log("Starting to fill schedule page...")
     
     # Wait for page transition
-    time.sleep(3)
+    waits.settled(driver)
     
     # Click Submit Property button
     try:
         submit_button = WebDriverWait(driver, 10).until(
             EC.element_to_be_clickable((By.XPATH, "//button[contains(text(), 'Submit Property')]"))
         )
-        driver.execute_script("arguments[0].scrollIntoView({block:'center'});", submit_button)
-        time.sleep(0.5)
-        driver.execute_script("arguments[0].click();", submit_button)
-        print("✓ Submit Property button clicked - property submitted!")
-        
-        # Wait for submission to complete
-        time.sleep(3)
+        with waits.acknowledged(driver, "Submit Property", submit=True):
+            dom.click(driver, submit_button)
+        log("✓ Submit Property button clicked - property submitted!")
         
     except Exception as e:
-        print("✗ Could not find or click Submit Property button:", str(e))
+        log("✗ Could not find or click Submit Property button:", str(e))
 
+@log.step
 def start_new_post(driver):
     """Navigate to post property page to start a new property posting."""
-    print("Starting new property posting...")
+    log("Starting new property posting...")
     
     try:
-        driver.get("https://homehni.in/post-property")
+        driver.get(f"{BASE_URL}/post-property")
         WebDriverWait(driver, 15).until(
             EC.presence_of_element_located((By.XPATH, "//button[@role='combobox' and contains(., 'Select city')] | //button[contains(., 'Start Posting Your Ad For FREE')]"))
         )
-        print("✓ Navigated to post property page - ready for next property")
+        log("✓ Navigated to post property page - ready for next property")
         time.sleep(2)
     except Exception as e:
-        print("✗ Could not navigate to post property page:", str(e))
+        log("✗ Could not navigate to post property page:", str(e))
 
 def run_full_post_flow(driver, property_index):
     """Run the complete property posting flow for one property."""
-    # Get city and locality for this property (rotating)
-    city_index = (property_index - 1) % len(CITIES_LOCALITIES)
-    city_name, locality_name = CITIES_LOCALITIES[city_index]
+    with log.listing(property_index):
+        # Get city and locality for this property (rotating)
+        city_index = (property_index - 1) % len(CITIES_LOCALITIES)
+        city_name, locality_name = CITIES_LOCALITIES[city_index]
     
-    print(f"\n{'='*50}")
-    print(f"INDUSTRIAL LAND PROPERTY {property_index} - Starting posting flow")
-    print(f"City: {city_name}, Locality: {locality_name}")
-    print(f"{'='*50}")
+        log(f"\n{'='*50}")
+        log(f"INDUSTRIAL LAND PROPERTY {property_index} - Starting posting flow")
+        log(f"City: {city_name}, Locality: {locality_name}")
+        log(f"{'='*50}")
     
-    try:
-        # Fill the first page form
-        fill_first_page(driver)
-        time.sleep(2)
+        try:
+            # Fill the first page form
+            fill_first_page(driver)
+            waits.settled(driver)
 
-        # Fill the plot details page
-        fill_plot_details_page(driver)
-        time.sleep(2)
+            # Fill the plot details page
+            fill_plot_details_page(driver)
+            waits.settled(driver)
 
-        # Fill the location details page
-        fill_location_details_page(driver, city_name, locality_name)
-        time.sleep(2)
+            # Fill the location details page
+            fill_location_details_page(driver, city_name, locality_name)
+            waits.settled(driver)
 
-        # Fill the sale details page
-        fill_sale_details_page(driver)
-        time.sleep(2)
+            # Fill the sale details page
+            fill_sale_details_page(driver)
+            waits.settled(driver)
 
-        # Fill the infrastructure page
-        fill_infrastructure_page(driver)
-        time.sleep(2)
+            # Fill the infrastructure page
+            fill_infrastructure_page(driver)
+            waits.settled(driver)
 
-        # Fill the gallery page
-        fill_gallery_page(driver)
-        time.sleep(2)
+            # Fill the gallery page
+            fill_gallery_page(driver)
+            waits.settled(driver)
 
-        # Fill the schedule page and submit
-        fill_schedule_and_submit(driver)
+            # Fill the schedule page and submit
+            fill_schedule_and_submit(driver)
         
-        print(f"✓ Industrial Land Property {property_index} submitted successfully!")
-        return True
+            log(f"✓ Industrial Land Property {property_index} submitted successfully!")
+            return True
         
-    except Exception as e:
-        print(f"✗ Error posting Industrial Land property {property_index}: {str(e)}")
-        return False
+        except Exception as e:
+            log(f"✗ Error posting Industrial Land property {property_index}: {str(e)}")
+            return False
 
 def main():
     """Main entry point."""
@@ -768,14 +701,14 @@ def main():
     try:
         num_properties = int(input("How many Industrial Land properties do you want to post? Enter a number: "))
         if num_properties <= 0:
-            print("Please enter a positive number.")
+            log("Please enter a positive number.")
             return
     except ValueError:
-        print("Please enter a valid number.")
+        log("Please enter a valid number.")
         return
 
     # Initialize Chrome WebDriver
-    driver = webdriver.Chrome()
+    driver = create_driver()
     driver.maximize_window()
 
     try:
@@ -793,19 +726,19 @@ def main():
                 
                 if success:
                     successful_posts += 1
-                    print(f"✓ Industrial Land Property {i} completed successfully!")
+                    log(f"✓ Industrial Land Property {i} completed successfully!")
                 else:
                     failed_posts += 1
-                    print(f"✗ Industrial Land Property {i} failed!")
+                    log(f"✗ Industrial Land Property {i} failed!")
                 
                 # If not the last property, start a new post
                 if i < num_properties:
-                    print(f"\nStarting Industrial Land property {i+1}...")
+                    log(f"\nStarting Industrial Land property {i+1}...")
                     start_new_post(driver)
                     time.sleep(2)
                     
             except Exception as e:
-                print(f"✗ Error with Industrial Land property {i}: {str(e)}")
+                log(f"✗ Error with Industrial Land property {i}: {str(e)}")
                 failed_posts += 1
                 
                 # If not the last property, try to start a new post
@@ -814,25 +747,26 @@ def main():
                         start_new_post(driver)
                         time.sleep(2)
                     except:
-                        print("Could not start new post. Please check the browser manually.")
+                        log("Could not start new post. Please check the browser manually.")
                         break
 
         # Final summary
-        print(f"\n{'='*60}")
-        print(f"INDUSTRIAL LAND POSTING COMPLETE!")
-        print(f"{'='*60}")
-        print(f"Total properties requested: {num_properties}")
-        print(f"Successfully posted: {successful_posts}")
-        print(f"Failed posts: {failed_posts}")
-        print(f"Success rate: {(successful_posts/num_properties)*100:.1f}%")
-        print(f"{'='*60}")
-
+        log(f"\n{'='*60}")
+        log(f"INDUSTRIAL LAND POSTING COMPLETE!")
+        log(f"{'='*60}")
+        log(f"Total properties requested: {num_properties}")
+        log(f"Successfully posted: {successful_posts}")
+        log(f"Failed posts: {failed_posts}")
+        log(f"Success rate: {(successful_posts/num_properties)*100:.1f}%")
+        log(f"{'='*60}")
+
+        log.flush()
         input("Press Enter to close the browser...")
 
     except Exception as e:
-        print(f"An error occurred: {str(e)}")
+        log(f"An error occurred: {str(e)}")
     finally:
-        driver.quit()
+        release(driver)
 
 if __name__ == "__main__":
     main()
@@ -16,11 +16,19 @@ Usage:
 import time
 import os
 from datetime import datetime
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait, Select
 from selenium.webdriver.support import expected_conditions as EC
 
+from browserwatch import Watchdog
+from drivers import BASE_URL, create_driver, release
+import dom
+import forms
+import waits
+from eventlog import get_logger
+
+log = get_logger("rent")
+
 # Configuration
 PRIMARY_NAME = "Tanish"
 PRIMARY_MOBILE = "9902978675"
@@ -99,7 +107,7 @@ def select_dropdown_by_visible_text(driver, by, locator, text, timeout=20):
 def debug_dropdown_options(driver, dropdown_name):
     """Debug function to print available dropdown options."""
     try:
-        print(f"Debug: Looking for options in {dropdown_name} dropdown...")
+        log(f"Debug: Looking for options in {dropdown_name} dropdown...")
         # Wait a moment for dropdown to fully load
         time.sleep(2)
         
@@ -117,15 +125,15 @@ def debug_dropdown_options(driver, dropdown_name):
             try:
                 options = driver.find_elements(By.XPATH, selector)
                 if options:
-                    print(f"Found {len(options)} options with selector: {selector}")
+                    log(f"Found {len(options)} options with selector: {selector}")
                     for i, option in enumerate(options[:5]):  # Show first 5 options
-                        print(f"  Option {i+1}: '{option.text}'")
+                        log(f"  Option {i+1}: '{option.text}'")
                     break
             except:
                 continue
                 
     except Exception as e:
-        print(f"Debug failed for {dropdown_name}: {str(e)}")
+        log(f"Debug failed for {dropdown_name}: {str(e)}")
 
 def login_and_wait(driver):
     """
@@ -133,15 +141,16 @@ def login_and_wait(driver):
     Once you are logged in and have clicked on 'Post Property' to reach the
     first page form, press Enter in your terminal to continue.
     """
-    driver.get("https://homehni.in")
+    driver.get(BASE_URL)
     input("Please complete the login process, click on 'Post Property', and when you reach the first page form, press Enter here to continue...")
 
+@log.step
 def fill_first_page(driver):
     """Fill the first page form - select city, rent option, and submit.
     More robust with retries, scrolling, and JS clicks to avoid interceptions.
     """
-    print("Starting to fill first page...")
-    print("Note: Name and Mobile are pre-filled automatically")
+    log("Starting to fill first page...")
+    log("Note: Name and Mobile are pre-filled automatically")
 
     def try_fill_once():
         # City dropdown - always select first option in the list
@@ -149,15 +158,14 @@ def fill_first_page(driver):
             city_combobox = WebDriverWait(driver, 10).until(
                 EC.element_to_be_clickable((By.XPATH, "//button[@role='combobox' and contains(., 'Select city')]"))
             )
-            driver.execute_script("arguments[0].scrollIntoView({block:'center'});", city_combobox)
-            driver.execute_script("arguments[0].click();", city_combobox)
+            dom.click(driver, city_combobox)
             time.sleep(1)
             try:
                 first_opt = WebDriverWait(driver, 5).until(
                     EC.element_to_be_clickable((By.XPATH, "(//div[@role='option'] | //li[@role='option'])[1]"))
                 )
                 driver.execute_script("arguments[0].click();", first_opt)
-                print("✓ City selected (first option)")
+                log("✓ City selected (first option)")
             except:
                 # Fallback: type any character and pick first suggestion
                 try:
@@ -171,23 +179,21 @@ def fill_first_page(driver):
                         EC.element_to_be_clickable((By.XPATH, "(//div[@role='option'] | //li[@role='option'])[1]"))
                     )
                     driver.execute_script("arguments[0].click();", first_opt)
-                    print("✓ City selected (typed, first option)")
+                    log("✓ City selected (typed, first option)")
                 except:
-                    print("⚠️  Skipping city selection this attempt")
+                    log("⚠️  Skipping city selection this attempt")
         except Exception as e:
-            print("⚠️  City combobox not ready:", str(e))
+            log("⚠️  City combobox not ready:", str(e))
 
         # Rent button (scoped within the same form section as the submit button)
         try:
             rent_button = WebDriverWait(driver, 10).until(
                 EC.presence_of_element_located((By.XPATH, "//div[.//button[normalize-space()='Start Posting Your Ad For FREE']]//button[normalize-space()='Rent']"))
             )
-            driver.execute_script("arguments[0].scrollIntoView({block:'center'});", rent_button)
-            time.sleep(0.3)
-            driver.execute_script("arguments[0].click();", rent_button)
-            print("✓ Rent button clicked")
+            dom.click(driver, rent_button)
+            log("✓ Rent button clicked")
         except Exception as e:
-            print("✗ Could not click Rent:", str(e))
+            log("✗ Could not click Rent:", str(e))
 
         # Submit button: wait until enabled (no disabled attribute), then click
         try:
@@ -196,45 +202,39 @@ def fill_first_page(driver):
             )
             # wait until button is enabled
             WebDriverWait(driver, 10).until(lambda d: submit_button.get_attribute('disabled') is None)
-            driver.execute_script("arguments[0].scrollIntoView({block:'center'});", submit_button)
-            time.sleep(0.3)
-            driver.execute_script("arguments[0].click();", submit_button)
-            print("✓ Submit button clicked - proceeding to next page")
+            dom.click(driver, submit_button)
+            log("✓ Submit button clicked - proceeding to next page")
             return True
         except Exception as e:
-            print("✗ Could not click Submit:", str(e))
+            log("✗ Could not click Submit:", str(e))
             return False
 
     # Try once; if fail, reload post page and retry once
     success = try_fill_once()
     if not success:
         try:
-            driver.get("https://homehni.in/post-property")
+            driver.get(f"{BASE_URL}/post-property")
             WebDriverWait(driver, 15).until(
                 EC.presence_of_element_located((By.XPATH, "//button[@role='combobox' and contains(., 'Select city')] | //button[contains(., 'Start Posting Your Ad For FREE')]"))
             )
-            print("↻ Retrying first page after reload...")
+            log("↻ Retrying first page after reload...")
             try_fill_once()
         except Exception:
             pass
 
+@log.step
 def fill_property_details(driver, property_name: str):
     """Fill the property details page form."""
-    print("Starting to fill property details page...")
+    log("Starting to fill property details page...")
     
-    # Property Name
-    try:
-        wait_and_send_keys(driver, By.XPATH, "//input[@placeholder='Enter Property Name']", property_name)
-        print("✓ Property Name filled:", property_name)
-    except Exception as e:
-        print("✗ Could not find Property Name field:", str(e))
-
-    # Built Up Area - number input field
+    # Property Name and Built Up Area - only retyped when they differ (resumed pages)
     try:
-        wait_and_send_keys(driver, By.XPATH, "//input[@type='number' and @name='superBuiltUpArea']", BUILT_UP_AREA)
-        print("✓ Built Up Area filled:", BUILT_UP_AREA)
+        forms.fill_fields(driver, {
+            "Property Name": ("//input[@placeholder='Enter Property Name']", property_name),
+            "Built Up Area": ("//input[@type='number' and @name='superBuiltUpArea']", BUILT_UP_AREA),
+        })
     except Exception as e:
-        print("✗ Could not find Built Up Area field:", str(e))
+        log("✗ Could not fill property details fields:", str(e))
 
     # Dropdowns on this page can vary in text after first selection. To be robust,
     # always pick the first option from each visible combobox on the page in order.
@@ -244,37 +244,37 @@ def fill_property_details(driver, property_name: str):
         time.sleep(0.3)
         # Collect visible combobox buttons on the page step
         comboboxes = WebDriverWait(driver, 10).until(
-            lambda d: [el for el in d.find_elements(By.XPATH, "//button[@role='combobox']") if el.is_displayed()]
+            lambda d: dom.visible(d, "//button[@role='combobox']")
         )
         # We expect at least 4: Property Type, BHK Type, Property Age, Facing
         for idx, cb in enumerate(comboboxes[:4], start=1):
             try:
-                driver.execute_script("arguments[0].scrollIntoView({block:'center'});", cb)
-                time.sleep(0.2)
-                driver.execute_script("arguments[0].click();", cb)
+                dom.click(driver, cb)
                 first_option = WebDriverWait(driver, 5).until(
                     EC.element_to_be_clickable((By.XPATH, "//div[@role='option'][1]"))
                 )
                 driver.execute_script("arguments[0].click();", first_option)
-                print(f"✓ Combobox {idx} selected (first option)")
+                log(f"✓ Combobox {idx} selected (first option)")
                 time.sleep(0.2)
             except Exception as inner_e:
-                print(f"⚠️  Combobox {idx} selection failed:", str(inner_e))
+                log(f"⚠️  Combobox {idx} selection failed:", str(inner_e))
                 driver.execute_script("document.body.click();")
                 time.sleep(0.2)
     except Exception as e:
-        print("✗ Could not process combobox selections:", str(e))
+        log("✗ Could not process combobox selections:", str(e))
 
     # Click Save & Continue button
     try:
-        wait_and_click(driver, By.XPATH, "//button[contains(text(), 'Save & Continue')]")
-        print("✓ Save & Continue button clicked - proceeding to next page")
+        with waits.acknowledged(driver, "Save & Continue"):
+            wait_and_click(driver, By.XPATH, "//button[contains(text(), 'Save & Continue')]")
+        log("✓ Save & Continue button clicked - proceeding to next page")
     except Exception as e:
-        print("✗ Could not find Save & Continue button:", str(e))
+        log("✗ Could not find Save & Continue button:", str(e))
 
+@log.step
 def fill_locality_details(driver, property_index: int):
     """Fill the locality details page form with rotating city/locality."""
-    print("Starting to fill locality details page...")
+    log("Starting to fill locality details page...")
     # Determine pair by rotation
     pair = CITY_LOCALITY_ROTATION[(property_index - 1) % len(CITY_LOCALITY_ROTATION)]
     city_to_use, locality_to_use = pair
@@ -294,11 +294,11 @@ def fill_locality_details(driver, property_index: int):
                 EC.element_to_be_clickable((By.XPATH, "//div[contains(@class, 'pac-item')][1]"))
             )
             driver.execute_script("arguments[0].click();", first_suggestion)
-            print("✓ City selected:", city_to_use)
+            log("✓ City selected:", city_to_use)
         except:
-            print("⚠️  City suggestion not found, but text entered:", city_to_use)
+            log("⚠️  City suggestion not found, but text entered:", city_to_use)
     except Exception as e:
-        print("✗ Could not find City field:", str(e))
+        log("✗ Could not find City field:", str(e))
 
     # Locality/Area field - Google Places autocomplete
     try:
@@ -315,25 +315,27 @@ def fill_locality_details(driver, property_index: int):
                 EC.element_to_be_clickable((By.XPATH, "//div[contains(@class, 'pac-item')][1]"))
             )
             driver.execute_script("arguments[0].click();", first_suggestion)
-            print("✓ Locality selected:", locality_to_use)
+            log("✓ Locality selected:", locality_to_use)
         except:
-            print("⚠️  Locality suggestion not found, but text entered:", locality_to_use)
+            log("⚠️  Locality suggestion not found, but text entered:", locality_to_use)
     except Exception as e:
-        print("✗ Could not find Locality field:", str(e))
+        log("✗ Could not find Locality field:", str(e))
 
     # Landmark field - leave empty as it's optional
-    print("✓ Landmark field skipped (optional)")
+    log("✓ Landmark field skipped (optional)")
 
     # Click Save & Continue button
     try:
-        wait_and_click(driver, By.XPATH, "//button[contains(text(), 'Save & Continue')]")
-        print("✓ Save & Continue button clicked - proceeding to next page")
+        with waits.acknowledged(driver, "Save & Continue"):
+            wait_and_click(driver, By.XPATH, "//button[contains(text(), 'Save & Continue')]")
+        log("✓ Save & Continue button clicked - proceeding to next page")
     except Exception as e:
-        print("✗ Could not find Save & Continue button:", str(e))
+        log("✗ Could not find Save & Continue button:", str(e))
 
+@log.step
 def fill_rental_details(driver):
     """Fill the rental details page form."""
-    print("Starting to fill rental details page...")
+    log("Starting to fill rental details page...")
     
     # Expected Rent
     try:
@@ -342,9 +344,9 @@ def fill_rental_details(driver):
         )
         rent_input.clear()
         rent_input.send_keys(EXPECTED_RENT)
-        print("✓ Expected Rent filled:", EXPECTED_RENT)
+        log("✓ Expected Rent filled:", EXPECTED_RENT)
     except Exception as e:
-        print("✗ Could not find Expected Rent field:", str(e))
+        log("✗ Could not find Expected Rent field:", str(e))
 
     # Expected Deposit
     try:
@@ -353,9 +355,9 @@ def fill_rental_details(driver):
         )
         deposit_input.clear()
         deposit_input.send_keys(EXPECTED_DEPOSIT)
-        print("✓ Expected Deposit filled:", EXPECTED_DEPOSIT)
+        log("✓ Expected Deposit filled:", EXPECTED_DEPOSIT)
     except Exception as e:
-        print("✗ Could not find Expected Deposit field:", str(e))
+        log("✗ Could not find Expected Deposit field:", str(e))
 
     # Monthly Maintenance dropdown - select first option
     try:
@@ -369,9 +371,9 @@ def fill_rental_details(driver):
             EC.element_to_be_clickable((By.XPATH, "//div[@role='option'][1]"))
         )
         driver.execute_script("arguments[0].click();", first_option)
-        print("✓ Monthly Maintenance selected (first option)")
+        log("✓ Monthly Maintenance selected (first option)")
     except Exception as e:
-        print("✗ Could not find Monthly Maintenance dropdown:", str(e))
+        log("✗ Could not find Monthly Maintenance dropdown:", str(e))
 
     # Available From date picker - select first available date
     try:
@@ -388,7 +390,7 @@ def fill_rental_details(driver):
                 EC.element_to_be_clickable((By.XPATH, "//button[contains(@class, 'day')][1]"))
             )
             driver.execute_script("arguments[0].click();", first_date)
-            print("✓ Available From date selected (first available)")
+            log("✓ Available From date selected (first available)")
         except:
             # Try alternative selector for date buttons
             try:
@@ -396,11 +398,11 @@ def fill_rental_details(driver):
                     EC.element_to_be_clickable((By.XPATH, "//button[contains(text(), '1') or contains(text(), '2') or contains(text(), '3')][1]"))
                 )
                 driver.execute_script("arguments[0].click();", first_date)
-                print("✓ Available From date selected (first available)")
+                log("✓ Available From date selected (first available)")
             except:
-                print("⚠️  Could not select specific date, but date picker opened")
+                log("⚠️  Could not select specific date, but date picker opened")
     except Exception as e:
-        print("✗ Could not find Available From date picker:", str(e))
+        log("✗ Could not find Available From date picker:", str(e))
 
     # Preferred Tenants checkbox
     try:
@@ -408,9 +410,9 @@ def fill_rental_details(driver):
             EC.element_to_be_clickable((By.XPATH, f"//button[@role='checkbox' and @id='{PREFERRED_TENANTS}']"))
         )
         driver.execute_script("arguments[0].click();", tenant_checkbox)
-        print("✓ Preferred Tenants selected:", PREFERRED_TENANTS)
+        log("✓ Preferred Tenants selected:", PREFERRED_TENANTS)
     except Exception as e:
-        print("✗ Could not find Preferred Tenants checkbox:", str(e))
+        log("✗ Could not find Preferred Tenants checkbox:", str(e))
 
     # Furnishing dropdown - select first option
     try:
@@ -424,9 +426,9 @@ def fill_rental_details(driver):
             EC.element_to_be_clickable((By.XPATH, "//div[@role='option'][1]"))
         )
         driver.execute_script("arguments[0].click();", first_option)
-        print("✓ Furnishing selected (first option)")
+        log("✓ Furnishing selected (first option)")
     except Exception as e:
-        print("✗ Could not find Furnishing dropdown:", str(e))
+        log("✗ Could not find Furnishing dropdown:", str(e))
 
     # Parking dropdown - select first option
     try:
@@ -440,20 +442,22 @@ def fill_rental_details(driver):
             EC.element_to_be_clickable((By.XPATH, "//div[@role='option'][1]"))
         )
         driver.execute_script("arguments[0].click();", first_option)
-        print("✓ Parking selected (first option)")
+        log("✓ Parking selected (first option)")
     except Exception as e:
-        print("✗ Could not find Parking dropdown:", str(e))
+        log("✗ Could not find Parking dropdown:", str(e))
 
     # Click Save & Continue button
     try:
-        wait_and_click(driver, By.XPATH, "//button[contains(text(), 'Save & Continue')]")
-        print("✓ Save & Continue button clicked - proceeding to next page")
+        with waits.acknowledged(driver, "Save & Continue"):
+            wait_and_click(driver, By.XPATH, "//button[contains(text(), 'Save & Continue')]")
+        log("✓ Save & Continue button clicked - proceeding to next page")
     except Exception as e:
-        print("✗ Could not find Save & Continue button:", str(e))
+        log("✗ Could not find Save & Continue button:", str(e))
 
+@log.step
 def fill_amenities(driver):
     """Fill the amenities page form."""
-    print("Starting to fill amenities page...")
+    log("Starting to fill amenities page...")
     
     # Bathrooms and Balconies - find all plus buttons and click them in order
     try:
@@ -461,21 +465,12 @@ def fill_amenities(driver):
         plus_buttons = driver.find_elements(By.XPATH, "//button[.//svg[contains(@class, 'lucide-plus')]]")
         
         if len(plus_buttons) >= 2:
-            # Click first plus button twice (Bathrooms)
-            for i in range(BATHROOMS_COUNT):
-                driver.execute_script("arguments[0].click();", plus_buttons[0])
-                time.sleep(0.5)
-            print(f"✓ Bathrooms set to {BATHROOMS_COUNT}")
-            
-            # Click second plus button twice (Balconies)
-            for i in range(BALCONIES_COUNT):
-                driver.execute_script("arguments[0].click();", plus_buttons[1])
-                time.sleep(0.5)
-            print(f"✓ Balconies set to {BALCONIES_COUNT}")
+            forms.set_stepper(driver, plus_buttons[0], BATHROOMS_COUNT, "Bathrooms")
+            forms.set_stepper(driver, plus_buttons[1], BALCONIES_COUNT, "Balconies")
         else:
-            print("⚠️  Could not find enough plus buttons for bathrooms/balconies")
+            log("⚠️  Could not find enough plus buttons for bathrooms/balconies")
     except Exception as e:
-        print("✗ Could not find plus buttons:", str(e))
+        log("✗ Could not find plus buttons:", str(e))
 
     # Water Supply dropdown - select first option
     try:
@@ -489,9 +484,9 @@ def fill_amenities(driver):
             EC.element_to_be_clickable((By.XPATH, "//div[@role='option'][1]"))
         )
         driver.execute_script("arguments[0].click();", first_option)
-        print("✓ Water Supply selected (first option)")
+        log("✓ Water Supply selected (first option)")
     except Exception as e:
-        print("✗ Could not find Water Supply dropdown:", str(e))
+        log("✗ Could not find Water Supply dropdown:", str(e))
 
     # Pet Allowed - select Yes
     try:
@@ -499,9 +494,9 @@ def fill_amenities(driver):
             EC.element_to_be_clickable((By.XPATH, "//button[contains(text(), 'Yes') and contains(@class, 'border')]"))
         )
         driver.execute_script("arguments[0].click();", pet_yes_button)
-        print("✓ Pet Allowed selected: Yes")
+        log("✓ Pet Allowed selected: Yes")
     except Exception as e:
-        print("✗ Could not find Pet Allowed Yes button:", str(e))
+        log("✗ Could not find Pet Allowed Yes button:", str(e))
 
     # Gym - select Yes
     try:
@@ -509,9 +504,9 @@ def fill_amenities(driver):
             EC.element_to_be_clickable((By.XPATH, "//button[contains(text(), 'Yes') and contains(@class, 'border')]"))
         )
         driver.execute_script("arguments[0].click();", gym_yes_button)
-        print("✓ Gym selected: Yes")
+        log("✓ Gym selected: Yes")
     except Exception as e:
-        print("✗ Could not find Gym Yes button:", str(e))
+        log("✗ Could not find Gym Yes button:", str(e))
 
     # Non-Veg Allowed - select Yes
     try:
@@ -519,9 +514,9 @@ def fill_amenities(driver):
             EC.element_to_be_clickable((By.XPATH, "//button[contains(text(), 'Yes') and contains(@class, 'border')]"))
         )
         driver.execute_script("arguments[0].click();", non_veg_yes_button)
-        print("✓ Non-Veg Allowed selected: Yes")
+        log("✓ Non-Veg Allowed selected: Yes")
     except Exception as e:
-        print("✗ Could not find Non-Veg Allowed Yes button:", str(e))
+        log("✗ Could not find Non-Veg Allowed Yes button:", str(e))
 
     # Gated Security - select Yes
     try:
@@ -529,9 +524,9 @@ def fill_amenities(driver):
             EC.element_to_be_clickable((By.XPATH, "//button[contains(text(), 'Yes') and contains(@class, 'border')]"))
         )
         driver.execute_script("arguments[0].click();", security_yes_button)
-        print("✓ Gated Security selected: Yes")
+        log("✓ Gated Security selected: Yes")
     except Exception as e:
-        print("✗ Could not find Gated Security Yes button:", str(e))
+        log("✗ Could not find Gated Security Yes button:", str(e))
 
     # Who will show the property dropdown - select first option
     try:
@@ -545,9 +540,9 @@ def fill_amenities(driver):
             EC.element_to_be_clickable((By.XPATH, "//div[@role='option'][1]"))
         )
         driver.execute_script("arguments[0].click();", first_option)
-        print("✓ Who will show property selected (first option)")
+        log("✓ Who will show property selected (first option)")
     except Exception as e:
-        print("✗ Could not find Who will show property dropdown:", str(e))
+        log("✗ Could not find Who will show property dropdown:", str(e))
 
     # Current Property Condition dropdown - select first option
     try:
@@ -561,20 +556,21 @@ def fill_amenities(driver):
             EC.element_to_be_clickable((By.XPATH, "//div[@role='option'][1]"))
         )
         driver.execute_script("arguments[0].click();", first_option)
-        print("✓ Property Condition selected (first option)")
+        log("✓ Property Condition selected (first option)")
     except Exception as e:
-        print("✗ Could not find Property Condition dropdown:", str(e))
+        log("✗ Could not find Property Condition dropdown:", str(e))
 
     # Directions tip textarea
     try:
         directions_textarea = WebDriverWait(driver, 20).until(
             EC.element_to_be_clickable((By.XPATH, "//textarea[@name='directionsTip']"))
         )
-        directions_textarea.clear()
-        directions_textarea.send_keys(DIRECTIONS_TIP)
-        print("✓ Directions tip filled:", DIRECTIONS_TIP)
+        if forms.set_text(driver, directions_textarea, DIRECTIONS_TIP):
+            log("✓ Directions tip filled:", DIRECTIONS_TIP)
+        else:
+            log("✗ Directions tip does not hold the text")
     except Exception as e:
-        print("✗ Could not find Directions tip textarea:", str(e))
+        log("✗ Could not find Directions tip textarea:", str(e))
 
     # Select available amenities checkboxes
     for amenity in SELECTED_AMENITIES:
@@ -583,20 +579,22 @@ def fill_amenities(driver):
                 EC.element_to_be_clickable((By.XPATH, f"//button[@role='checkbox' and following-sibling::label[contains(text(), '{amenity}')]]"))
             )
             driver.execute_script("arguments[0].click();", amenity_checkbox)
-            print(f"✓ {amenity} selected")
+            log(f"✓ {amenity} selected")
         except Exception as e:
-            print(f"✗ Could not find {amenity} checkbox:", str(e))
+            log(f"✗ Could not find {amenity} checkbox:", str(e))
 
     # Click Save & Continue button
     try:
-        wait_and_click(driver, By.XPATH, "//button[contains(text(), 'Save & Continue')]")
-        print("✓ Save & Continue button clicked - proceeding to next page")
+        with waits.acknowledged(driver, "Save & Continue"):
+            wait_and_click(driver, By.XPATH, "//button[contains(text(), 'Save & Continue')]")
+        log("✓ Save & Continue button clicked - proceeding to next page")
     except Exception as e:
-        print("✗ Could not find Save & Continue button:", str(e))
+        log("✗ Could not find Save & Continue button:", str(e))
 
+@log.step
 def fill_gallery(driver):
     """Fill the gallery page by uploading images to all categories."""
-    print("Starting to fill gallery page...")
+    log("Starting to fill gallery page...")
     
     # Get absolute path to the image file
     current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -604,11 +602,11 @@ def fill_gallery(driver):
     
     # Check if image exists
     if not os.path.exists(image_absolute_path):
-        print(f"✗ Image file not found: {image_absolute_path}")
-        print("⚠️  Skipping gallery upload")
+        log(f"✗ Image file not found: {image_absolute_path}")
+        log("⚠️  Skipping gallery upload")
         return
     
-    print(f"✓ Found image file: {image_absolute_path}")
+    log(f"✓ Found image file: {image_absolute_path}")
     
     # Upload image to each category
     for i, category in enumerate(GALLERY_CATEGORIES):
@@ -628,27 +626,28 @@ def fill_gallery(driver):
                 file_input.send_keys(image_absolute_path)
                 time.sleep(1)
                 
-                print(f"✓ Uploaded image to {category}")
+                log(f"✓ Uploaded image to {category}")
             else:
-                print(f"✗ Could not find file input for {category} (position {i})")
+                log(f"✗ Could not find file input for {category} (position {i})")
                 
         except Exception as e:
-            print(f"✗ Could not upload image to {category}:", str(e))
+            log(f"✗ Could not upload image to {category}:", str(e))
     
     # Click Save & Continue button
     try:
-        time.sleep(2)  # Wait a bit for uploads to process
-        wait_and_click(driver, By.XPATH, "//button[contains(text(), 'Save & Continue')]")
-        print("✓ Save & Continue button clicked - proceeding to next page")
+        waits.settled(driver)  # Let the uploads finish
+        with waits.acknowledged(driver, "Save & Continue"):
+            wait_and_click(driver, By.XPATH, "//button[contains(text(), 'Save & Continue')]")
+        log("✓ Save & Continue button clicked - proceeding to next page")
     except Exception as e:
-        print("✗ Could not find Save & Continue button:", str(e))
+        log("✗ Could not find Save & Continue button:", str(e))
     
     # Upload property video if section is present
     try:
         current_dir = os.path.dirname(os.path.abspath(__file__))
         video_abs = os.path.join(current_dir, VIDEO_PATH)
         if not os.path.exists(video_abs):
-            print(f"⚠️  Video file not found: {video_abs} — skipping video upload")
+            log(f"⚠️  Video file not found: {video_abs} — skipping video upload")
         else:
             # Find a video input near the Upload Property Video section
             # Many UIs use a hidden <input type="file" accept="video/*">
@@ -669,36 +668,39 @@ def fill_gallery(driver):
                 driver.execute_script("arguments[0].scrollIntoView(true);", video_input)
                 time.sleep(0.5)
                 video_input.send_keys(video_abs)
-                print("✓ Uploaded property video")
+                log("✓ Uploaded property video")
                 time.sleep(1.5)
             else:
-                print("⚠️  Could not locate video upload input — skipping")
+                log("⚠️  Could not locate video upload input — skipping")
     except Exception as e:
-        print("✗ Video upload failed:", str(e))
+        log("✗ Video upload failed:", str(e))
 
+@log.step
 def fill_schedule_and_submit(driver):
     """On Schedule page, click Submit Property, then open post-property to start next."""
-    print("Starting to submit property on Schedule page...")
+    log("Starting to submit property on Schedule page...")
     try:
         submit_btn = WebDriverWait(driver, 20).until(
             EC.element_to_be_clickable((By.XPATH, "//button[normalize-space()='Submit Property']"))
         )
-        driver.execute_script("arguments[0].click();", submit_btn)
-        print("✓ Submit Property clicked")
+        with waits.acknowledged(driver, "Submit Property", submit=True):
+            driver.execute_script("arguments[0].click();", submit_btn)
+        log("✓ Submit Property clicked")
     except Exception as e:
-        print("✗ Could not click Submit Property:", str(e))
+        log("✗ Could not click Submit Property:", str(e))
         return
 
     # Directly navigate to new post page for next property
     try:
-        driver.get("https://homehni.in/post-property")
+        driver.get(f"{BASE_URL}/post-property")
         WebDriverWait(driver, 20).until(
             EC.presence_of_element_located((By.XPATH, "//button[@role='combobox' and contains(., 'Select city')] | //button[normalize-space()='Start Posting Your Ad For FREE']"))
         )
-        print("✓ Ready for next property (post-property page loaded)")
+        log("✓ Ready for next property (post-property page loaded)")
     except Exception as e:
-        print("✗ Could not open post-property for next property:", str(e))
+        log("✗ Could not open post-property for next property:", str(e))
 
+@log.step
 def start_new_post(driver):
     """From the dashboard, navigate directly to the post property page."""
     try:
@@ -706,41 +708,42 @@ def start_new_post(driver):
     except:
         pass
     try:
-        driver.get("https://homehni.in/post-property")
+        driver.get(f"{BASE_URL}/post-property")
         WebDriverWait(driver, 20).until(
             EC.presence_of_element_located((By.XPATH, "//button[contains(text(), 'Start Posting Your Ad For FREE')] | //button[@role='combobox' and contains(., 'Select city')]"))
         )
-        print("✓ Navigated to post-property page")
+        log("✓ Navigated to post-property page")
     except Exception as e:
-        print("✗ Could not navigate to post-property page:", str(e))
+        log("✗ Could not navigate to post-property page:", str(e))
 
 def run_full_post_flow(driver, property_index: int):
     """Run the entire flow to post a single property."""
-    # First page
-    fill_first_page(driver)
-    time.sleep(2)
-    # Property details
-    property_name = f"Test Property {property_index}"
-    fill_property_details(driver, property_name)
-    time.sleep(2)
-    # Locality (rotating city/locality per property)
-    fill_locality_details(driver, property_index)
-    time.sleep(2)
-    # Rental
-    fill_rental_details(driver)
-    time.sleep(2)
-    # Amenities
-    fill_amenities(driver)
-    time.sleep(2)
-    # Gallery
-    fill_gallery(driver)
-    time.sleep(2)
-    # Schedule -> Submit
-    fill_schedule_and_submit(driver)
+    with log.listing(property_index):
+        # First page
+        fill_first_page(driver)
+        waits.settled(driver)
+        # Property details
+        property_name = f"Test Property {property_index}"
+        fill_property_details(driver, property_name)
+        waits.settled(driver)
+        # Locality (rotating city/locality per property)
+        fill_locality_details(driver, property_index)
+        waits.settled(driver)
+        # Rental
+        fill_rental_details(driver)
+        waits.settled(driver)
+        # Amenities
+        fill_amenities(driver)
+        waits.settled(driver)
+        # Gallery
+        fill_gallery(driver)
+        waits.settled(driver)
+        # Schedule -> Submit
+        fill_schedule_and_submit(driver)
 
 def main():
     """Main entry point."""
-    driver = webdriver.Chrome()
+    driver = create_driver()
     driver.maximize_window()
     try:
         login_and_wait(driver)
@@ -751,28 +754,32 @@ def main():
                 count_str = input("How many properties should be posted? Enter a number: ").strip()
                 num_properties = int(count_str)
                 if num_properties <= 0:
-                    print("Please enter a positive number.")
+                    log("Please enter a positive number.")
                     continue
                 break
             except ValueError:
-                print("Invalid number. Try again.")
+                log("Invalid number. Try again.")
         
+        watch = Watchdog(landing_url=f"{BASE_URL}/post-property")
         for i in range(1, num_properties + 1):
-            print(f"— Posting property {i} of {num_properties} —")
+            log(f"— Posting property {i} of {num_properties} —")
             run_full_post_flow(driver, i)
             
             if i < num_properties:
                 # Back on dashboard, start a new post
                 start_new_post(driver)
+                # Fresh tab/browser every N listings or when memory runs high
+                driver = watch.check(driver)
                 # Wait for first page to load
                 time.sleep(2)
         
-        print("All properties posted.")
+        log("All properties posted.")
+        log.flush()
         input("Press Enter to close the browser...")
     except Exception as e:
-        print(f"An error occurred: {str(e)}")
+        log(f"An error occurred: {str(e)}")
     finally:
-        driver.quit()
+        release(driver)
 
 if __name__ == "__main__":
     main()
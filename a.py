@@ -43,6 +43,13 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait, Select
 from selenium.webdriver.support import expected_conditions as EC
 
+from drivers import BASE_URL, create_driver, release
+import eventlog
+import forms
+from eventlog import get_logger
+
+log = get_logger("stress_rent")
+
 # -----------------------------------------------------------------------------
 # Configuration
 # -----------------------------------------------------------------------------
@@ -77,7 +84,9 @@ PREFERRED_TENANT = "Company"  # choose one: Anyone, Family, Bachelor Female, Bac
 FURNISHING = "Unfurnished"     # or Semi Furnished, Fully Furnished
 PARKING = "Car + Bike Parking"  # options: Car Parking, Bike Parking, Car + Bike Parking, No Parking
 
-# Amenities – set these to True to enable
+# Amenities – counters, then set these to True to enable
+BATHROOMS = 1
+BALCONIES = 1
 AMENITIES = {
     "Pet Allowed": True,
     "Non-Veg Allowed": True,
@@ -116,72 +125,58 @@ def login_and_wait(driver: webdriver):
     Once you are logged in and have clicked on 'Post Property' to reach the
     first page form, press Enter in your terminal to continue.
     """
-    driver.get("https://homehni.in")
+    driver.get(BASE_URL)
     input("Please complete the login process, click on 'Post Property', and when you reach the first page form, press Enter here to continue...")
 
+@log.step
 def fill_first_page(driver: webdriver):
     """Fill the initial page (name, mobile, city, and property type)."""
-    print("Starting to fill first page...")
+    log("Starting to fill first page...")
     
-    # Name field - try multiple possible selectors
-    try:
-        wait_and_send_keys(driver, By.XPATH, "//input[contains(@placeholder, 'Name')]", PRIMARY_NAME)
-        print("✓ Name field filled")
-    except:
-        try:
-            wait_and_send_keys(driver, By.XPATH, "//input[@type='text' and contains(@placeholder, 'Name')]", PRIMARY_NAME)
-            print("✓ Name field filled (alternative selector)")
-        except:
-            print("✗ Could not find Name field")
-
-    # Mobile number field - try multiple possible selectors
-    try:
-        wait_and_send_keys(driver, By.XPATH, "//input[contains(@placeholder, 'Mobile')]", PRIMARY_MOBILE)
-        print("✓ Mobile field filled")
-    except:
-        try:
-            wait_and_send_keys(driver, By.XPATH, "//input[@type='tel']", PRIMARY_MOBILE)
-            print("✓ Mobile field filled (alternative selector)")
-        except:
-            print("✗ Could not find Mobile field")
+    # Name and Mobile are usually pre-filled from the account; only retype on mismatch
+    forms.fill_fields(driver, {
+        "Name": ("//input[contains(@placeholder, 'Name')] | //input[@type='text' and contains(@placeholder, 'Name')]", PRIMARY_NAME),
+        "Mobile": ("//input[contains(@placeholder, 'Mobile')] | //input[@type='tel']", PRIMARY_MOBILE),
+    })
 
     # City dropdown - try multiple approaches
     try:
         wait_and_click(driver, By.XPATH, "//input[contains(@placeholder, 'City')]")
         time.sleep(1)  # Wait for dropdown to appear
         wait_and_click(driver, By.XPATH, f"//li[contains(text(), '{CITY_OPTION}')]")
-        print("✓ City selected")
+        log("✓ City selected")
     except:
         try:
             wait_and_click(driver, By.XPATH, "//div[contains(@class, 'city') or contains(@class, 'dropdown')]")
             time.sleep(1)
             wait_and_click(driver, By.XPATH, f"//li[contains(text(), '{CITY_OPTION}')]")
-            print("✓ City selected (alternative selector)")
+            log("✓ City selected (alternative selector)")
         except:
-            print("✗ Could not find City dropdown")
+            log("✗ Could not find City dropdown")
 
     # Choose property ad type (Rent) - try multiple approaches
     try:
         wait_and_click(driver, By.XPATH, "//button[contains(text(), 'Rent')]")
-        print("✓ Rent button clicked")
+        log("✓ Rent button clicked")
     except:
         try:
             wait_and_click(driver, By.XPATH, "//label[contains(text(), 'Rent')]")
-            print("✓ Rent option selected (alternative selector)")
+            log("✓ Rent option selected (alternative selector)")
         except:
-            print("✗ Could not find Rent button")
+            log("✗ Could not find Rent button")
 
     # Click the submit button - try multiple approaches
     try:
         wait_and_click(driver, By.XPATH, "//button[contains(text(), 'Start Posting Your Ad For FREE')]")
-        print("✓ Submit button clicked")
+        log("✓ Submit button clicked")
     except:
         try:
             wait_and_click(driver, By.XPATH, "//button[contains(text(), 'Start Posting')]")
-            print("✓ Submit button clicked (alternative selector)")
+            log("✓ Submit button clicked (alternative selector)")
         except:
-            print("✗ Could not find Submit button")
+            log("✗ Could not find Submit button")
 
+@log.step
 def fill_property_details(driver: webdriver):
     """Fill out the property details page."""
     wait_and_send_keys(driver, By.XPATH, "//input[contains(@placeholder, 'Property Name') or contains(@name, 'propertyName')]", PROPERTY_TITLE)
@@ -209,6 +204,7 @@ def fill_property_details(driver: webdriver):
     # Save and continue
     wait_and_click(driver, By.XPATH, "//button[contains(., 'Save') and contains(., 'Continue')]")
 
+@log.step
 def fill_location_details(driver: webdriver):
     """Fill the locality/city page."""
     # City (Google Places auto-suggest) – type city name and select first match
@@ -235,6 +231,7 @@ def fill_location_details(driver: webdriver):
     # Save and continue
     wait_and_click(driver, By.XPATH, "//button[contains(., 'Save') and contains(., 'Continue')]")
 
+@log.step
 def fill_rental_details(driver: webdriver):
     """Fill in expected rent, deposit, maintenance, etc."""
     wait_and_send_keys(driver, By.XPATH, "//input[contains(@placeholder, 'Enter Amount')][1]", EXPECTED_RENT)
@@ -279,12 +276,14 @@ def fill_rental_details(driver: webdriver):
     # Save and continue
     wait_and_click(driver, By.XPATH, "//button[contains(., 'Save') and contains(., 'Continue')]")
 
+@log.step
 def fill_amenities(driver: webdriver):
     """Set the various amenity options."""
-    # Set bathroom and balcony counts to 1 each
-    # Click the plus buttons once for each
-    wait_and_click(driver, By.XPATH, "(//button[.='+'])[1]")  # bathroom
-    wait_and_click(driver, By.XPATH, "(//button[.='+'])[2]")  # balcony
+    # Set bathroom and balcony counts
+    WebDriverWait(driver, 20).until(EC.element_to_be_clickable((By.XPATH, "(//button[.='+'])[2]")))
+    plus_buttons = driver.find_elements(By.XPATH, "//button[.='+']")
+    forms.set_stepper(driver, plus_buttons[0], BATHROOMS, "Bathrooms")
+    forms.set_stepper(driver, plus_buttons[1], BALCONIES, "Balconies")
 
     # Water supply
     supply_select = Select(
@@ -331,6 +330,7 @@ def fill_amenities(driver: webdriver):
     # Save and continue
     wait_and_click(driver, By.XPATH, "//button[contains(., 'Save') and contains(., 'Continue')]")
 
+@log.step
 def upload_gallery_images(driver: webdriver):
     """
     Upload a single image for the property gallery.  The file path points to an
@@ -347,6 +347,7 @@ def upload_gallery_images(driver: webdriver):
     # Click save and continue
     wait_and_click(driver, By.XPATH, "//button[contains(., 'Save') and contains(., 'Continue')]")
 
+@log.step
 def finalize_submission(driver: webdriver):
     """Click through the final screens (schedule/preview) and return to dashboard."""
     # Depending on the site flow, there may be a schedule step.  If present,
@@ -358,6 +359,8 @@ def finalize_submission(driver: webdriver):
 
     # On the preview/congratulations page, click the Go to Dashboard button
     wait_and_click(driver, By.XPATH, "//button[contains(., 'Dashboard')]")
+    # Only a submitted property gets the congratulations page
+    eventlog.mark_submitted(label="Go to Dashboard")
 
 def post_property(driver: webdriver):
     """Run through the entire workflow to post a single property."""
@@ -369,21 +372,26 @@ def post_property(driver: webdriver):
     upload_gallery_images(driver)
     finalize_submission(driver)
 
+def run_full_post_flow(driver: webdriver, property_index: int):
+    """Post one property; same entry point as the other posting flows."""
+    with log.listing(property_index):
+        post_property(driver)
+
 def main():
     """Main entry point."""
     # Initialize the WebDriver (use the appropriate driver for your browser)
-    driver = webdriver.Chrome()
+    driver = create_driver()
     driver.maximize_window()
     try:
         login_and_wait(driver)
-        for i in range(ITERATIONS):
-            print(f"Starting listing {i+1}/{ITERATIONS}…")
-            post_property(driver)
+        for i in range(1, ITERATIONS + 1):
+            log(f"Starting listing {i}/{ITERATIONS}…")
+            run_full_post_flow(driver, i)
             # Add a short delay between postings to simulate human behaviour and
             # allow the site to process the previous submission
             time.sleep(2)
     finally:
-        driver.quit()
+        release(driver)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -15,20 +15,28 @@ Usage:
 """
 
 import time
-import random
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
+from drivers import BASE_URL, create_driver, release
+import dom
+import options
+import waits
+from eventlog import get_logger
+
+log = get_logger("architect")
+
 # Configuration
+SERVICE_TAB = "Architects"  # tab on the Services page that shows this form
+FORM_FIELD_ID = "arch-phone"
 PHONE_NUMBER = "9902978675"
 PROJECT_LOCATION = "Bengaluru"
 
 
 def wait_for_user_on_architect_form(driver):
     """Open home page and let the user log in and navigate to the Architect Services form."""
-    driver.get("https://homehni.in/")
+    driver.get(f"{BASE_URL}/")
     input(
         "Please log in (if needed), then open Services → Architects so the form is visible.\n"
         "Press Enter here to begin filling the form..."
@@ -68,15 +76,15 @@ def _get_value(driver, element) -> str:
     return driver.execute_script("return arguments[0].value;", element) or ""
 
 
+@log.step
 def fill_phone(driver):
     try:
         # Find all possible phone inputs and pick the first visible, enabled one
         WebDriverWait(driver, 12).until(
             EC.presence_of_all_elements_located((By.XPATH, "//input[@type='tel']"))
         )
-        candidates = driver.find_elements(By.XPATH, "//input[@type='tel' and (@id='arch-phone' or contains(@placeholder,'Phone'))]")
-        visible = [el for el in candidates if el.is_displayed() and el.get_attribute('disabled') is None]
-        phone_input = visible[0] if visible else candidates[0]
+        phone_xpath = "//input[@type='tel' and (@id='arch-phone' or contains(@placeholder,'Phone'))]"
+        phone_input = dom.first_visible(driver, phone_xpath, enabled=True) or driver.find_element(By.XPATH, phone_xpath)
 
         driver.execute_script("arguments[0].scrollIntoView({block:'center'});", phone_input)
         try:
@@ -95,6 +103,7 @@ def fill_phone(driver):
         return False
 
 
+@log.step
 def set_project_location(driver):
     try:
         loc_input = WebDriverWait(driver, 10).until(
@@ -111,6 +120,7 @@ def set_project_location(driver):
         return False
 
 
+@log.step
 def select_city_first_option(driver):
     try:
         # Prefer specific Architect city combobox by id or span text
@@ -120,15 +130,10 @@ def select_city_first_option(driver):
             )
         except Exception:
             # Fallback: choose second visible combobox (skip any country code dropdown)
-            all_cb = WebDriverWait(driver, 8).until(
-                EC.presence_of_all_elements_located((By.XPATH, "//button[@role='combobox']"))
-            )
-            visible = [c for c in all_cb if c.is_displayed()]
+            visible = WebDriverWait(driver, 8).until(lambda d: dom.visible(d, "//button[@role='combobox']"))
             city_cb = visible[1] if len(visible) >= 2 else visible[0]
 
-        driver.execute_script("arguments[0].scrollIntoView({block:'center'});", city_cb)
-        time.sleep(0.2)
-        driver.execute_script("arguments[0].click();", city_cb)
+        dom.click(driver, city_cb)
         time.sleep(0.4)
         first_opt = WebDriverWait(driver, 6).until(
             EC.element_to_be_clickable((By.XPATH, "(//div[@role='option'] | //li[@role='option'])[1]"))
@@ -139,6 +144,7 @@ def select_city_first_option(driver):
         return False
 
 
+@log.step
 def select_project_type_random(driver):
     try:
         # Use button by id arch-project-type or span text Project Type
@@ -148,58 +154,28 @@ def select_project_type_random(driver):
             )
         except Exception:
             # Fallback: last visible combobox
-            all_cb = WebDriverWait(driver, 8).until(
-                EC.presence_of_all_elements_located((By.XPATH, "//button[@role='combobox']"))
-            )
-            visible = [c for c in all_cb if c.is_displayed()]
+            visible = WebDriverWait(driver, 8).until(lambda d: dom.visible(d, "//button[@role='combobox']"))
             pt_cb = visible[-1]
 
-        driver.execute_script("arguments[0].scrollIntoView({block:'center'});", pt_cb)
-        time.sleep(0.2)
-        driver.execute_script("arguments[0].click();", pt_cb)
-        time.sleep(0.4)
-
-        # Scope the options to this combobox using its aria-controls if present
-        try:
-            listbox_id = pt_cb.get_attribute('aria-controls')
-        except Exception:
-            listbox_id = None
-
-        if listbox_id:
-            opt_xpath = f"//*[@id='{listbox_id}']//div[@role='option']"
-        else:
-            opt_xpath = "//div[@role='option']"
-
-        options = WebDriverWait(driver, 6).until(
-            EC.presence_of_all_elements_located((By.XPATH, opt_xpath))
-        )
-        visible_opts = [o for o in options if o.is_displayed()]
-        if not visible_opts:
-            return False
-        # Avoid picking an empty option if present
-        non_empty = [o for o in visible_opts if (o.text or '').strip() != ''] or visible_opts
-        choice = random.choice(non_empty)
-        driver.execute_script("arguments[0].click();", choice)
-        return True
+        return options.select(driver, pt_cb, "architect.project_type") is not None
     except Exception:
         return False
 
 
+@log.step
 def click_submit(driver):
     try:
         # Prefer visible "Get Free Consultation!" button
-        candidates = driver.find_elements(
-            By.XPATH,
+        visible = dom.visible(
+            driver,
             "//button[normalize-space()='Get Free Consultation!' or contains(., 'Get Free Consultation!')]",
         )
-        visible = [b for b in candidates if b.is_displayed()]
         if not visible:
             # Fall back to other submit buttons
-            candidates = driver.find_elements(
-                By.XPATH,
+            visible = dom.visible(
+                driver,
                 "//button[contains(., 'Get Professional Support') or contains(., 'Get Project') or @type='submit']",
             )
-            visible = [b for b in candidates if b.is_displayed()]
         if not visible:
             # As last resort, wait for any clickable submit-like button
             submit_btn = WebDriverWait(driver, 10).until(
@@ -208,36 +184,52 @@ def click_submit(driver):
         else:
             submit_btn = visible[0]
 
-        driver.execute_script("arguments[0].scrollIntoView({block:'center'});", submit_btn)
-        time.sleep(0.2)
-        driver.execute_script("arguments[0].click();", submit_btn)
+        dom.click(driver, submit_btn)
         return True
     except Exception:
         return False
 
 
+@log.step
 def wait_for_form_reset(driver, timeout: int = 10):
+    """Wait until the form resets (phone input becomes empty) or a success toast shows."""
     try:
-        WebDriverWait(driver, timeout).until(
-            lambda d: (d.find_element(By.ID, "arch-phone").get_attribute("value") or "") == ""
-        )
-        return True
+        return waits.form_reset(driver, [FORM_FIELD_ID], timeout) is not None
     except Exception:
         return False
 
 
+def submit_request(driver, index: int) -> bool:
+    """Fill and submit one Architect Services request; returns True when the submit click went through."""
+    with log.listing(index):
+        ok = True
+        ok &= fill_phone(driver)
+        ok &= select_project_type_random(driver)
+        ok &= set_project_location(driver)
+        ok &= select_city_first_option(driver)
+
+        if not ok:
+            log(f"✗ Could not prepare form for submission {index}")
+            return False
+        if click_submit(driver):
+            log(f"✓ Architect Services request {index} submitted successfully")
+            return True
+        log(f"✗ Submission click failed for request {index}")
+        return False
+
+
 def main():
     # Ask user for number of requests to submit
     try:
         num_requests = int(input("How many Architect Services requests do you want to submit? Enter a number: "))
         if num_requests <= 0:
-            print("Please enter a positive number.")
+            log("Please enter a positive number.")
             return
     except ValueError:
-        print("Please enter a valid number.")
+        log("Please enter a valid number.")
         return
 
-    driver = webdriver.Chrome()
+    driver = create_driver()
     driver.maximize_window()
 
     try:
@@ -247,40 +239,28 @@ def main():
         failed = 0
 
         for i in range(1, num_requests + 1):
-            ok = True
-            ok &= fill_phone(driver)
-            ok &= select_project_type_random(driver)
-            ok &= set_project_location(driver)
-            ok &= select_city_first_option(driver)
-
-            if not ok:
-                print(f"✗ Could not prepare form for submission {i}")
-                failed += 1
+            if submit_request(driver, i):
+                successful += 1
             else:
-                if click_submit(driver):
-                    print(f"✓ Architect Services request {i} submitted successfully")
-                    successful += 1
-                else:
-                    print(f"✗ Submission click failed for request {i}")
-                    failed += 1
+                failed += 1
 
             if i < num_requests:
                 reset_ok = wait_for_form_reset(driver, timeout=10)
-                time.sleep(3)
                 if not reset_ok:
-                    print(f"⚠️  Form may not have reset for request {i}; continuing anyway...")
-                time.sleep(0.5)
+                    log(f"⚠️  Form may not have reset for request {i}; continuing anyway...")
+                    time.sleep(0.5)
 
-        print("\n==============================")
-        print("ARCHITECT SERVICES REQUESTS COMPLETE")
-        print("==============================")
-        print(f"Requested: {num_requests}")
-        print(f"Successful: {successful}")
-        print(f"Failed: {failed}")
+        log("\n==============================")
+        log("ARCHITECT SERVICES REQUESTS COMPLETE")
+        log("==============================")
+        log(f"Requested: {num_requests}")
+        log(f"Successful: {successful}")
+        log(f"Failed: {failed}")
 
+        log.flush()
         input("Press Enter to close the browser...")
     finally:
-        driver.quit()
+        release(driver)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,213 @@
+"""
+Module Name: autoscale.py
+
+Purpose:
+    Picks how many browsers a pool runs instead of guessing. Every interval it
+    samples host CPU and memory (psutil when available, load average and
+    /proc/meminfo otherwise) and the per-step latency reported by the flows'
+    step_end events, compared against the latency the same steps had early in
+    the run. When the host runs hot, memory gets tight or steps slow down and
+    time out, it drains a browser; when there is headroom and work waiting, it
+    adds one. Every decision is logged with the numbers behind it and emitted
+    as an "autoscale" event.
+
+Usage:
+    scaler = autoscale.Autoscaler(pool, max_workers=8)   # pool: see Autoscaler
+    scaler.start()
+    ...
+    scaler.stop()
+
+    python orchestrator.py rent=200 sale=100 --workers 2 --autoscale --max-workers 8
+
+    Environment:
+        HNI_AUTOSCALE_INTERVAL     seconds between decisions (default: 30)
+        HNI_AUTOSCALE_COOLDOWN     seconds to hold after a change (default: 60)
+        HNI_AUTOSCALE_CPU          target host CPU % (default: 75)
+        HNI_AUTOSCALE_MEM          drain above this host memory % (default: 85)
+        HNI_AUTOSCALE_LATENCY      drain when steps are this many times slower than early in the run (default: 1.5)
+        HNI_AUTOSCALE_BROWSER_MB   memory one more browser needs until one has been measured (default: 600)
+"""
+
+import os
+import statistics
+import threading
+import time
+from collections import defaultdict, deque
+
+import eventlog
+from eventlog import get_logger
+
+try:
+    import psutil
+except ImportError:  # falls back to the load average and /proc/meminfo
+    psutil = None
+
+log = get_logger("autoscale")
+
+# Configuration
+INTERVAL = float(os.environ.get("HNI_AUTOSCALE_INTERVAL", "30"))
+COOLDOWN = float(os.environ.get("HNI_AUTOSCALE_COOLDOWN", "60"))
+TARGET_CPU = float(os.environ.get("HNI_AUTOSCALE_CPU", "75"))
+MAX_MEM = float(os.environ.get("HNI_AUTOSCALE_MEM", "85"))
+MAX_LATENCY = float(os.environ.get("HNI_AUTOSCALE_LATENCY", "1.5"))
+BROWSER_MB = float(os.environ.get("HNI_AUTOSCALE_BROWSER_MB", "600"))
+CPU_BAND = 10             # only add below TARGET_CPU - band, only drain above TARGET_CPU + band
+BASELINE_SAMPLES = 5      # first durations of a step taken as its unloaded latency
+WINDOW_SAMPLES = 10       # recent durations of a step compared against that baseline
+
+MB = 1024 * 1024
+
+
+def host_load():
+    """Host CPU % (since the previous call), memory % and available memory in MB."""
+    if psutil is not None:
+        mem = psutil.virtual_memory()
+        return {
+            "cpu": psutil.cpu_percent(interval=None),
+            "mem": mem.percent,
+            "mem_available_mb": round(mem.available / MB),
+        }
+    sample = {"cpu": None, "mem": None, "mem_available_mb": None}
+    try:
+        sample["cpu"] = round(os.getloadavg()[0] / (os.cpu_count() or 1) * 100, 1)
+    except (AttributeError, OSError):
+        pass
+    try:
+        with open("/proc/meminfo", encoding="utf-8") as f:
+            info = {line.split(":")[0]: int(line.split()[1]) for line in f if line.split()[1:]}
+        total, available = info["MemTotal"], info["MemAvailable"]
+        sample["mem"] = round((total - available) / total * 100, 1)
+        sample["mem_available_mb"] = round(available / 1024)
+    except (OSError, KeyError, ValueError):
+        pass
+    return sample
+
+
+class StepLatency:
+    """eventlog listener: how much slower steps run now than at the start of the run."""
+
+    def __init__(self):
+        self.baseline = {}
+        self.recent = defaultdict(lambda: deque(maxlen=WINDOW_SAMPLES))
+        self.timeouts = 0
+        self.browser_mb = None
+        self._lock = threading.Lock()
+
+    def __call__(self, event):
+        kind = event["event"]
+        if kind == "step_end" and event.get("duration_ms") is not None:
+            key = (event["flow"], event["step"])
+            with self._lock:
+                window = self.recent[key]
+                window.append(event["duration_ms"])
+                if key not in self.baseline and len(window) >= BASELINE_SAMPLES:
+                    self.baseline[key] = statistics.median(window)
+        elif kind == "step_error" and "Timeout" in (event.get("error") or ""):
+            with self._lock:
+                self.timeouts += 1
+        elif kind == "memory" and event.get("rss_mb"):
+            # browserwatch samples each browser's process tree after every listing
+            with self._lock:
+                self.browser_mb = max(self.browser_mb or 0, event["rss_mb"])
+
+    def take(self):
+        """(median slowdown across steps or None, step timeouts since the last call)."""
+        with self._lock:
+            ratios = [
+                statistics.median(self.recent[key]) / base
+                for key, base in self.baseline.items()
+                if base > 0 and len(self.recent[key]) >= BASELINE_SAMPLES
+            ]
+            timeouts, self.timeouts = self.timeouts, 0
+        return (round(statistics.median(ratios), 2) if ratios else None), timeouts
+
+
+class Autoscaler:
+    """Adds or drains pool workers to keep the host near its target load.
+
+    `pool` provides active_workers() -> int, backlog() -> int (items still to
+    run), add_worker() and drain_worker() (finish the current item, then stop).
+    """
+
+    def __init__(self, pool, min_workers: int = 1, max_workers: int = None,
+                 interval: float = INTERVAL, cooldown: float = COOLDOWN):
+        self.pool = pool
+        self.min_workers = max(1, min_workers)
+        self.max_workers = max(self.min_workers, max_workers or os.cpu_count() or 4)
+        self.interval = interval
+        self.cooldown = cooldown
+        self.latency = StepLatency()
+        self.last_change = 0.0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="autoscaler", daemon=True)
+
+    def start(self):
+        eventlog.subscribe(self.latency)
+        host_load()  # primes psutil's CPU counter
+        self._thread.start()
+        log(f"Autoscaling between {self.min_workers} and {self.max_workers} browsers "
+            f"(CPU target {TARGET_CPU:.0f}%, memory limit {MAX_MEM:.0f}%, latency limit {MAX_LATENCY}x)")
+
+    def stop(self):
+        self._stop.set()
+        eventlog.unsubscribe(self.latency)
+        self._thread.join(timeout=5)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.tick()
+            except Exception as e:
+                log(f"⚠️  Autoscaler tick failed ({type(e).__name__}):", str(e))
+
+    def decide(self, workers: int, backlog: int, load, slowdown, timeouts):
+        """Returns (delta, reason) for one tick: +1, -1 or 0 workers."""
+        cpu, mem, available = load["cpu"], load["mem"], load["mem_available_mb"]
+        browser_mb = self.latency.browser_mb or BROWSER_MB
+        cooling = time.time() - self.last_change < self.cooldown
+        if workers > self.min_workers:
+            # Memory pressure is drained at once; the rest waits out the cooldown so
+            # a browser that is still starting up does not trigger its own removal
+            if mem is not None and mem > MAX_MEM:
+                return -1, f"memory {mem:.0f}% above {MAX_MEM:.0f}%"
+            if not cooling and cpu is not None and cpu > TARGET_CPU + CPU_BAND:
+                return -1, f"CPU {cpu:.0f}% above target {TARGET_CPU:.0f}%"
+            if not cooling and timeouts:
+                return -1, f"{timeouts} step timeout(s) in the last {self.interval:.0f}s"
+            if not cooling and slowdown is not None and slowdown > MAX_LATENCY:
+                return -1, f"steps {slowdown}x slower than early in the run"
+        if cooling:
+            return 0, "cooling down after the last change"
+        if workers >= self.max_workers:
+            return 0, f"at the {self.max_workers}-browser limit"
+        if backlog <= workers:
+            return 0, f"only {backlog} item(s) left for {workers} browser(s)"
+        if cpu is None:
+            return 0, "host CPU unknown"
+        if cpu >= TARGET_CPU - CPU_BAND:
+            return 0, f"CPU {cpu:.0f}% near target {TARGET_CPU:.0f}%"
+        if available is not None and available < browser_mb * 1.5:
+            return 0, f"{available} MB free, a browser needs ~{browser_mb:.0f} MB"
+        if timeouts or (slowdown is not None and slowdown > MAX_LATENCY):
+            return 0, "steps are slowing down"
+        return 1, (f"CPU {cpu:.0f}% below target {TARGET_CPU:.0f}%"
+                   + (f", {available} MB free" if available is not None else "")
+                   + f", {backlog} item(s) waiting")
+
+    def tick(self):
+        workers = self.pool.active_workers()
+        backlog = self.pool.backlog()
+        load = host_load()
+        slowdown, timeouts = self.latency.take()
+        delta, reason = self.decide(workers, backlog, load, slowdown, timeouts)
+        eventlog.emit("autoscale", workers=workers, target=workers + delta, backlog=backlog,
+                      slowdown=slowdown, timeouts=timeouts, reason=reason, **load)
+        if delta > 0:
+            log(f"↻ Adding browser {workers + 1}: {reason}")
+            self.pool.add_worker()
+        elif delta < 0:
+            log(f"↻ Draining to {workers - 1} browser(s): {reason}")
+            self.pool.drain_worker()
+        if delta:
+            self.last_change = time.time()
+        return delta, reason
@@ -0,0 +1,221 @@
+"""
+Module Name: bench.py
+
+Purpose:
+    Throughput benchmark with regression gates. Runs each selected flow N
+    times on one browser, recording wall time per listing/lead and per step,
+    WebDriver commands issued and browser memory. Results are compared with
+    a stored JSON baseline and the run fails (exit code 1) when a flow got
+    slower, or chattier with the browser, by more than the threshold.
+
+    Service flows run against the local benchsite.py stand-in by default.
+    The stand-in only emulates the Services lead forms, not the posting
+    wizard, so posting flows (run_full_post_flow) can only be benchmarked
+    with --site against a real deployment (staging) given by HNI_BASE_URL;
+    without --site they are refused. --site refuses to run when HNI_BASE_URL
+    is unset or points at production, since every run submits real items.
+
+Usage:
+    python bench.py                                  # all Services forms on the stand-in, 5 each
+    python bench.py loans packers --n 10 --save-baseline
+    HNI_BASE_URL=https://staging.homehni.in python bench.py rent sale --n 3 --site   # posting flows: --site only
+
+    Results:   runs/bench-<RUN_ID>.json
+    Baseline:  runs/bench-baseline.json (one section per target site)
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+from urllib.parse import urlparse
+
+import eventlog
+from eventlog import get_logger
+
+log = get_logger("bench")
+
+# Configuration
+DEFAULT_RUNS = 5
+DEFAULT_THRESHOLD = 0.20      # allowed slowdown / extra commands vs. baseline
+BASELINE_FILE = os.path.join(eventlog.LOG_DIR, "bench-baseline.json")
+GATED_METRICS = ("median_seconds", "commands_per_item")
+PRODUCTION_HOSTS = ("homehni.in", "www.homehni.in")   # --site never posts benchmark listings here
+
+
+def percentile(values, pct: float):
+    ordered = sorted(values)
+    if not ordered:
+        return None
+    k = min(len(ordered) - 1, max(0, round(pct / 100 * (len(ordered) - 1))))
+    return ordered[k]
+
+
+def count_commands(driver):
+    """Count every WebDriver command the flows send through `driver`."""
+    driver._hni_commands = 0
+    execute = driver.execute
+
+    def counted(command, params=None):
+        driver._hni_commands += 1
+        return execute(command, params)
+
+    driver.execute = counted
+
+
+class StepTimes:
+    """Collects step_end durations for the flow currently being benchmarked."""
+
+    def __init__(self):
+        self.steps = {}
+
+    def __call__(self, event):
+        if event.get("event") == "step_end" and event.get("duration_ms") is not None:
+            self.steps.setdefault(event.get("step"), []).append(event["duration_ms"])
+
+    def take(self):
+        steps, self.steps = self.steps, {}
+        return {name: round(statistics.median(ms), 1) for name, ms in steps.items()}
+
+
+def bench_flow(driver, flow: str, runs: int, step_times: StepTimes):
+    import browserwatch
+    import flows
+
+    seconds, commands, heap = [], [], []
+    ok_count = 0
+    for index in range(1, runs + 1):
+        before = driver._hni_commands
+        start = time.perf_counter()
+        ok, error = flows.run_item(driver, flow, index)
+        seconds.append(time.perf_counter() - start)
+        commands.append(driver._hni_commands - before)
+        ok_count += ok
+        if not ok:
+            log(f"✗ {flow} #{index} failed ({error})")
+        heap_mb = browserwatch.page_metrics(driver).get("heap_mb")
+        if heap_mb is not None:
+            heap.append(heap_mb)
+    return {
+        "runs": runs,
+        "ok": ok_count,
+        "median_seconds": round(statistics.median(seconds), 3),
+        "p90_seconds": round(percentile(seconds, 90), 3),
+        "commands_per_item": round(statistics.median(commands), 1),
+        "max_heap_mb": max(heap) if heap else None,
+        "step_median_ms": step_times.take(),
+    }
+
+
+def compare(results, baseline, threshold: float):
+    """Regressions as human-readable lines (empty when the gate passes)."""
+    problems = []
+    for flow, current in results.items():
+        if current["ok"] < current["runs"]:
+            problems.append(f"{flow}: {current['runs'] - current['ok']} of {current['runs']} runs failed")
+        base = baseline.get(flow)
+        if not base:
+            continue
+        for metric in GATED_METRICS:
+            if base.get(metric) and current[metric] > base[metric] * (1 + threshold):
+                problems.append(
+                    f"{flow}: {metric} {current[metric]} vs baseline {base[metric]} "
+                    f"(+{(current[metric] / base[metric] - 1) * 100:.0f}%, limit +{threshold * 100:.0f}%)"
+                )
+    return problems
+
+
+def load_baselines():
+    try:
+        with open(BASELINE_FILE, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark HomeHNI flows against a stored baseline")
+    parser.add_argument("flows", nargs="*", help="flow names (default: every Services form)")
+    parser.add_argument("--n", type=int, default=DEFAULT_RUNS, help="runs per flow")
+    parser.add_argument("--site", action="store_true",
+                        help="use HNI_BASE_URL instead of the local stand-in (required for posting flows)")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    parser.add_argument("--save-baseline", action="store_true", help="store these results as the new baseline")
+    args = parser.parse_args()
+
+    if not args.site:
+        import benchsite
+
+        _, url = benchsite.start()
+        os.environ["HNI_BASE_URL"] = url
+        # Stand-in options must not overwrite the production option catalog
+        os.environ.setdefault("HNI_OPTIONS_CACHE", os.path.join(eventlog.LOG_DIR, "options-standin.json"))
+        target = "standin"
+    else:
+        # Every run submits --n real listings or leads, so it must be pointed at a non-production site
+        target = os.environ.get("HNI_BASE_URL", "")
+        if not target:
+            parser.error("--site needs HNI_BASE_URL set to a staging deployment")
+        if (urlparse(target).hostname or "").lower() in PRODUCTION_HOSTS:
+            parser.error(f"--site refuses to benchmark against production ({target}); use a staging HNI_BASE_URL")
+
+    # Imported only now so they pick up HNI_BASE_URL
+    import drivers
+    import flows
+
+    names = args.flows or list(flows.SERVICE_FLOWS)
+    for name in names:
+        flows.load(name)
+    posting = [name for name in names if not flows.is_service(name)]
+    if posting and not args.site:
+        parser.error(f"the local stand-in only emulates the Services forms; {', '.join(posting)} "
+                     "need a real site: set HNI_BASE_URL and pass --site")
+
+    step_times = StepTimes()
+    eventlog.subscribe(step_times)
+    driver = drivers.create_driver()
+    results = {}
+    try:
+        driver.maximize_window()
+        if args.site:
+            flows.login(driver, names[0])
+        else:
+            driver.get(flows.SERVICES_URL)
+        count_commands(driver)
+        for name in names:
+            log(f"Benchmarking {name} x{args.n} on {target}")
+            results[name] = bench_flow(driver, name, args.n, step_times)
+            r = results[name]
+            log(f"✓ {name}: median {r['median_seconds']}s, p90 {r['p90_seconds']}s, "
+                f"{r['commands_per_item']} commands, {r['ok']}/{r['runs']} ok")
+    finally:
+        drivers.release(driver)
+
+    baselines = load_baselines()
+    problems = compare(results, baselines.get(target, {}), args.threshold)
+    report = {"run": eventlog.RUN_ID, "target": target, "threshold": args.threshold,
+              "flows": results, "regressions": problems}
+    os.makedirs(eventlog.LOG_DIR, exist_ok=True)
+    path = os.path.join(eventlog.LOG_DIR, f"bench-{eventlog.RUN_ID}.json")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    log(f"Results written to {path}")
+
+    if args.save_baseline:
+        baselines.setdefault(target, {}).update(results)
+        with open(BASELINE_FILE, "w", encoding="utf-8") as f:
+            json.dump(baselines, f, indent=2)
+        log(f"✓ Baseline updated in {BASELINE_FILE}")
+
+    for problem in problems:
+        log(f"✗ Regression: {problem}")
+    if not problems:
+        log("✓ No regressions")
+    log.flush()
+    sys.exit(1 if problems else 0)
+
+
+if __name__ == "__main__":
+    main()
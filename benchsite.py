@@ -0,0 +1,238 @@
+"""
+Module Name: benchsite.py
+
+Purpose:
+    Local stand-in for the HomeHNI Services page, used by bench.py so lead
+    form cycles can be benchmarked without touching production. It serves
+    the six Services tabs with the element ids, names, combobox/listbox
+    markup and button texts the service scripts target, validates each
+    submission and resets the form afterwards like the real site. The
+    posting wizard is not emulated; bench.py runs posting flows against a
+    real deployment given by HNI_BASE_URL.
+
+Usage:
+    python benchsite.py --port 8800
+    HNI_BASE_URL=http://127.0.0.1:8800 python loans.py
+
+    from benchsite import start
+    server, url = start()          # background thread, free port
+"""
+
+import argparse
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from eventlog import get_logger
+
+log = get_logger("benchsite")
+
+# Configuration
+CITIES = ["Bangalore", "Hyderabad", "Chennai", "Mumbai", "Pune"]
+RESET_DELAY_MS = 400      # time the real site takes to acknowledge and clear the form
+
+# Tab label -> form definition mirroring the ids/texts used by the service scripts
+SERVICES = {
+    "Loans": {
+        "phone": "loan-phone-mobile",
+        "type": ["Select Loan Type", None, ["Home Loan", "Plot Loan", "Construction Loan", "Loan Against Property"]],
+        "inputs": [{"id": "loan-amount-mobile", "name": "amount", "type": "number", "placeholder": "Loan Amount"}],
+        "submit": "Get Pre-Approved Now!",
+    },
+    "Packers & Movers": {
+        "phone": "moving-phone-mobile",
+        "type": ["Select Service Type", None, ["Within City", "Intercity", "Office Shifting", "Vehicle Shifting"]],
+        "inputs": [],
+        "submit": "Get Free Moving Quote",
+    },
+    "Handover Services": {
+        "phone": "handover-phone-mobile",
+        "type": ["Select Service Type", None, ["Property Inspection", "Key Handover", "Snagging"]],
+        "inputs": [],
+        "submit": "Get Professional Support",
+    },
+    "Home Security Services": {
+        "phone": "security-phone-mobile",
+        "type": ["Select Service Type", None, ["CCTV Installation", "Smart Locks", "Alarm Systems"]],
+        "inputs": [],
+        "submit": "Get Free Security Consultation",
+    },
+    "Property Management": {
+        "phone": "property-phone-mobile",
+        "type": ["Select Property Type", None, ["Apartment", "Villa", "Commercial", "Plot"]],
+        "inputs": [],
+        "submit": "Get Professional Support",
+    },
+    "Architects": {
+        "phone": "arch-phone",
+        "city_id": "arch-city",
+        "type": ["Select Project Type", "arch-project-type", ["Residential", "Commercial", "Interior", "Landscape"]],
+        "inputs": [{"id": "arch-location", "name": "location", "type": "text", "placeholder": "Project Location"}],
+        "submit": "Get Free Consultation!",
+    },
+}
+
+_PAGE = """<!doctype html>
+<html><head><meta charset="utf-8"><title>HomeHNI stand-in</title>
+<style>
+body { font-family: sans-serif; margin: 24px; }
+.tabs button { margin-right: 6px; }
+form { margin-top: 16px; display: grid; gap: 10px; max-width: 360px; }
+[role=listbox] { border: 1px solid #999; background: #fff; }
+[role=option] { padding: 4px 8px; cursor: pointer; }
+#toast { color: green; min-height: 1em; }
+</style></head>
+<body>
+<nav><a href="/">Home</a> <a href="/services">Services</a> <a href="/post-property">Post Property</a></nav>
+<div class="tabs" id="tabs"></div>
+<div id="panel"></div>
+<div id="toast"></div>
+<script>
+const SERVICES = __SERVICES__;
+const CITIES = __CITIES__;
+const RESET_DELAY_MS = __RESET_DELAY_MS__;
+let listboxSeq = 0;
+
+function combobox(placeholder, id, options) {
+  const wrap = document.createElement('div');
+  const button = document.createElement('button');
+  button.type = 'button';
+  button.setAttribute('role', 'combobox');
+  button.setAttribute('aria-expanded', 'false');
+  if (id) button.id = id;
+  const label = document.createElement('span');
+  label.textContent = placeholder;
+  button.appendChild(label);
+  button.dataset.value = '';
+  wrap.appendChild(button);
+  let listbox = null;
+  const close = () => { if (listbox) { listbox.remove(); listbox = null; button.setAttribute('aria-expanded', 'false'); } };
+  button.addEventListener('click', () => {
+    if (listbox) return close();
+    listbox = document.createElement('div');
+    listbox.setAttribute('role', 'listbox');
+    listbox.id = 'listbox-' + (++listboxSeq);
+    button.setAttribute('aria-controls', listbox.id);
+    button.setAttribute('aria-expanded', 'true');
+    for (const text of options) {
+      const option = document.createElement('div');
+      option.setAttribute('role', 'option');
+      option.textContent = text;
+      option.addEventListener('click', () => { label.textContent = text; button.dataset.value = text; close(); });
+      listbox.appendChild(option);
+    }
+    wrap.appendChild(listbox);
+  });
+  button.reset = () => { close(); label.textContent = placeholder; button.dataset.value = ''; };
+  return wrap;
+}
+
+function input(attrs) {
+  const el = document.createElement('input');
+  for (const [k, v] of Object.entries(attrs)) el.setAttribute(k, v);
+  return el;
+}
+
+function render(tab) {
+  const spec = SERVICES[tab];
+  const panel = document.getElementById('panel');
+  panel.innerHTML = '';
+  const form = document.createElement('form');
+  form.appendChild(input({id: spec.phone, name: 'phone', type: 'tel', placeholder: 'Phone Number'}));
+  form.appendChild(combobox('Select City', spec.city_id || null, CITIES));
+  form.appendChild(combobox(spec.type[0], spec.type[1], spec.type[2]));
+  for (const attrs of spec.inputs) form.appendChild(input(attrs));
+  const submit = document.createElement('button');
+  submit.type = 'submit';
+  submit.textContent = spec.submit;
+  form.appendChild(submit);
+  form.addEventListener('submit', (e) => {
+    e.preventDefault();
+    const toast = document.getElementById('toast');
+    const phone = form.querySelector('input[name=phone]').value.trim();
+    const picked = [...form.querySelectorAll('[role=combobox]')].every(b => b.dataset.value);
+    const filled = [...form.querySelectorAll('input')].every(i => i.value.trim());
+    if (!/^\\d{10}$/.test(phone) || !picked || !filled) { toast.textContent = 'Please complete the form'; return; }
+    toast.textContent = 'Request submitted';
+    setTimeout(() => {
+      form.querySelectorAll('input').forEach(i => { i.value = ''; });
+      form.querySelectorAll('[role=combobox]').forEach(b => b.reset());
+      toast.textContent = '';
+    }, RESET_DELAY_MS);
+  });
+  panel.appendChild(form);
+}
+
+const tabs = document.getElementById('tabs');
+for (const tab of Object.keys(SERVICES)) {
+  const b = document.createElement('button');
+  b.type = 'button';
+  const s = document.createElement('span');
+  s.textContent = tab;
+  b.appendChild(s);
+  b.addEventListener('click', () => render(tab));
+  tabs.appendChild(b);
+}
+render(Object.keys(SERVICES)[0]);
+</script>
+</body></html>
+"""
+
+_SIMPLE = """<!doctype html><html><head><meta charset="utf-8"><title>HomeHNI stand-in</title></head>
+<body><nav><a href="/services">Services</a> <a href="/post-property">Post Property</a></nav><p>{text}</p></body></html>
+"""
+
+
+def services_page() -> str:
+    return (
+        _PAGE.replace("__SERVICES__", json.dumps(SERVICES))
+        .replace("__CITIES__", json.dumps(CITIES))
+        .replace("__RESET_DELAY_MS__", str(RESET_DELAY_MS))
+    )
+
+
+class Handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        path = self.path.split("?", 1)[0].rstrip("/")
+        if path == "/services":
+            body = services_page()
+        elif path in ("", "/dashboard"):
+            body = _SIMPLE.format(text="HomeHNI stand-in for benchmarks.")
+        elif path == "/post-property":
+            body = _SIMPLE.format(text="The posting wizard is not emulated; benchmark posting flows against HNI_BASE_URL.")
+        else:
+            self.send_error(404)
+            return
+        data = body.encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+def start(host: str = "127.0.0.1", port: int = 0):
+    """Serve the stand-in on a background thread; returns (server, base_url)."""
+    server = ThreadingHTTPServer((host, port), Handler)
+    threading.Thread(target=server.serve_forever, name="benchsite", daemon=True).start()
+    return server, f"http://{host}:{server.server_address[1]}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve the HomeHNI Services stand-in")
+    parser.add_argument("--port", type=int, default=8800)
+    args = parser.parse_args()
+    server = ThreadingHTTPServer(("127.0.0.1", args.port), Handler)
+    log(f"✓ Stand-in site on http://127.0.0.1:{args.port}/services")
+    log.flush()
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+"""
+Module Name: browserwatch.py
+
+Purpose:
+    Bounds browser memory growth over long runs. After every listing the
+    watchdog samples the browser's memory (Chrome process tree RSS through
+    psutil when available, JS heap and DOM node counts through CDP) and
+    transparently recycles the tab after N listings, or the whole driver
+    once memory passes a threshold. The logged-in session (cookies plus
+    local/session storage) is carried over, so the flow continues as if
+    nothing happened and late-run throughput stays flat.
+
+Usage:
+    watch = browserwatch.Watchdog(landing_url=flows.POST_PROPERTY_URL)
+    for i in range(1, n + 1):
+        run_full_post_flow(driver, i)
+        driver = watch.check(driver)
+
+    Environment:
+        HNI_RECYCLE_EVERY    recycle the tab after this many listings (default: 50, 0 = never)
+        HNI_RECYCLE_RSS_MB   recycle the driver past this Chrome RSS (default: 2048)
+        HNI_RECYCLE_HEAP_MB  recycle the driver past this JS heap (default: 768)
+"""
+
+import os
+
+import eventlog
+import session
+from eventlog import get_logger
+from netblock import cdp
+
+try:
+    import psutil
+except ImportError:  # RSS sampling is optional; CDP heap metrics still work
+    psutil = None
+
+log = get_logger("browserwatch")
+
+# Configuration
+RECYCLE_EVERY = int(os.environ.get("HNI_RECYCLE_EVERY", "50"))
+RECYCLE_RSS_MB = float(os.environ.get("HNI_RECYCLE_RSS_MB", "2048"))
+RECYCLE_HEAP_MB = float(os.environ.get("HNI_RECYCLE_HEAP_MB", "768"))
+
+MB = 1024 * 1024
+
+
+def chrome_rss_mb(driver):
+    """RSS of the local chromedriver's Chrome process tree, or None."""
+    if psutil is None:
+        return None
+    try:
+        root = psutil.Process(driver.service.process.pid)
+        procs = [root] + root.children(recursive=True)
+    except Exception:
+        return None
+    total = 0
+    for proc in procs:
+        try:
+            total += proc.memory_info().rss
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            pass
+    return round(total / MB, 1)
+
+
+def page_metrics(driver):
+    """JS heap and DOM counters of the current tab through CDP ({} if unavailable)."""
+    try:
+        cdp(driver, "Performance.enable")
+        metrics = {m["name"]: m["value"] for m in cdp(driver, "Performance.getMetrics")["metrics"]}
+    except Exception:
+        return {}
+    return {
+        "heap_mb": round(metrics.get("JSHeapUsedSize", 0) / MB, 1),
+        "nodes": int(metrics.get("Nodes", 0)),
+        "listeners": int(metrics.get("JSEventListeners", 0)),
+        "documents": int(metrics.get("Documents", 0)),
+    }
+
+
+class Watchdog:
+    """Per-browser listing counter and memory policy."""
+
+    def __init__(self, landing_url: str = None, every: int = RECYCLE_EVERY,
+                 rss_mb: float = RECYCLE_RSS_MB, heap_mb: float = RECYCLE_HEAP_MB):
+        self.landing_url = landing_url
+        self.every = every
+        self.rss_mb = rss_mb
+        self.heap_mb = heap_mb
+        self.listings = 0
+        self.recycles = 0
+        self.state = None
+
+    def sample(self, driver):
+        sample = page_metrics(driver)
+        rss = chrome_rss_mb(driver)
+        if rss is not None:
+            sample["rss_mb"] = rss
+        return sample
+
+    def check(self, driver):
+        """Call after each listing; returns the driver to use next (maybe a new one)."""
+        self.listings += 1
+        sample = self.sample(driver)
+        eventlog.emit("memory", listings=self.listings, **sample)
+        if sample.get("rss_mb", 0) > self.rss_mb or sample.get("heap_mb", 0) > self.heap_mb:
+            log(f"⚠️  Browser memory high ({sample}); restarting the browser")
+            return self.recycle_driver(driver)
+        if self.every and self.listings % self.every == 0:
+            return self.recycle_tab(driver)
+        return driver
+
+    def recycle_tab(self, driver):
+        """Replace the tab with a fresh one in the same browser (drops SPA state, blobs, detached DOM)."""
+        try:
+            state = self.state = session.export_session(driver)
+            old = driver.current_window_handle
+            driver.switch_to.new_window("tab")
+            fresh = driver.current_window_handle
+            driver.switch_to.window(old)
+            driver.close()
+            driver.switch_to.window(fresh)
+            session.import_session(driver, state, self.landing_url)
+        except Exception as e:
+            log(f"⚠️  Tab recycle failed ({type(e).__name__}); restarting the browser")
+            return self.recycle_driver(driver)
+        self.recycles += 1
+        eventlog.emit("recycle", kind="tab", listings=self.listings)
+        log(f"↻ Recycled tab after {self.listings} listings")
+        return driver
+
+    def recycle_driver(self, driver):
+        """Quit the browser and continue in a new one carrying the same session."""
+        import drivers
+
+        try:
+            self.state = session.export_session(driver)
+        except Exception:
+            # A crashed renderer cannot export; fall back to the last good snapshot
+            if self.state is None:
+                raise
+        state = self.state
+        try:
+            drivers.release(driver)
+        except Exception:
+            pass
+        fresh = drivers.create_driver()
+        fresh.maximize_window()
+        session.import_session(fresh, state, self.landing_url)
+        self.recycles += 1
+        eventlog.emit("recycle", kind="driver", listings=self.listings)
+        log(f"↻ Restarted browser after {self.listings} listings")
+        return fresh
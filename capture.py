@@ -0,0 +1,165 @@
+"""
+Module Name: capture.py
+
+Purpose:
+    Failure-time diagnostics at near-zero cost on the success path. Each
+    worker keeps a breadcrumb (step, outcome, duration) of the last K step
+    boundaries in an in-memory ring buffer, taken from the step_end events
+    without talking to the browser. Only when a step reports a failure
+    ("✗ Could not find Lift dropdown") is the failing page's URL, title and
+    DOM (and/or a screenshot) taken and the ring handed to a background
+    thread that writes it compressed to runs/captures/.
+
+Usage:
+    Attached automatically to every driver made by drivers.create_driver().
+    Manual use:
+        capture.attach(driver)
+
+    Environment:
+        HNI_CAPTURE        what a failure captures: dom | screenshot | both | off (default: dom)
+        HNI_CAPTURE_DEPTH  snapshots kept per worker (default: 5)
+"""
+
+import atexit
+import json
+import os
+import queue
+import re
+import threading
+import time
+import zipfile
+from collections import deque
+
+import eventlog
+
+# Configuration
+CAPTURE_MODE = os.environ.get("HNI_CAPTURE", "dom")
+CAPTURE_DEPTH = int(os.environ.get("HNI_CAPTURE_DEPTH", "5"))
+CAPTURE_DIR = os.path.join(eventlog.LOG_DIR, "captures")
+
+_local = threading.local()
+_flush_queue = queue.SimpleQueue()
+_flush_thread = None
+_flush_lock = threading.Lock()
+_pending = 0
+
+
+class RingBuffer:
+    """Last K step breadcrumbs of one worker's browser, plus full snapshots at failures."""
+
+    def __init__(self, driver, depth: int = CAPTURE_DEPTH, mode: str = CAPTURE_MODE):
+        self.driver = driver
+        self.mode = mode
+        self.snapshots = deque(maxlen=depth)
+        self.flushed = set()
+
+    def breadcrumb(self, event):
+        """Step-boundary record built from the step_end event alone; no browser round trip."""
+        self.snapshots.append({
+            "label": f"after-{event.get('step')}",
+            "ts": event.get("ts"),
+            "outcome": event.get("outcome"),
+            "duration_ms": event.get("duration_ms"),
+        })
+
+    def snapshot(self, label: str):
+        item = {"label": label, "ts": time.time()}
+        try:
+            item["url"], item["title"] = self.driver.execute_script("return [location.href, document.title];")
+            if self.mode in ("dom", "both"):
+                item["html"] = self.driver.execute_script("return document.documentElement.outerHTML;")
+            if self.mode in ("screenshot", "both"):
+                item["png"] = self.driver.get_screenshot_as_png()
+        except Exception as e:
+            item["error"] = f"{type(e).__name__}: {e}"
+        self.snapshots.append(item)
+
+    def on_event(self, event):
+        kind = event.get("event")
+        if kind == "listing_start":
+            self.flushed.clear()
+        elif kind == "step_end":
+            self.breadcrumb(event)
+        elif kind in ("step_error", "listing_error") or (kind == "message" and event.get("outcome") == "fail"):
+            key = (event.get("listing"), event.get("step"))
+            if key in self.flushed:
+                return
+            self.flushed.add(key)
+            self.snapshot(f"fail-{event.get('field') or event.get('step')}")
+            _schedule_flush(event, list(self.snapshots))
+
+
+def _on_event(event):
+    ring = getattr(_local, "ring", None)
+    if ring is not None:
+        ring.on_event(event)
+
+
+def attach(driver, depth: int = CAPTURE_DEPTH, mode: str = CAPTURE_MODE):
+    """Give the calling thread a ring buffer over `driver`."""
+    if mode == "off":
+        _local.ring = None
+        return None
+    _local.ring = RingBuffer(driver, depth, mode)
+    eventlog.subscribe(_on_event)
+    return _local.ring
+
+
+def detach():
+    _local.ring = None
+
+
+def _schedule_flush(event, snapshots):
+    global _flush_thread, _pending
+    with _flush_lock:
+        if _flush_thread is None:
+            _flush_thread = threading.Thread(target=_flush_loop, name="capture-writer", daemon=True)
+            _flush_thread.start()
+            atexit.register(drain)
+        _pending += 1
+    _flush_queue.put((event, snapshots))
+
+
+def _flush_loop():
+    global _pending
+    while True:
+        event, snapshots = _flush_queue.get()
+        try:
+            _write(event, snapshots)
+        except Exception:
+            pass
+        with _flush_lock:
+            _pending -= 1
+
+
+def drain(timeout: float = 10.0):
+    """Wait for scheduled captures to be written (called at exit)."""
+    deadline = time.time() + timeout
+    while _pending and time.time() < deadline:
+        time.sleep(0.05)
+
+
+def _safe(text) -> str:
+    return re.sub(r"[^A-Za-z0-9_.-]+", "_", str(text)).strip("_")
+
+
+def _write(event, snapshots):
+    os.makedirs(CAPTURE_DIR, exist_ok=True)
+    name = "-".join(
+        _safe(part) for part in (
+            eventlog.RUN_ID, event.get("worker"), event.get("flow"),
+            event.get("listing"), event.get("step"), int(event["ts"] * 1000),
+        ) if part is not None
+    )
+    path = os.path.join(CAPTURE_DIR, f"{name}.zip")
+    with zipfile.ZipFile(path, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+        meta = {"event": event, "snapshots": []}
+        for n, item in enumerate(snapshots):
+            base = f"{n:02d}-{_safe(item['label'])}"
+            if "html" in item:
+                zf.writestr(f"{base}.html", item["html"] or "")
+            if "png" in item:
+                # PNG is already compressed; store it as-is
+                zf.writestr(zipfile.ZipInfo(f"{base}.png"), item["png"], compress_type=zipfile.ZIP_STORED)
+            meta["snapshots"].append({k: v for k, v in item.items() if k not in ("html", "png")})
+        zf.writestr("meta.json", json.dumps(meta, indent=2, default=str))
@@ -0,0 +1,317 @@
+"""
+Module Name: daemon.py
+
+Purpose:
+    Long-lived automation daemon. It starts once, pays Python/Selenium import,
+    chromedriver and Chrome start-up and the manual login a single time, and
+    then keeps a pool of logged-in browsers warm. Ad-hoc batches ("50 loan
+    leads", "200 PG listings") are submitted from a thin CLI over a local
+    socket and start on an idle browser immediately. Failed items are retried
+    with backoff on a fresh tab ahead of queued work (see retry.py).
+
+Usage:
+    # Terminal 1: start the daemon (log in once when prompted)
+    python daemon.py serve --workers 2
+    python daemon.py serve --workers 2 --session runs/session.json
+
+    # Anywhere on the same machine
+    python daemon.py submit loans 50
+    python daemon.py submit pg 200 --wait
+    python daemon.py status
+    python daemon.py stop
+
+    Flows: any name in flows.POSTING_FLOWS or flows.SERVICE_FLOWS.
+"""
+
+import argparse
+import itertools
+import json
+import os
+import queue
+import socket
+import socketserver
+import threading
+import time
+
+from eventlog import get_logger
+
+log = get_logger("daemon")
+
+# Configuration
+HOST = "127.0.0.1"
+PORT = int(os.environ.get("HNI_DAEMON_PORT", "8766"))
+DEFAULT_WORKERS = 2
+
+
+class Job:
+    _ids = itertools.count(1)
+
+    def __init__(self, flow: str, count: int):
+        self.id = next(self._ids)
+        self.flow = flow
+        self.count = count
+        self.ok = 0
+        self.partial = 0
+        self.failed = 0
+        self.retried = 0
+        self.submitted = time.time()
+        self.first_action = None
+        self.finished = None
+
+    def as_dict(self):
+        done = self.ok + self.failed
+        return {
+            "id": self.id,
+            "flow": self.flow,
+            "count": self.count,
+            "ok": self.ok,
+            "partial": self.partial,
+            "failed": self.failed,
+            "retried": self.retried,
+            "state": "done" if done >= self.count else ("running" if self.first_action else "queued"),
+            "time_to_first_action_ms": (
+                round((self.first_action - self.submitted) * 1000) if self.first_action else None
+            ),
+            "elapsed_seconds": round((self.finished or time.time()) - self.submitted, 1),
+        }
+
+
+class Daemon:
+    def __init__(self, workers: int = DEFAULT_WORKERS, session_path: str = None):
+        self.workers = workers
+        self.session_path = session_path
+        self.items = queue.Queue()
+        self.jobs = {}
+        self.lock = threading.Lock()
+        self.drivers = []
+        self.stopping = threading.Event()
+        self.retries = None
+
+    def start_browsers(self):
+        """Warm the pool: one login (or a saved session) cloned into every browser."""
+        import drivers
+        import flows
+        import retry
+        import session
+
+        self.retries = retry.RetryQueue()
+
+        first = drivers.create_driver()
+        first.maximize_window()
+        self.drivers.append(first)
+        if self.session_path and os.path.exists(self.session_path):
+            state = session.load(self.session_path)
+            session.import_session(first, state)
+        else:
+            flows.login(first)
+            state = session.export_session(first)
+            if self.session_path:
+                session.save(state, self.session_path)
+        for _ in range(self.workers - 1):
+            driver = drivers.create_driver()
+            driver.maximize_window()
+            session.import_session(driver, state)
+            self.drivers.append(driver)
+        for slot in range(len(self.drivers)):
+            threading.Thread(target=self._worker, args=(slot,), name=f"worker-{slot + 1}", daemon=True).start()
+
+    def _worker(self, slot):
+        import browserwatch
+        import drivers
+        import flows
+        import retry
+
+        driver = self.drivers[slot]
+        drivers.bind_thread(driver)
+        watch = browserwatch.Watchdog()
+        while not self.stopping.is_set():
+            # A retry whose backoff has elapsed goes before queued items
+            item = self.retries.pop_due()
+            if item is not None:
+                _, index, job = item
+                driver, ok, error = retry.attempt(driver, job.flow, index, watch)
+            else:
+                try:
+                    job, index = self.items.get(timeout=1)
+                except queue.Empty:
+                    continue
+                with self.lock:
+                    if job.first_action is None:
+                        job.first_action = time.time()
+                ok, error = flows.run_item(driver, job.flow, index)
+            if ok:
+                self.retries.done(job.flow, index, job)
+                retrying = False
+            else:
+                retrying = self.retries.park(job.flow, index, error, job)
+            with self.lock:
+                if ok:
+                    # Submitted with failed steps: done, never posted again
+                    job.ok += 1
+                    job.partial += error == flows.PARTIAL
+                elif retrying:
+                    job.retried += 1
+                else:
+                    job.failed += 1
+                if job.ok + job.failed >= job.count:
+                    job.finished = time.time()
+                    log(f"✓ Job {job.id} ({job.flow} x{job.count}) finished: "
+                        f"{job.ok} ok, {job.failed} failed in {job.finished - job.submitted:.1f}s")
+            if not ok and not retrying:
+                log(f"✗ Job {job.id} {job.flow} #{index} failed ({error})")
+            driver = self.drivers[slot] = watch.check(driver)
+
+    def submit(self, flow: str, count: int):
+        import flows
+
+        flows.load(flow)
+        job = Job(flow, count)
+        with self.lock:
+            self.jobs[job.id] = job
+        for index in range(1, count + 1):
+            self.items.put((job, index))
+        log(f"Accepted job {job.id}: {flow} x{count}")
+        return job.as_dict()
+
+    def status(self, job_id: int = None):
+        with self.lock:
+            if job_id is not None:
+                job = self.jobs.get(job_id)
+                return job.as_dict() if job else None
+            return {
+                "workers": len(self.drivers),
+                "queued_items": self.items.qsize(),
+                "parked_retries": len(self.retries),
+                "jobs": [job.as_dict() for job in self.jobs.values()],
+            }
+
+    def handle(self, request):
+        cmd = request.get("cmd")
+        if cmd == "submit":
+            return self.submit(request["flow"], int(request["count"]))
+        if cmd == "status":
+            return self.status(request.get("job"))
+        if cmd == "ping":
+            return "pong"
+        if cmd == "stop":
+            self.stopping.set()
+            return "stopping"
+        raise ValueError(f"Unknown command '{cmd}'")
+
+    def serve(self, host: str = HOST, port: int = PORT):
+        daemon = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                line = self.rfile.readline()
+                try:
+                    reply = {"result": daemon.handle(json.loads(line))}
+                except Exception as e:
+                    reply = {"error": f"{type(e).__name__}: {e}"}
+                self.wfile.write((json.dumps(reply) + "\n").encode("utf-8"))
+
+        socketserver.ThreadingTCPServer.allow_reuse_address = True
+        server = socketserver.ThreadingTCPServer((host, port), Handler)
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, name="daemon-socket", daemon=True).start()
+        log(f"✓ Daemon ready on {host}:{port} with {len(self.drivers)} warm browser(s)")
+        try:
+            while not self.stopping.wait(1):
+                pass
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.shutdown()
+            self.shutdown()
+
+    def shutdown(self):
+        import drivers
+
+        self.stopping.set()
+        for driver in self.drivers:
+            try:
+                drivers.release(driver)
+            except Exception:
+                pass
+        log("Daemon stopped")
+        log.flush()
+
+
+def request(payload, host: str = HOST, port: int = PORT, timeout: int = 10):
+    """Send one command to a running daemon and return its result."""
+    with socket.create_connection((host, port), timeout=timeout) as sock:
+        sock.sendall((json.dumps(payload) + "\n").encode("utf-8"))
+        data = b""
+        while not data.endswith(b"\n"):
+            chunk = sock.recv(65536)
+            if not chunk:
+                break
+            data += chunk
+    reply = json.loads(data)
+    if "error" in reply:
+        raise RuntimeError(reply["error"])
+    return reply["result"]
+
+
+def _show(job):
+    ttfa = job["time_to_first_action_ms"]
+    log(f"Job {job['id']} {job['flow']}: {job['state']} - {job['ok']}/{job['count']} ok "
+        f"({job['partial']} partial), {job['failed']} failed, {job['retried']} retried, {job['elapsed_seconds']}s"
+        + (f", first action after {ttfa}ms" if ttfa is not None else ""))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Resident HomeHNI automation daemon")
+    parser.add_argument("--port", type=int, default=PORT)
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("serve", help="start the daemon and keep browsers warm")
+    p.add_argument("--workers", type=int, default=DEFAULT_WORKERS)
+    p.add_argument("--session", help="reuse/save the logged-in session at this path")
+
+    p = sub.add_parser("submit", help="submit a batch")
+    p.add_argument("flow")
+    p.add_argument("count", type=int)
+    p.add_argument("--wait", action="store_true", help="poll until the batch is done")
+
+    p = sub.add_parser("status", help="show jobs")
+    p.add_argument("job", type=int, nargs="?")
+
+    sub.add_parser("stop", help="stop the daemon and close its browsers")
+
+    args = parser.parse_args()
+    try:
+        if args.command == "serve":
+            daemon = Daemon(args.workers, args.session)
+            daemon.start_browsers()
+            daemon.serve(port=args.port)
+        elif args.command == "submit":
+            job = request({"cmd": "submit", "flow": args.flow, "count": args.count}, port=args.port)
+            _show(job)
+            while args.wait and job["state"] != "done":
+                time.sleep(2)
+                job = request({"cmd": "status", "job": job["id"]}, port=args.port)
+                _show(job)
+        elif args.command == "status":
+            result = request({"cmd": "status", "job": args.job}, port=args.port)
+            if args.job is not None:
+                if result is None:
+                    log(f"✗ No job {args.job}")
+                else:
+                    _show(result)
+            else:
+                for job in result["jobs"]:
+                    _show(job)
+                log(f"{result['workers']} browser(s), {result['queued_items']} item(s) queued, "
+                    f"{result['parked_retries']} retry(ies) parked")
+        elif args.command == "stop":
+            log(request({"cmd": "stop"}, port=args.port))
+    except ConnectionRefusedError:
+        log(f"✗ No daemon listening on {HOST}:{args.port}; start one with: python daemon.py serve")
+    except RuntimeError as e:
+        log(f"✗ {e}")
+    log.flush()
+
+
+if __name__ == "__main__":
+    main()
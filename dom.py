@@ -0,0 +1,147 @@
+"""
+Module Name: dom.py
+
+Purpose:
+    In-page element queries. find_elements() followed by is_displayed() on
+    every match costs 1 + N WebDriver round trips; these helpers evaluate
+    the XPath, visibility and enabled-ness inside the page and return only
+    the matching handles (optionally with their text and attributes) in a
+    single command. click() likewise replaces the scrollIntoView / sleep /
+    JS click sequence with one command that waits in the page until the
+    element can actually take the click.
+
+Usage:
+    import dom
+
+    inputs = dom.visible(driver, "//input[@name='builtUpArea']")
+    combos = WebDriverWait(driver, 10).until(lambda d: dom.visible(d, "//button[@role='combobox']"))
+    for found in dom.query(driver, "//button", text=True, attrs=("class",)):
+        found.element, found.text, found.attrs["class"]
+
+    dom.click(driver, submit_button)                  # raises dom.ClickError with a diagnostic
+    problem = dom.try_click(driver, "//button[normalize-space()='Rent']")
+"""
+
+from collections import namedtuple
+
+from eventlog import get_logger
+
+log = get_logger("dom")
+
+# Configuration
+CLICK_TIMEOUT = 2.0       # seconds click() waits for the element to settle
+
+Found = namedtuple("Found", "element text attrs")
+
+# XPath matches filtered by rendered visibility (and optionally enabled-ness)
+_QUERY_JS = """
+const [xpath, root, enabledOnly, withText, attrs] = arguments;
+const found = document.evaluate(xpath, root || document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+const out = [];
+for (let i = 0; i < found.snapshotLength; i++) {
+    const el = found.snapshotItem(i);
+    if (!(el.offsetParent !== null || el.getClientRects().length)) continue;
+    const style = window.getComputedStyle(el);
+    if (style.visibility === 'hidden' || style.display === 'none' || style.opacity === '0') continue;
+    if (enabledOnly && (el.disabled || el.getAttribute('aria-disabled') === 'true')) continue;
+    if (!withText && !attrs.length) { out.push(el); continue; }
+    const values = {};
+    for (const name of attrs) values[name] = el.getAttribute(name);
+    out.push([el, withText ? el.innerText.trim() : null, values]);
+}
+return out;
+"""
+
+
+def query(driver, xpath: str, root=None, enabled: bool = False, text: bool = False, attrs=()):
+    """Visible matches of `xpath` as Found(element, text, attrs), in one round trip."""
+    rows = driver.execute_script(_QUERY_JS, xpath, root, enabled, text, list(attrs))
+    if not text and not attrs:
+        return [Found(el, None, {}) for el in rows]
+    return [Found(el, txt, values) for el, txt, values in rows]
+
+
+def visible(driver, xpath: str, root=None, enabled: bool = False):
+    """Visible (optionally also enabled) elements matching `xpath`, in one round trip."""
+    return driver.execute_script(_QUERY_JS, xpath, root, enabled, False, [])
+
+
+def first_visible(driver, xpath: str, root=None, enabled: bool = False):
+    """First visible match of `xpath`, or None."""
+    matches = visible(driver, xpath, root, enabled)
+    return matches[0] if matches else None
+
+
+class ClickError(Exception):
+    """Raised by click() when the element cannot be clicked; the message says why."""
+
+
+# Scroll into view, wait (bounded rAF loop) until the element is attached, enabled,
+# not moving and not covered, then click it -- all inside one WebDriver command.
+_CLICK_JS = """
+const [target, timeoutMs, force] = arguments;
+const done = arguments[arguments.length - 1];
+const el = typeof target === 'string'
+    ? document.evaluate(target, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue
+    : target;
+if (!el) return done({clicked: false, reason: 'no element matches ' + target, what: String(target)});
+const describe = (n) => !n ? 'nothing' : n.tagName.toLowerCase() + (n.id ? '#' + n.id : '')
+    + (typeof n.className === 'string' && n.className.trim() ? '.' + n.className.trim().split(/\\s+/).slice(0, 2).join('.') : '');
+const next = document.hidden ? (f) => setTimeout(f, 16) : (f) => requestAnimationFrame(f);
+const deadline = performance.now() + timeoutMs;
+let last = null, stable = 0;
+el.scrollIntoView({block: 'center', inline: 'center'});
+
+function problem() {
+    if (!el.isConnected) return 'detached from the page';
+    const r = el.getBoundingClientRect();
+    if (!r.width || !r.height) return 'not rendered (zero size)';
+    const style = window.getComputedStyle(el);
+    if (style.visibility === 'hidden' || style.pointerEvents === 'none') return 'not interactable';
+    if (el.disabled || el.getAttribute('aria-disabled') === 'true') return 'disabled';
+    const rect = [r.x, r.y, r.width, r.height].map(Math.round).join(',');
+    stable = rect === last ? stable + 1 : 0;
+    last = rect;
+    if (!stable) return 'still moving';
+    const hit = document.elementFromPoint(r.x + r.width / 2, r.y + r.height / 2);
+    if (hit && hit !== el && !el.contains(hit)) return 'covered by ' + describe(hit);
+    return null;
+}
+
+function attempt() {
+    const reason = problem();
+    if (!reason) { el.click(); return done({clicked: true, reason: null, what: describe(el)}); }
+    if (performance.now() < deadline) return next(attempt);
+    // A JS click still lands on a moving or overlapped element; the caller is told why it was forced
+    if (force && (reason === 'still moving' || reason.startsWith('covered by'))) {
+        el.click();
+        return done({clicked: true, reason: reason, what: describe(el)});
+    }
+    done({clicked: false, reason: reason, what: describe(el)});
+}
+next(attempt);
+"""
+
+
+def try_click(driver, target, timeout: float = CLICK_TIMEOUT, force: bool = True):
+    """
+    Scroll `target` (a WebElement or an XPath) into view, wait in the page until it
+    is stable, enabled and not covered, then click it, in one round trip.
+    Returns None when clicked, otherwise a diagnostic such as
+    "button.bg-red-600 is disabled" or "span is covered by div.fixed.inset-0".
+    With force=True an element that is still moving or covered when `timeout`
+    runs out is clicked anyway (as a plain JS click would) and a warning is logged.
+    """
+    result = driver.execute_async_script(_CLICK_JS, target, int(timeout * 1000), force)
+    if result["clicked"]:
+        if result["reason"]:
+            log(f"⚠️ Clicked {result['what']} although it is {result['reason']}")
+        return None
+    return f"{result['what']} is {result['reason']}"
+
+
+def click(driver, target, timeout: float = CLICK_TIMEOUT, force: bool = True):
+    """try_click() that raises ClickError with the diagnostic instead of returning it."""
+    problem = try_click(driver, target, timeout, force)
+    if problem:
+        raise ClickError(f"Cannot click: {problem}")
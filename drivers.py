@@ -0,0 +1,226 @@
+"""
+Module Name: drivers.py
+
+Purpose:
+    Pluggable WebDriver factory. Scripts call create_driver() instead of
+    webdriver.Chrome(); the environment decides whether that is a local
+    Chrome or a session on a Remote WebDriver / Selenium Grid. With several
+    Grid endpoints configured, new sessions are placed on the endpoint with
+    free slots and the lowest measured per-step latency, so capacity grows by
+    adding browser nodes without touching flow code.
+
+Usage:
+    from drivers import create_driver
+    driver = create_driver()
+
+    Environment:
+        HNI_DRIVER     local | remote (default: local, or remote if a grid URL is set)
+        HNI_GRID_URL   one or more comma-separated Grid/standalone URLs,
+                       e.g. http://localhost:4444,http://10.0.0.7:4444
+                       append '#N' to cap sessions on an endpoint without /status
+        HNI_HEADLESS   1 to run Chrome headless
+        HNI_BASE_URL   site under automation (default: https://homehni.in),
+                       e.g. a staging deploy or the benchsite.py stand-in
+        HNI_TRACE_COMMANDS  1 to attribute WebDriver round trips to steps (tracer.py)
+        HNI_PERFTRACE       1 to split step time into backend/script/render/idle (perftrace.py)
+        HNI_METRICS_PORT / HNI_METRICS_FILE  publish live Prometheus metrics (metrics.py)
+
+    A local standalone Grid for testing:
+        java -jar selenium-server-<version>.jar standalone --max-sessions 4
+"""
+
+import json
+import os
+import threading
+import time
+import urllib.request
+
+from selenium import webdriver
+
+import capture
+import eventlog
+import metrics
+import netblock
+import perftrace
+import tracer
+from eventlog import get_logger
+
+log = get_logger("drivers")
+
+# Configuration
+BASE_URL = os.environ.get("HNI_BASE_URL", "https://homehni.in").rstrip("/")
+STATUS_TIMEOUT = 5
+LATENCY_ALPHA = 0.2          # weight of the newest step in the moving average
+DEFAULT_STEP_MS = 5000.0     # assumed latency for endpoints with no samples yet
+PLACEMENT_WAIT_SECONDS = 300
+PLACEMENT_POLL_SECONDS = 5
+
+_thread_node = threading.local()
+
+
+def chrome_options():
+    options = webdriver.ChromeOptions()
+    if os.environ.get("HNI_HEADLESS") == "1":
+        options.add_argument("--headless=new")
+        options.add_argument("--window-size=1920,1080")
+    if perftrace.PERFTRACE:
+        perftrace.configure(options)
+    return options
+
+
+class GridNode:
+    """One Remote WebDriver endpoint (a hub, or a standalone Grid)."""
+
+    def __init__(self, spec: str):
+        url, _, cap = spec.strip().partition("#")
+        self.url = url.rstrip("/")
+        self.capacity = int(cap) if cap else None
+        self.open_sessions = 0
+        self.step_ms = None
+        self.lock = threading.Lock()
+
+    def free_slots(self):
+        """Free slots reported by /status, or capacity minus our own sessions."""
+        try:
+            with urllib.request.urlopen(f"{self.url}/status", timeout=STATUS_TIMEOUT) as resp:
+                status = json.loads(resp.read().decode("utf-8")).get("value", {})
+        except Exception:
+            if self.capacity is None:
+                return 0
+            return max(0, self.capacity - self.open_sessions)
+        if not status.get("ready", True) and not status.get("nodes"):
+            return 0
+        nodes = status.get("nodes")
+        if nodes is None:
+            # Plain Remote WebDriver (chromedriver --port) has no slot information
+            return max(0, (self.capacity or 1) - self.open_sessions)
+        free = 0
+        for node in nodes:
+            if node.get("availability", "UP") != "UP":
+                continue
+            free += sum(1 for slot in node.get("slots", []) if not slot.get("session"))
+        return free
+
+    def observe(self, duration_ms: float):
+        with self.lock:
+            if self.step_ms is None:
+                self.step_ms = duration_ms
+            else:
+                self.step_ms += LATENCY_ALPHA * (duration_ms - self.step_ms)
+
+
+class NodeScheduler:
+    """Places new sessions by free slots weighted by measured step latency."""
+
+    def __init__(self, specs):
+        self.nodes = [GridNode(s) for s in specs if s.strip()]
+        self.lock = threading.Lock()
+        eventlog.subscribe(self._on_event)
+
+    def _on_event(self, event):
+        if event.get("event") != "step_end" or event.get("duration_ms") is None:
+            return
+        node = getattr(_thread_node, "node", None)
+        if node is not None:
+            node.observe(event["duration_ms"])
+
+    def pick(self):
+        """Best node right now, or None when the whole fleet is full."""
+        best, best_score = None, 0.0
+        for node in self.nodes:
+            free = node.free_slots()
+            if free <= 0:
+                continue
+            # More free slots and faster steps both make a node more attractive
+            score = free / (node.step_ms or DEFAULT_STEP_MS)
+            if score > best_score:
+                best, best_score = node, score
+        return best
+
+    def create(self, options):
+        deadline = time.time() + PLACEMENT_WAIT_SECONDS
+        while True:
+            with self.lock:
+                node = self.pick()
+                if node is not None:
+                    node.open_sessions += 1
+            if node is not None:
+                break
+            if time.time() > deadline:
+                raise RuntimeError("No Grid endpoint has a free browser slot")
+            time.sleep(PLACEMENT_POLL_SECONDS)
+        try:
+            driver = webdriver.Remote(command_executor=node.url, options=options)
+        except Exception:
+            node.open_sessions -= 1
+            raise
+        driver._hni_node = node
+        bind_thread(driver)
+        latency = f"{node.step_ms:.0f}ms/step" if node.step_ms else "no samples yet"
+        log(f"✓ Session placed on {node.url} ({latency})")
+        return driver
+
+    def report(self):
+        return [
+            {"url": n.url, "open_sessions": n.open_sessions, "step_ms": n.step_ms}
+            for n in self.nodes
+        ]
+
+
+_scheduler = None
+_scheduler_lock = threading.Lock()
+
+
+def scheduler():
+    """Process-wide scheduler built from HNI_GRID_URL (None when running locally)."""
+    global _scheduler
+    specs = [s for s in os.environ.get("HNI_GRID_URL", "").split(",") if s.strip()]
+    if not specs:
+        return None
+    with _scheduler_lock:
+        if _scheduler is None:
+            _scheduler = NodeScheduler(specs)
+    return _scheduler
+
+
+def bind_thread(driver):
+    """Make `driver` the calling thread's browser for latency, capture and request blocking."""
+    _thread_node.node = getattr(driver, "_hni_node", None)
+    capture.attach(driver)
+    netblock.attach(driver)
+    if tracer.TRACE_COMMANDS:
+        tracer.attach(driver)
+    if perftrace.PERFTRACE:
+        perftrace.attach(driver)
+
+
+def create_driver(backend: str = None, options=None):
+    """Create a browser session on the configured backend."""
+    options = options or chrome_options()
+    backend = backend or os.environ.get("HNI_DRIVER") or ("remote" if scheduler() else "local")
+    if metrics.METRICS:
+        metrics.start()
+    if backend == "local":
+        driver = webdriver.Chrome(options=options)
+        bind_thread(driver)
+    elif backend == "remote":
+        sched = scheduler()
+        if sched is None:
+            raise RuntimeError("HNI_DRIVER=remote needs HNI_GRID_URL")
+        driver = sched.create(options)
+    else:
+        raise ValueError(f"Unknown driver backend '{backend}' (expected local or remote)")
+    metrics.session_opened()
+    return driver
+
+
+def release(driver):
+    """Quit a driver and free its slot in the scheduler's bookkeeping."""
+    node = getattr(driver, "_hni_node", None)
+    try:
+        driver.quit()
+    finally:
+        metrics.session_closed()
+        if node is not None:
+            with node.lock:
+                node.open_sessions = max(0, node.open_sessions - 1)
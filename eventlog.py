@@ -0,0 +1,376 @@
+"""
+Module Name: eventlog.py
+
+Purpose:
+    Structured, buffered event log shared by all HomeHNI automation scripts.
+    Flow code calls a print-compatible logger; every message becomes an event
+    with flow, listing index, step, field, outcome and duration_ms. Events are
+    queued and written by one background thread to a rotating JSON-lines file
+    and rendered for humans on the console, so many workers never contend on
+    stdout or block on disk.
+
+Usage:
+    from eventlog import get_logger
+    log = get_logger("rent")
+
+    @log.step
+    def fill_amenities(driver):
+        log("✓ Gym selected: Yes")          # outcome "ok", field "Gym"
+
+    with log.listing(3):
+        fill_amenities(driver)
+
+    Environment:
+        HNI_LOG_DIR        directory for events.jsonl (default: runs)
+        HNI_LOG_MAX_BYTES  rotate after this many bytes (default: 20 MB)
+        HNI_LOG_BACKUPS    rotated files to keep (default: 5)
+        HNI_CONSOLE        all | steps | warn | fail | off (default: all)
+"""
+
+import atexit
+import json
+import os
+import queue
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from functools import wraps
+
+# Configuration
+LOG_DIR = os.environ.get("HNI_LOG_DIR", "runs")
+LOG_FILE = "events.jsonl"
+MAX_BYTES = int(os.environ.get("HNI_LOG_MAX_BYTES", str(20 * 1024 * 1024)))
+BACKUP_COUNT = int(os.environ.get("HNI_LOG_BACKUPS", "5"))
+CONSOLE_MODE = os.environ.get("HNI_CONSOLE", "all")
+RUN_ID = os.environ.get("HNI_RUN_ID") or f"{datetime.now():%Y%m%d-%H%M%S}-{os.getpid()}"
+
+# Leading glyphs used throughout the flows, mapped to an outcome
+OUTCOME_PREFIXES = (
+    ("✓", "ok"),
+    ("✗", "fail"),
+    ("⚠️", "warn"),
+    ("⚠", "warn"),
+    ("↻", "retry"),
+)
+
+# Console verbosity per mode: which outcomes get rendered
+_CONSOLE_OUTCOMES = {
+    "warn": {"warn", "fail"},
+    "fail": {"fail"},
+}
+
+_ctx = threading.local()
+_listeners = []
+
+
+def _context():
+    """Return the per-thread context dict (flow, listing, step, ...)."""
+    state = getattr(_ctx, "state", None)
+    if state is None:
+        state = {"flow": None, "listing": None, "steps": [], "last": None, "failures": 0, "submits": 0}
+        _ctx.state = state
+    return state
+
+
+def current():
+    """Return (flow, listing, step) for the calling thread."""
+    state = _context()
+    step = state["steps"][-1][0] if state["steps"] else None
+    return state["flow"], state["listing"], step
+
+
+def failures() -> int:
+    """Failed steps and ✗ messages counted on the calling thread so far."""
+    return _context()["failures"]
+
+
+def submits() -> int:
+    """Items the calling thread has submitted so far (see mark_submitted)."""
+    return _context()["submits"]
+
+
+def mark_submitted(**fields):
+    """Record that the current item reached the backend, so runners never post it twice."""
+    _context()["submits"] += 1
+    emit("submitted", **fields)
+
+
+def set_flow(flow):
+    """Bind the calling thread to a flow name (used by pools running many flows)."""
+    _context()["flow"] = flow
+
+
+def subscribe(listener):
+    """Register listener(event) called on the emitting thread; it must be quick."""
+    if listener not in _listeners:
+        _listeners.append(listener)
+
+
+def unsubscribe(listener):
+    if listener in _listeners:
+        _listeners.remove(listener)
+
+
+def classify(message: str):
+    """Split a '✓ Gym selected: Yes' style message into (outcome, field)."""
+    text = message.strip()
+    outcome = "info"
+    for prefix, name in OUTCOME_PREFIXES:
+        if text.startswith(prefix):
+            outcome = name
+            text = text[len(prefix):].strip()
+            break
+    if outcome == "info":
+        return outcome, None
+    field = text.split(":", 1)[0]
+    for word in (" filled", " selected", " set to", " clicked", " button", " checkbox", " dropdown", " field"):
+        cut = field.find(word)
+        if cut > 0:
+            field = field[:cut]
+            break
+    for lead in ("Could not find ", "Could not fill ", "Could not select ", "Could not click ", "Could not "):
+        if field.startswith(lead):
+            field = field[len(lead):]
+            break
+    return outcome, field.strip() or None
+
+
+class _Sink:
+    """Background writer: JSONL file with size rotation plus console renderer."""
+
+    def __init__(self):
+        self._queue = queue.SimpleQueue()
+        self._thread = None
+        self._lock = threading.Lock()
+        self._file = None
+        self._path = os.path.join(LOG_DIR, LOG_FILE)
+
+    def put(self, event):
+        if self._thread is None:
+            self._start()
+        self._queue.put(event)
+
+    def flush(self, timeout: float = 5.0):
+        """Block until everything queued so far is written and rendered."""
+        if self._thread is None:
+            return
+        done = threading.Event()
+        self._queue.put(done)
+        done.wait(timeout)
+
+    def _start(self):
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(target=self._run, name="eventlog-writer", daemon=True)
+            self._thread.start()
+            atexit.register(self.flush)
+
+    def _open(self):
+        os.makedirs(LOG_DIR, exist_ok=True)
+        self._file = open(self._path, "a", encoding="utf-8")
+
+    def _rotate(self):
+        self._file.close()
+        for n in range(BACKUP_COUNT - 1, 0, -1):
+            src = f"{self._path}.{n}"
+            if os.path.exists(src):
+                os.replace(src, f"{self._path}.{n + 1}")
+        if BACKUP_COUNT > 0:
+            os.replace(self._path, f"{self._path}.1")
+        else:
+            os.remove(self._path)
+        self._open()
+
+    def _run(self):
+        while True:
+            batch = [self._queue.get()]
+            # Drain whatever else is waiting so one write/flush covers many events
+            while len(batch) < 1000:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            waiters = [item for item in batch if isinstance(item, threading.Event)]
+            events = [item for item in batch if not isinstance(item, threading.Event)]
+            try:
+                self._write(events)
+            except Exception as e:
+                sys.stderr.write(f"eventlog: write failed: {e}\n")
+            for waiter in waiters:
+                waiter.set()
+
+    def _write(self, events):
+        if not events:
+            return
+        if self._file is None:
+            self._open()
+        lines = []
+        rendered = []
+        for event in events:
+            lines.append(json.dumps(event, ensure_ascii=False, default=str))
+            text = render(event)
+            if text is not None:
+                rendered.append(text)
+        self._file.write("\n".join(lines) + "\n")
+        self._file.flush()
+        if self._file.tell() >= MAX_BYTES:
+            self._rotate()
+        if rendered:
+            sys.stdout.write("\n".join(rendered) + "\n")
+            sys.stdout.flush()
+
+
+def render(event):
+    """Human console line for an event, or None if the console mode hides it."""
+    if CONSOLE_MODE == "off":
+        return None
+    kind = event.get("event")
+    outcome = event.get("outcome")
+    if kind != "message" and CONSOLE_MODE != "steps":
+        return None
+    if CONSOLE_MODE in _CONSOLE_OUTCOMES and outcome not in _CONSOLE_OUTCOMES[CONSOLE_MODE]:
+        return None
+    if kind == "message":
+        text = event.get("msg", "")
+    elif kind == "step_end":
+        text = f"⏱  {event.get('step')} {outcome} in {event.get('duration_ms')}ms"
+    elif kind == "listing_end":
+        text = f"⏱  listing {event.get('listing')} {outcome} in {event.get('duration_ms')}ms"
+    else:
+        return None
+    # Only prefix lines when several workers share the console
+    if event.get("worker") != "MainThread":
+        tag = event.get("flow") or "-"
+        if event.get("listing") is not None:
+            tag += f" #{event['listing']}"
+        text = f"[{event.get('worker')} {tag}] {text}"
+    return text
+
+
+_sink = _Sink()
+
+
+def emit(event_type: str, **fields):
+    """Emit one event enriched with the calling thread's context."""
+    state = _context()
+    flow, listing, step = current()
+    event = {
+        "ts": round(time.time(), 3),
+        "run": RUN_ID,
+        "worker": threading.current_thread().name,
+        "event": event_type,
+        "flow": flow,
+        "listing": listing,
+        "step": step,
+    }
+    event.update(fields)
+    if event_type == "message" and event.get("outcome") == "fail":
+        state["failures"] += 1
+    for listener in list(_listeners):
+        try:
+            listener(event)
+        except Exception:
+            pass
+    _sink.put(event)
+    return event
+
+
+def flush():
+    """Wait for queued events to reach disk and console (call before input())."""
+    _sink.flush()
+
+
+class FlowLogger:
+    """Print-compatible logger bound to one flow name."""
+
+    def __init__(self, flow: str):
+        self.flow = flow
+
+    def __call__(self, *args, sep=" ", field=None, **extra):
+        state = _context()
+        if state["flow"] is None or not state["steps"]:
+            state["flow"] = self.flow
+        message = sep.join(str(a) for a in args)
+        outcome, guessed = classify(message)
+        now = time.perf_counter()
+        last = state["last"]
+        duration = round((now - last) * 1000, 1) if last is not None and state["steps"] else None
+        state["last"] = now
+        emit("message", field=field or guessed, outcome=outcome, duration_ms=duration, msg=message, **extra)
+
+    def step(self, func):
+        """Decorator: time a flow step and mark its boundaries in the log."""
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with self.step_scope(func.__name__) as scope:
+                result = func(*args, **kwargs)
+                # Service steps report failure by returning False
+                if result is False:
+                    scope["failed"] = True
+                return result
+        return wrapper
+
+    @contextmanager
+    def step_scope(self, name: str):
+        state = _context()
+        state["flow"] = self.flow
+        start = time.perf_counter()
+        failures_before = state["failures"]
+        state["steps"].append((name, start))
+        state["last"] = start
+        emit("step_start")
+        scope = {"failed": False}
+        outcome = "ok"
+        try:
+            yield scope
+        except BaseException as e:
+            outcome = "error"
+            emit("step_error", error=type(e).__name__, msg=str(e)[:500])
+            raise
+        finally:
+            if outcome == "ok" and scope["failed"] and state["failures"] == failures_before:
+                # A silent False return still counts towards the listing's failures
+                state["failures"] += 1
+            if outcome == "ok" and state["failures"] > failures_before:
+                outcome = "fail"
+            duration = round((time.perf_counter() - start) * 1000, 1)
+            emit("step_end", outcome=outcome, duration_ms=duration,
+                 failures=state["failures"] - failures_before)
+            state["steps"].pop()
+            state["last"] = time.perf_counter()
+
+    @contextmanager
+    def listing(self, index):
+        """Attribute everything inside to one listing/lead index."""
+        state = _context()
+        previous = (state["flow"], state["listing"])
+        state["flow"] = self.flow
+        state["listing"] = index
+        start = time.perf_counter()
+        failures_before = state["failures"]
+        emit("listing_start")
+        outcome = "ok"
+        try:
+            yield
+        except BaseException as e:
+            outcome = "error"
+            emit("listing_error", error=type(e).__name__, msg=str(e)[:500])
+            raise
+        finally:
+            if outcome == "ok" and state["failures"] > failures_before:
+                outcome = "partial"
+            duration = round((time.perf_counter() - start) * 1000, 1)
+            emit("listing_end", outcome=outcome, duration_ms=duration,
+                 failures=state["failures"] - failures_before)
+            state["flow"], state["listing"] = previous
+
+    @staticmethod
+    def flush():
+        flush()
+
+
+def get_logger(flow: str) -> FlowLogger:
+    return FlowLogger(flow)
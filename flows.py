@@ -0,0 +1,159 @@
+"""
+Module Name: flows.py
+
+Purpose:
+    Registry of the HomeHNI posting flows and Services lead forms so that
+    runners other than each script's own main() (queue workers, the
+    orchestrator, the daemon) can drive any flow one listing or lead at a
+    time on an already logged-in browser.
+
+Usage:
+    import flows
+    flows.login(driver, "commercial_rent")
+    ok, note = flows.run_item(driver, "commercial_rent", 17)   # note: error class, flows.PARTIAL or None
+    ok, note = flows.run_item(driver, "loans", 3)
+
+    Environment:
+        HNI_SERVICES_URL   page hosting the Services tabs (default: HNI_BASE_URL + /services)
+"""
+
+import importlib
+import os
+
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+
+from drivers import BASE_URL
+import dom
+import eventlog
+
+HOME_URL = f"{BASE_URL}/"
+POST_PROPERTY_URL = f"{BASE_URL}/post-property"
+SERVICES_URL = os.environ.get("HNI_SERVICES_URL", f"{BASE_URL}/services")
+PARTIAL = "partial"       # run_item note: submitted, but some steps logged ✗
+FIRST_PAGE_XPATH = (
+    "//button[@role='combobox' and contains(., 'Select city')]"
+    " | //button[contains(., 'Start Posting Your Ad For FREE')]"
+)
+
+# Flow name -> script module exposing run_full_post_flow(driver, index)
+POSTING_FLOWS = {
+    "rent": "Rent",
+    "sale": "sale",
+    "pg": "pg",
+    "commercial_rent": "Commercial_Rent",
+    "commercial_sale": "Commercial_Sale",
+    "industrial": "Industrial",
+    "agricultural": "agricultural",
+    "commercial_land": "commercial_land",
+    "stress_rent": "a",
+}
+
+# Flow name -> Services script exposing submit_request(driver, index),
+# wait_for_form_reset(driver), SERVICE_TAB and FORM_FIELD_ID
+SERVICE_FLOWS = {
+    "loans": "loans",
+    "packers": "Packer",
+    "handover": "handover",
+    "home_security": "homeservices",
+    "property_management": "propmanage",
+    "architect": "architect",
+}
+
+
+def names():
+    return list(POSTING_FLOWS) + list(SERVICE_FLOWS)
+
+
+def is_service(flow: str) -> bool:
+    return flow in SERVICE_FLOWS
+
+
+def load(flow: str):
+    """Import the script module behind a flow name."""
+    module = POSTING_FLOWS.get(flow) or SERVICE_FLOWS.get(flow)
+    if module is None:
+        raise ValueError(f"Unknown flow '{flow}'. Known flows: {', '.join(names())}")
+    return importlib.import_module(module)
+
+
+def login(driver, flow: str = None):
+    """Open HomeHNI and wait for the manual login, exactly as the script would."""
+    if flow in POSTING_FLOWS:
+        load(flow).login_and_wait(driver)
+        return
+    driver.get(HOME_URL)
+    input("Please log in (if needed) in THIS browser window, then press Enter here to continue...")
+
+
+def ensure_post_page(driver, timeout: int = 20):
+    """Make sure the browser is on a fresh first page of the posting wizard."""
+    if driver.find_elements(By.XPATH, "//button[contains(., 'Start Posting Your Ad For FREE')]"):
+        return
+    driver.get(POST_PROPERTY_URL)
+    WebDriverWait(driver, timeout).until(
+        EC.presence_of_element_located((By.XPATH, FIRST_PAGE_XPATH))
+    )
+
+
+def open_service_form(driver, module, timeout: int = 15):
+    """Show a Services form: stay put if it is on screen, else open its tab."""
+    if dom.visible(driver, f"//*[@id='{module.FORM_FIELD_ID}']"):
+        return
+    if "/services" not in driver.current_url:
+        driver.get(SERVICES_URL)
+    tab = WebDriverWait(driver, timeout).until(
+        EC.element_to_be_clickable(
+            (By.XPATH, f"//button[.//span[normalize-space()='{module.SERVICE_TAB}'] or normalize-space()='{module.SERVICE_TAB}']")
+        )
+    )
+    dom.click(driver, tab)
+    WebDriverWait(driver, timeout).until(
+        EC.visibility_of_element_located((By.ID, module.FORM_FIELD_ID))
+    )
+
+
+def run_lead(driver, flow: str, index: int):
+    """Submit one Services lead and wait for the form to reset for the next one."""
+    module = load(flow)
+    failures_before = eventlog.failures()
+    submitted, error = False, None
+    try:
+        open_service_form(driver, module)
+        # submit_request is True once the submit click went through
+        submitted = module.submit_request(driver, index)
+        if submitted:
+            module.wait_for_form_reset(driver, timeout=10)
+    except Exception as e:
+        error = type(e).__name__
+    if not submitted:
+        return False, error or "LeadFailed"
+    return True, (PARTIAL if error or eventlog.failures() > failures_before else None)
+
+
+def run_item(driver, flow: str, index: int):
+    """Post one listing or lead.
+
+    Returns (ok, note). ok means the item reached the backend and must not be
+    run again; note is then PARTIAL when some steps logged ✗ on the way, else
+    None. When ok is False, note is the error class.
+    """
+    if is_service(flow):
+        return run_lead(driver, flow, index)
+    module = load(flow)
+    failures_before = eventlog.failures()
+    submits_before = eventlog.submits()
+    result, error = None, None
+    try:
+        ensure_post_page(driver)
+        result = module.run_full_post_flow(driver, index)
+    except Exception as e:
+        error = type(e).__name__
+    # Submit Property reports itself through waits.acknowledged(submit=True)
+    if eventlog.submits() == submits_before:
+        # Rent.py returns None; an explicit False means the flow gave up
+        return False, error or ("FlowFailed" if result is False else "NotSubmitted")
+    if error or result is False or eventlog.failures() > failures_before:
+        return True, PARTIAL
+    return True, None
@@ -0,0 +1,355 @@
+"""
+Module Name: forms.py
+
+Purpose:
+    Form helpers shared by the posting and Services flows. A form snapshot
+    reads the current value of every field a step cares about in a single
+    in-page call, so a step only clears and types into fields whose value
+    differs from the record. Pre-filled fields (Name and Mobile on the first
+    page) and pages resumed after a retry cost no interactions at all.
+
+Usage:
+    import forms
+
+    forms.fill_fields(driver, {
+        "Property Name": ("//input[@placeholder='Enter Property Name']", property_name),
+        "Built Up Area": ("//input[@name='superBuiltUpArea']", BUILT_UP_AREA),
+    })
+    # ✓ Property Name already set: Sunrise Residency
+    # ✓ Built Up Area filled: 1200
+
+    # Counters: read, adjust by the delta and verify in one async call
+    forms.set_stepper(driver, plus_button, 2, "Bathrooms")
+
+    # Long text: native value setter + input/change events, read back,
+    # keystrokes only as a fallback (or when keys=True)
+    forms.set_text(driver, description_textarea, DESCRIPTION)
+
+    # Whole wizard page from a spec: plain fields in one batched call,
+    # then only the comboboxes interactively
+    forms.fill_page(driver, "pg.room_details", {
+        "Expected Rent": (forms.NUMBER, "//input[@id='single-rent']", EXPECTED_RENT),
+        "Cupboard": (forms.CHECKBOX, "//button[@id='cupboard']", True),
+        "Gated Property?": (forms.COMBOBOX, "//button[@role='combobox']", forms.RANDOM),
+    })
+
+    Environment:
+        HNI_TYPE_KEYS   1 to type every set_text() value key by key (default: native setter)
+"""
+
+import os
+
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.support.ui import WebDriverWait
+
+import dom
+import options
+from eventlog import get_logger
+
+log = get_logger("forms")
+
+# Configuration
+PAGE_TIMEOUT = 10         # seconds fill_page waits for a page's fields to render
+TYPE_KEYS = os.environ.get("HNI_TYPE_KEYS") == "1"
+
+# Statuses returned by fill_fields and fill_page
+KEPT = "kept"
+FILLED = "filled"
+MISSING = "missing"
+MISMATCH = "mismatch"
+
+# Field kinds in page specs
+TEXT = "text"
+NUMBER = "number"
+TEXTAREA = "textarea"
+CHECKBOX = "checkbox"
+COMBOBOX = "combobox"
+BATCHED_KINDS = (TEXT, NUMBER, TEXTAREA, CHECKBOX)
+
+# Combobox values that pick from the option catalog instead of naming an option
+FIRST = "first"
+RANDOM = "random"
+
+# First visible match of each XPath with its current value, in one round trip
+_SNAPSHOT_JS = """
+const result = [];
+for (const xpath of arguments[0]) {
+    const found = document.evaluate(xpath, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    let el = null;
+    for (let i = 0; i < found.snapshotLength; i++) {
+        const node = found.snapshotItem(i);
+        if (node.offsetParent !== null || node.getClientRects().length) { el = node; break; }
+    }
+    if (!el) { result.push(null); continue; }
+    const checkable = el.type === 'checkbox' || el.type === 'radio';
+    result.push({element: el, value: checkable ? el.checked : el.value, checkable: checkable});
+}
+return result;
+"""
+
+# Set every plain field of a page in one call. Text goes through the native value
+# setter plus input/change events so React-controlled inputs take it; checkboxes
+# (native or role=checkbox buttons) are clicked only when their state differs and
+# read back after yielding to the page, since React renders the new state after
+# the click handler returns. Each field reports kept / filled / missing / mismatch
+# (read-back differs).
+_FILL_JS = """
+const done = arguments[arguments.length - 1];
+const setValue = (el, value) => {
+    const setter = Object.getOwnPropertyDescriptor(Object.getPrototypeOf(el), 'value').set;
+    setter.call(el, value);
+    el.dispatchEvent(new Event('input', {bubbles: true}));
+    el.dispatchEvent(new Event('change', {bubbles: true}));
+};
+const isChecked = el => el.type === 'checkbox' || el.type === 'radio'
+    ? el.checked
+    : el.getAttribute('aria-checked') === 'true' || el.getAttribute('data-state') === 'checked';
+const find = xpath => {
+    const found = document.evaluate(xpath, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    for (let i = 0; i < found.snapshotLength; i++) {
+        const node = found.snapshotItem(i);
+        if (node.offsetParent !== null || node.getClientRects().length) return node;
+    }
+    return null;
+};
+const clicked = [];
+const results = arguments[0].map(([kind, xpath, value], index) => {
+    const el = find(xpath);
+    if (!el) return 'missing';
+    if (kind === 'checkbox') {
+        if (isChecked(el) === value) return 'kept';
+        el.click();
+        clicked.push([index, xpath, value]);
+        return 'filled';
+    }
+    if (el.value.trim() === value.trim()) return 'kept';
+    setValue(el, value);
+    return el.value === value ? 'filled' : 'mismatch';
+});
+const settle = () => new Promise(resolve => setTimeout(resolve, 0));
+// A re-render may replace the clicked node, so look it up again
+const pending = () => clicked.filter(([, xpath, value]) => { const el = find(xpath); return !el || isChecked(el) !== value; });
+(async () => {
+    for (let attempt = 0; attempt < 5 && pending().length; attempt++) await settle();
+    for (const [index] of pending()) results[index] = 'mismatch';
+    done(results);
+})().catch(e => done(results));
+"""
+
+# One field through the native value setter (what React's onChange listens to),
+# focused and blurred like a user edit; returns the value the field now holds
+_SET_TEXT_JS = """
+const [el, value] = arguments;
+const setter = Object.getOwnPropertyDescriptor(Object.getPrototypeOf(el), 'value').set;
+el.focus();
+setter.call(el, value);
+el.dispatchEvent(new Event('input', {bubbles: true}));
+el.dispatchEvent(new Event('change', {bubbles: true}));
+el.blur();
+return el.value;
+"""
+
+# Stepper: find the counter next to the "+" button, click +/- by the delta
+# (yielding to the page between clicks so React re-renders) and read it back
+_STEPPER_JS = """
+const plus = arguments[0], target = arguments[1], done = arguments[arguments.length - 1];
+const isMinus = b => /^[-\u2212]$/.test(b.textContent.trim()) || !!b.querySelector('[class*="lucide-minus"]');
+let box = plus.parentElement;
+while (box && box !== document.body && ![...box.querySelectorAll('button')].some(isMinus)) box = box.parentElement;
+const minus = box && box !== document.body ? [...box.querySelectorAll('button')].find(isMinus) : null;
+let display = null;
+if (box && box !== document.body) {
+    display = box.querySelector('input[type=number]') || [...box.querySelectorAll('*')].find(
+        el => !el.closest('button') && el.children.length === 0 && /^\\d+$/.test(el.textContent.trim()));
+}
+const read = () => {
+    if (!display) return null;
+    const n = parseInt(display.tagName === 'INPUT' ? display.value : display.textContent.trim(), 10);
+    return isNaN(n) ? 0 : n;
+};
+const settle = () => new Promise(resolve => setTimeout(resolve, 0));
+(async () => {
+    if (!display) {
+        for (let i = 0; i < target; i++) { plus.click(); await settle(); }
+        return done({value: null, before: null});
+    }
+    const before = read();
+    for (let attempt = 0; attempt < 3 && read() !== target; attempt++) {
+        const delta = target - read();
+        const button = delta > 0 ? plus : minus;
+        if (!button) break;
+        for (let i = 0; i < Math.abs(delta); i++) { button.click(); await settle(); }
+    }
+    done({value: read(), before: before});
+})().catch(e => done({error: String(e)}));
+"""
+
+
+def snapshot(driver, xpaths):
+    """Current state of each field: {xpath: {"element", "value", "checkable"} or None}."""
+    xpaths = list(xpaths)
+    values = driver.execute_script(_SNAPSHOT_JS, xpaths)
+    return dict(zip(xpaths, values))
+
+
+def _same(current, desired) -> bool:
+    if isinstance(desired, bool):
+        return bool(current) == desired
+    return str(current if current is not None else "").strip() == str(desired).strip()
+
+
+def diff(state, fields):
+    """Labels whose field is present but holds a different value than the record."""
+    return [
+        label for label, (xpath, value) in fields.items()
+        if state.get(xpath) is not None and not _same(state[xpath]["value"], value)
+    ]
+
+
+def fill_fields(driver, fields, timeout: int = 20):
+    """Bring fields to the desired values, touching only the ones that differ.
+
+    fields maps a label to (xpath, value); a bool value sets a checkbox/radio.
+    Waits up to `timeout` for all fields to appear and returns {label: status}.
+    """
+    xpaths = [xpath for xpath, _ in fields.values()]
+
+    def all_present(d):
+        state = snapshot(d, xpaths)
+        return state if all(state.values()) else False
+
+    try:
+        state = WebDriverWait(driver, timeout).until(all_present)
+    except TimeoutException:
+        state = snapshot(driver, xpaths)
+
+    changed = set(diff(state, fields))
+    statuses = {}
+    for label, (xpath, value) in fields.items():
+        field = state.get(xpath)
+        if field is None:
+            log(f"✗ Could not find {label} field")
+            statuses[label] = MISSING
+            continue
+        if label not in changed:
+            log(f"✓ {label} already set: {value}")
+            statuses[label] = KEPT
+            continue
+        element = field["element"]
+        if field["checkable"]:
+            driver.execute_script("arguments[0].click();", element)
+        else:
+            element.clear()
+            element.send_keys(str(value))
+        log(f"✓ {label} filled: {value}")
+        statuses[label] = FILLED
+    return statuses
+
+
+def set_text(driver, element, value: str, keys: bool = False) -> bool:
+    """Put `value` into a text input or textarea in one call and read it back.
+
+    Uses the native value setter with input/change events instead of typing
+    key by key. keys=True (for fields whose validation listens to real key
+    events) or a read-back mismatch falls back to clear() + send_keys().
+    Returns True when the field ends up holding `value`.
+    """
+    value = str(value)
+    if not (keys or TYPE_KEYS):
+        if driver.execute_script(_SET_TEXT_JS, element, value) == value:
+            return True
+        log(f"⚠️  Native value set did not stick, typing {len(value)} characters instead")
+    element.clear()
+    element.send_keys(value)
+    if element.get_attribute("value") != value:
+        log("✗ Field does not hold the typed value (trimmed or rejected by the page)")
+        return False
+    return True
+
+
+def set_stepper(driver, plus_button, target: int, label: str) -> bool:
+    """Set a +/- counter to `target` in one in-page call and verify the result."""
+    result = driver.execute_async_script(_STEPPER_JS, plus_button, int(target))
+    if result.get("error"):
+        log(f"✗ Could not set {label}: {result['error']}")
+        return False
+    value = result.get("value")
+    if value is None:
+        # No readable counter next to the buttons: clicked from zero, unverified
+        log(f"⚠️  {label} clicked to {target} (counter not readable)")
+        return True
+    if value != target:
+        log(f"✗ {label} is {value}, expected {target}")
+        return False
+    if result.get("before") == target:
+        log(f"✓ {label} already set: {target}")
+    else:
+        log(f"✓ {label} set to {target}")
+    return True
+
+
+def _select_combobox(driver, page: str, label: str, xpath: str, value, timeout: int):
+    """Open a combobox from a page spec and pick `value` (FIRST, RANDOM or an option text)."""
+    combobox = WebDriverWait(driver, timeout).until(lambda d: dom.first_visible(d, xpath))
+    if value in (FIRST, RANDOM):
+        return options.select(driver, combobox, f"{page}.{label}", strategy=value)
+    listbox_id = options.open_combobox(driver, combobox)
+    return value if options.click(driver, value, listbox_id) else None
+
+
+def fill_page(driver, page: str, spec, timeout: int = PAGE_TIMEOUT):
+    """Fill a wizard page from its spec and return {label: status}.
+
+    spec maps a label to (kind, xpath, value). TEXT, NUMBER, TEXTAREA and
+    CHECKBOX (bool value) fields are all set in one in-page call, retried
+    until every one of them has rendered or `timeout` runs out. COMBOBOX
+    fields are then opened one at a time; their value is FIRST or RANDOM
+    (chosen from the option catalog under "<page>.<label>") or an option text.
+    """
+    batched = [(label, kind, xpath, value) for label, (kind, xpath, value) in spec.items() if kind in BATCHED_KINDS]
+    fields = [[kind, xpath, value if kind == CHECKBOX else str(value)] for _, kind, xpath, value in batched]
+    results = []
+
+    def filled(d):
+        results[:] = d.execute_async_script(_FILL_JS, fields)
+        return MISSING not in results
+
+    if fields:
+        try:
+            WebDriverWait(driver, timeout, poll_frequency=0.25).until(filled)
+        except TimeoutException:
+            pass
+
+    statuses = {}
+    for (label, kind, _, value), status in zip(batched, results):
+        statuses[label] = status
+        if status == KEPT:
+            log(f"✓ {label} already set: {value}")
+        elif status == FILLED:
+            log(f"✓ {label} filled: {value}")
+        elif status == MISSING:
+            log(f"✗ Could not find {label} field")
+        else:
+            log(f"✗ {label} did not take the value {value!r}")
+
+    for label, (kind, xpath, value) in spec.items():
+        if kind != COMBOBOX:
+            continue
+        # Each combobox fails on its own; a stale or unclickable trigger must not abort the page
+        try:
+            text = _select_combobox(driver, page, label, xpath, value, timeout)
+        except TimeoutException:
+            log(f"✗ Could not find {label} combobox")
+            statuses[label] = MISSING
+            continue
+        except Exception as e:
+            log(f"✗ Could not select {label}: {type(e).__name__}")
+            statuses[label] = MISMATCH
+            continue
+        if text:
+            log(f"✓ {label} selected: {text}")
+            statuses[label] = FILLED
+        else:
+            log(f"✗ Could not select {label}")
+            statuses[label] = MISMATCH
+    return statuses
@@ -0,0 +1,380 @@
+"""
+Module Name: jobqueue.py
+
+Purpose:
+    Durable job queue so a posting run can be sharded across many machines.
+    A coordinator stores one job per listing in SQLite; any number of worker
+    nodes lease jobs, heartbeat while a listing is being posted and report the
+    result. Leases that stop heartbeating (crashed worker, killed Chrome) expire
+    and go back to the queue, so fleet throughput grows with node count.
+
+Usage:
+    # Put 10,000 Commercial Rent listings on the queue
+    python jobqueue.py enqueue commercial_rent 10000
+
+    # Serve the queue to other machines (plain HTTP + JSON, no extra packages)
+    python jobqueue.py serve --host 0.0.0.0 --port 8765
+
+    # On every worker node (log in once in the browser it opens)
+    python jobqueue.py worker --coordinator http://coordinator-host:8765
+    python jobqueue.py worker --db runs/queue.sqlite      # same machine
+
+    python jobqueue.py status
+"""
+
+import argparse
+import json
+import os
+import socket
+import sqlite3
+import threading
+import time
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from eventlog import get_logger
+
+log = get_logger("jobqueue")
+
+# Configuration
+DEFAULT_DB = os.path.join("runs", "queue.sqlite")
+DEFAULT_PORT = 8765
+LEASE_SECONDS = 300       # a listing normally finishes well within 5 minutes
+HEARTBEAT_SECONDS = 30
+MAX_ATTEMPTS = 3
+IDLE_POLL_SECONDS = 5
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    run TEXT NOT NULL,
+    flow TEXT NOT NULL,
+    item_index INTEGER NOT NULL,
+    state TEXT NOT NULL DEFAULT 'queued',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    worker TEXT,
+    lease_expires REAL,
+    error TEXT,
+    created REAL NOT NULL,
+    updated REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS jobs_state ON jobs (state, lease_expires);
+"""
+
+
+class SqliteQueue:
+    """Lease-based queue on a single SQLite file (one connection per call)."""
+
+    def __init__(self, path: str = DEFAULT_DB, max_attempts: int = MAX_ATTEMPTS):
+        self.path = path
+        self.max_attempts = max_attempts
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        with self._connect() as conn:
+            conn.executescript(SCHEMA)
+
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        return conn
+
+    def enqueue(self, flow: str, count: int, run: str = None, start: int = 1):
+        run = run or f"{flow}-{time.strftime('%Y%m%d-%H%M%S')}"
+        now = time.time()
+        rows = [(run, flow, i, now, now) for i in range(start, start + count)]
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.executemany(
+                "INSERT INTO jobs (run, flow, item_index, created, updated) VALUES (?, ?, ?, ?, ?)",
+                rows,
+            )
+            conn.execute("COMMIT")
+        finally:
+            conn.close()
+        return {"run": run, "enqueued": count}
+
+    def _requeue_expired(self, conn, now):
+        conn.execute(
+            "UPDATE jobs SET state='failed', error='LeaseExpired', worker=NULL, updated=? "
+            "WHERE state='leased' AND lease_expires < ? AND attempts >= ?",
+            (now, now, self.max_attempts),
+        )
+        conn.execute(
+            "UPDATE jobs SET state='queued', worker=NULL, lease_expires=NULL, updated=? "
+            "WHERE state='leased' AND lease_expires < ?",
+            (now, now),
+        )
+
+    def lease(self, worker: str, flows=None, lease_seconds: int = LEASE_SECONDS):
+        """Atomically take the oldest queued job; returns a dict or None."""
+        now = time.time()
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            self._requeue_expired(conn, now)
+            query = "SELECT * FROM jobs WHERE state='queued'"
+            params = []
+            if flows:
+                query += f" AND flow IN ({','.join('?' for _ in flows)})"
+                params.extend(flows)
+            row = conn.execute(query + " ORDER BY id LIMIT 1", params).fetchone()
+            if row is None:
+                conn.execute("COMMIT")
+                return None
+            conn.execute(
+                "UPDATE jobs SET state='leased', worker=?, attempts=attempts+1, "
+                "lease_expires=?, updated=? WHERE id=?",
+                (worker, now + lease_seconds, now, row["id"]),
+            )
+            conn.execute("COMMIT")
+            job = dict(row)
+            job.update(state="leased", worker=worker, attempts=job["attempts"] + 1)
+            return job
+        finally:
+            conn.close()
+
+    def heartbeat(self, job_id: int, worker: str, lease_seconds: int = LEASE_SECONDS):
+        """Extend a lease; False means the lease was lost and the job may run elsewhere."""
+        now = time.time()
+        conn = self._connect()
+        try:
+            cur = conn.execute(
+                "UPDATE jobs SET lease_expires=?, updated=? WHERE id=? AND worker=? AND state='leased'",
+                (now + lease_seconds, now, job_id, worker),
+            )
+            return cur.rowcount == 1
+        finally:
+            conn.close()
+
+    def complete(self, job_id: int, worker: str, ok: bool, error: str = None):
+        now = time.time()
+        conn = self._connect()
+        try:
+            conn.execute(
+                "UPDATE jobs SET state=?, error=?, lease_expires=NULL, updated=? "
+                "WHERE id=? AND worker=? AND state='leased'",
+                ("done" if ok else "failed", error, now, job_id, worker),
+            )
+        finally:
+            conn.close()
+        return True
+
+    def stats(self):
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            self._requeue_expired(conn, time.time())
+            conn.execute("COMMIT")
+            rows = conn.execute(
+                "SELECT run, flow, state, COUNT(*) AS n FROM jobs GROUP BY run, flow, state ORDER BY run"
+            ).fetchall()
+        finally:
+            conn.close()
+        summary = {}
+        for row in rows:
+            key = f"{row['run']} ({row['flow']})"
+            summary.setdefault(key, {})[row["state"]] = row["n"]
+        return summary
+
+
+class HttpQueue:
+    """Client for a coordinator started with `jobqueue.py serve`; same API as SqliteQueue."""
+
+    def __init__(self, url: str, timeout: int = 30):
+        self.url = url.rstrip("/")
+        self.timeout = timeout
+
+    def _call(self, method: str, **params):
+        body = json.dumps(params).encode("utf-8")
+        req = urllib.request.Request(
+            f"{self.url}/{method}", data=body, headers={"Content-Type": "application/json"}
+        )
+        with urllib.request.urlopen(req, timeout=self.timeout) as resp:
+            return json.loads(resp.read().decode("utf-8"))["result"]
+
+    def enqueue(self, flow, count, run=None, start=1):
+        return self._call("enqueue", flow=flow, count=count, run=run, start=start)
+
+    def lease(self, worker, flows=None, lease_seconds=LEASE_SECONDS):
+        return self._call("lease", worker=worker, flows=flows, lease_seconds=lease_seconds)
+
+    def heartbeat(self, job_id, worker, lease_seconds=LEASE_SECONDS):
+        return self._call("heartbeat", job_id=job_id, worker=worker, lease_seconds=lease_seconds)
+
+    def complete(self, job_id, worker, ok, error=None):
+        return self._call("complete", job_id=job_id, worker=worker, ok=ok, error=error)
+
+    def stats(self):
+        return self._call("stats")
+
+
+def serve(queue: SqliteQueue, host: str = "127.0.0.1", port: int = DEFAULT_PORT):
+    """Expose a SqliteQueue over HTTP so workers on other hosts can lease from it."""
+    methods = {"enqueue", "lease", "heartbeat", "complete", "stats"}
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            name = self.path.strip("/")
+            if name not in methods:
+                self.send_error(404, f"Unknown method {name}")
+                return
+            length = int(self.headers.get("Content-Length") or 0)
+            try:
+                params = json.loads(self.rfile.read(length) or b"{}")
+                result = getattr(queue, name)(**params)
+                payload, status = {"result": result}, 200
+            except Exception as e:
+                payload, status = {"error": f"{type(e).__name__}: {e}"}, 500
+            body = json.dumps(payload).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, fmt, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    log(f"✓ Queue coordinator listening on http://{host}:{port} (db: {queue.path})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+class Heartbeat:
+    """Keeps a job's lease alive from a background thread while the listing runs."""
+
+    def __init__(self, queue, job_id: int, worker: str, interval: int = HEARTBEAT_SECONDS,
+                 lease_seconds: int = LEASE_SECONDS):
+        self.queue = queue
+        self.job_id = job_id
+        self.worker = worker
+        self.interval = interval
+        self.lease_seconds = lease_seconds
+        self.lost = False
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name=f"heartbeat-{job_id}", daemon=True)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join(timeout=5)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                if not self.queue.heartbeat(self.job_id, self.worker, self.lease_seconds):
+                    self.lost = True
+            except Exception as e:
+                log(f"⚠️  Heartbeat for job {self.job_id} failed:", str(e))
+
+
+def run_worker(queue, worker_id: str, flows_filter=None, exit_when_idle: bool = False):
+    """Lease and post listings until the queue is drained (or forever)."""
+    import browserwatch
+    import drivers
+    import flows
+
+    driver = drivers.create_driver()
+    driver.maximize_window()
+    logged_in = False
+    watch = browserwatch.Watchdog()
+    done = failed = 0
+    try:
+        while True:
+            job = queue.lease(worker_id, flows_filter)
+            if job is None:
+                if exit_when_idle:
+                    break
+                time.sleep(IDLE_POLL_SECONDS)
+                continue
+            if not logged_in:
+                flows.login(driver, job["flow"])
+                logged_in = True
+            log(f"Leased job {job['id']}: {job['flow']} #{job['item_index']} (attempt {job['attempts']})")
+            with Heartbeat(queue, job["id"], worker_id) as hb:
+                ok, error = flows.run_item(driver, job["flow"], job["item_index"])
+            if hb.lost:
+                log(f"⚠️  Lease on job {job['id']} was lost; result discarded")
+                continue
+            # A submitted listing is done even when steps failed ("partial" in the error column),
+            # so its job never goes back to the queue to be posted again
+            queue.complete(job["id"], worker_id, ok, error)
+            if ok:
+                done += 1
+                if error:
+                    log(f"⚠️  Job {job['id']} submitted with failed steps ({error})")
+            else:
+                failed += 1
+                log(f"✗ Job {job['id']} failed ({error})")
+            driver = watch.check(driver)
+    except KeyboardInterrupt:
+        log("Worker interrupted; leased job (if any) will be re-queued when its lease expires")
+    finally:
+        log(f"Worker {worker_id} finished: {done} done, {failed} failed")
+        log.flush()
+        drivers.release(driver)
+
+
+def _open_queue(args):
+    if getattr(args, "coordinator", None):
+        return HttpQueue(args.coordinator)
+    return SqliteQueue(args.db)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Distributed HomeHNI posting queue")
+    parser.add_argument("--db", default=DEFAULT_DB, help="SQLite queue file")
+    parser.add_argument("--coordinator", help="URL of a `jobqueue.py serve` coordinator")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("enqueue", help="add listings for a flow")
+    p.add_argument("flow")
+    p.add_argument("count", type=int)
+    p.add_argument("--run", help="run label (default: flow + timestamp)")
+    p.add_argument("--start", type=int, default=1, help="first listing index")
+
+    p = sub.add_parser("serve", help="serve the queue over HTTP")
+    p.add_argument("--host", default="127.0.0.1")
+    p.add_argument("--port", type=int, default=DEFAULT_PORT)
+
+    p = sub.add_parser("worker", help="lease and post listings")
+    p.add_argument("--worker-id", default=f"{socket.gethostname()}-{os.getpid()}")
+    p.add_argument("--flows", help="comma-separated flows this worker accepts")
+    p.add_argument("--exit-when-idle", action="store_true")
+
+    sub.add_parser("status", help="show job counts per run and state")
+
+    args = parser.parse_args()
+
+    if args.command == "serve":
+        serve(SqliteQueue(args.db), args.host, args.port)
+        return
+
+    queue = _open_queue(args)
+    if args.command == "enqueue":
+        import flows
+        flows.load(args.flow)
+        result = queue.enqueue(args.flow, args.count, args.run, args.start)
+        log(f"✓ Enqueued {result['enqueued']} {args.flow} listings as run {result['run']}")
+    elif args.command == "worker":
+        flows_filter = args.flows.split(",") if args.flows else None
+        run_worker(queue, args.worker_id, flows_filter, args.exit_when_idle)
+    elif args.command == "status":
+        for run, states in queue.stats().items():
+            counts = ", ".join(f"{state}: {n}" for state, n in sorted(states.items()))
+            log(f"{run}: {counts}")
+    log.flush()
+
+
+if __name__ == "__main__":
+    main()
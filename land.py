@@ -0,0 +1,579 @@
+"""
+Module Name: land.py
+
+Purpose:
+    Page functions of the Land/Plot posting wizard, shared by the Agricultural
+    Land and Commercial Land scripts. The pages only differ by the option
+    picked on the first page and the Sewage Connection combobox Commercial
+    Land adds to the infrastructure page, so each script describes its land
+    type with a LandType and runs these functions with it. Steps and listings
+    are logged under the land type's own flow name.
+
+Usage:
+    import land
+    AGRICULTURAL = land.LandType("agricultural", "Agricultural Land", "Agricultural land")
+    land.run_full_post_flow(driver, AGRICULTURAL, 3)
+    land.main(AGRICULTURAL)          # the script's interactive run
+"""
+
+import time
+import os
+from functools import wraps
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+
+from browserwatch import Watchdog
+from drivers import BASE_URL, create_driver, release
+import dom
+import forms
+import options
+import waits
+from eventlog import get_logger
+
+log = get_logger("land")
+
+# Configuration
+PRIMARY_NAME = "Tanish"
+PRIMARY_MOBILE = "9902978675"
+
+# Plot Details Configuration
+PLOT_AREA = "2000"
+PLOT_LENGTH = "80"
+PLOT_WIDTH = "100"
+
+# Location Details Rotation
+CITIES_LOCALITIES = [
+    ("Bangalore", "Bellandur"),
+    ("Mumbai", "Thane"),
+    ("Hyderabad", "mgroad"),
+]
+
+# Sale Details Configuration
+EXPECTED_PRICE = "8000000"
+APPROVED_BY = "Karnataka Student Software Testing"
+DESCRIPTION = "Hello Worlddddddddddddddddddddddddddddddddddddddddddddddddddddddddddddddddddddddddddddddddddddddddddddddddddddddddddddddddddddddddddddddddddddddddddddddddd!"
+
+# Infrastructure Configuration
+ROAD_WIDTH = "100"
+DIRECTIONS_FOR_BUYERS = "Come Straight from top in Town and take a left."
+
+# Gallery Configuration
+IMAGE_FILES = ["try.png", "try2.png", "try3.png"]
+
+
+class LandType:
+    """One Land/Plot sub-type of the posting wizard, with the flow name it logs under."""
+
+    def __init__(self, flow: str, name: str, button: str, sewage: bool = False):
+        self.flow = flow          # flows.POSTING_FLOWS key; also the options cache prefix
+        self.name = name          # "Agricultural Land"
+        self.button = button      # first-page option text, e.g. "Agricultural land"
+        self.sewage = sewage      # infrastructure page asks for a sewage connection
+        self.log = get_logger(flow)
+
+
+def _step(func):
+    """Like @log.step, but timed under the land type's own flow rather than "land"."""
+    @wraps(func)
+    def wrapper(driver, land, *args):
+        with land.log.step_scope(func.__name__):
+            return func(driver, land, *args)
+    return wrapper
+
+
+def wait_and_click(driver, by, locator, timeout=20):
+    """Wait for an element to be clickable and then click it."""
+    element = WebDriverWait(driver, timeout).until(EC.element_to_be_clickable((by, locator)))
+    try:
+        element.click()
+    except:
+        # If regular click fails, try JavaScript click
+        driver.execute_script("arguments[0].click();", element)
+
+def login_and_wait(driver):
+    """
+    Navigate to HomeHNI homepage and pause for manual login and navigation.
+    Once you are logged in and have clicked on 'Post Property' to reach the
+    first page form, press Enter in your terminal to continue.
+    """
+    driver.get(BASE_URL)
+    input("Please complete the login process, click on 'Post Property', and when you reach the first page form, press Enter here to continue...")
+
+@_step
+def fill_first_page(driver, land):
+    """Fill the first page form - select city, Land/Plot option, the land type's option, and submit.
+    More robust with retries, scrolling, and JS clicks to avoid interceptions.
+    """
+    log("Starting to fill first page...")
+    log("Note: Name and Mobile are pre-filled automatically")
+
+    def try_fill_once():
+        # Mobile Number - Fill with phone number
+        try:
+            forms.fill_fields(driver, {"Mobile Number": ("//input[@id='mobile']", PRIMARY_MOBILE)}, timeout=10)
+        except Exception as e:
+            log("✗ Could not fill Mobile Number field:", str(e))
+
+        # City dropdown - always select first option in the list
+        try:
+            city_combobox = WebDriverWait(driver, 10).until(
+                EC.element_to_be_clickable((By.XPATH, "//button[@role='combobox' and contains(., 'Select city')]"))
+            )
+            dom.click(driver, city_combobox)
+            time.sleep(1)
+            try:
+                first_opt = WebDriverWait(driver, 5).until(
+                    EC.element_to_be_clickable((By.XPATH, "(//div[@role='option'] | //li[@role='option'])[1]"))
+                )
+                driver.execute_script("arguments[0].click();", first_opt)
+                log("✓ City selected (first option)")
+            except:
+                # Fallback: type any character and pick first suggestion
+                try:
+                    city_input = WebDriverWait(driver, 5).until(
+                        EC.element_to_be_clickable((By.XPATH, "//input[@type='text' and contains(@placeholder, 'city')]"))
+                    )
+                    city_input.clear()
+                    city_input.send_keys("a")
+                    time.sleep(1)
+                    first_opt = WebDriverWait(driver, 5).until(
+                        EC.element_to_be_clickable((By.XPATH, "(//div[@role='option'] | //li[@role='option'])[1]"))
+                    )
+                    driver.execute_script("arguments[0].click();", first_opt)
+                    log("✓ City selected (typed, first option)")
+                except:
+                    log("⚠️  Skipping city selection this attempt")
+        except Exception as e:
+            log("⚠️  City combobox not ready:", str(e))
+
+        # Land/Plot button - try multiple approaches
+        try:
+            # Try finding button by text that contains "Land/Plot"
+            land_plot_button = None
+            selectors = [
+                "//button[contains(text(), 'Land/Plot')]",
+                "//button[@class='flex-1' and contains(., 'Land/Plot')]",
+                "//button[contains(@class, 'flex-1') and contains(text(), 'Land/Plot')]",
+                "//button[contains(@class, 'text-sm') and contains(., 'Land/Plot')]"
+            ]
+            
+            for selector in selectors:
+                try:
+                    land_plot_button = dom.first_visible(driver, selector)
+                    if land_plot_button:
+                        break
+                except:
+                    continue
+            
+            if land_plot_button:
+                dom.click(driver, land_plot_button)
+                log("✓ Land/Plot button clicked")
+            else:
+                log("✗ Could not find Land/Plot button")
+        except Exception as e:
+            log("✗ Could not click Land/Plot button:", str(e))
+
+        # Wait for the land type options to appear
+        time.sleep(0.5)
+
+        # Land type button - try multiple approaches
+        try:
+            land_type_button = None
+            selectors = [
+                f"//button[contains(text(), '{land.button}')]",
+                f"//button[normalize-space()='{land.button}']",
+                f"//button[contains(text(), '{land.button.split()[0]}')]",
+                f"//button[contains(., '{land.button}')]"
+            ]
+            
+            for selector in selectors:
+                try:
+                    land_type_button = dom.first_visible(driver, selector)
+                    if land_type_button:
+                        break
+                except:
+                    continue
+            
+            if land_type_button:
+                dom.click(driver, land_type_button)
+                log(f"✓ {land.name} button clicked")
+            else:
+                log(f"✗ Could not find {land.name} button")
+        except Exception as e:
+            log(f"✗ Could not click {land.name} button:", str(e))
+
+        # Submit button: wait until enabled (no disabled attribute), then click
+        try:
+            submit_button = WebDriverWait(driver, 10).until(
+                EC.presence_of_element_located((By.XPATH, "//button[normalize-space()='Start Posting Your Ad For FREE']"))
+            )
+            # wait until button is enabled
+            WebDriverWait(driver, 10).until(lambda d: submit_button.get_attribute('disabled') is None)
+            dom.click(driver, submit_button)
+            log("✓ Submit button clicked - proceeding to next page")
+            return True
+        except Exception as e:
+            log("✗ Could not click Submit:", str(e))
+            return False
+
+    # Try once; if fail, reload post page and retry once
+    success = try_fill_once()
+    if not success:
+        try:
+            driver.get(f"{BASE_URL}/post-property")
+            WebDriverWait(driver, 15).until(
+                EC.presence_of_element_located((By.XPATH, "//button[@role='combobox' and contains(., 'Select city')] | //button[contains(., 'Start Posting Your Ad For FREE')]"))
+            )
+            log("↻ Retrying first page after reload...")
+            try_fill_once()
+        except Exception:
+            pass
+
+@_step
+def fill_plot_details_page(driver, land):
+    """Fill the plot details page form - plot area, length, width, and gated property."""
+    log("Starting to fill plot details page...")
+    
+    # Wait for page transition
+    waits.settled(driver)
+    
+    forms.fill_page(driver, f"{land.flow}.plot_details", {
+        "Plot Area": (forms.NUMBER, "//input[@name='plotArea']", PLOT_AREA),
+        "Plot Length": (forms.NUMBER, "//input[@name='plotLength']", PLOT_LENGTH),
+        "Plot Width": (forms.NUMBER, "//input[@name='plotWidth']", PLOT_WIDTH),
+        "Gated Property?": (forms.COMBOBOX, "//button[@role='combobox' and contains(., 'Select')]", forms.RANDOM),
+    })
+    
+    # Click Save & Continue button
+    try:
+        save_button = None
+        selectors = [
+            "//button[contains(text(), 'Save & Continue')]",
+            "//button[contains(text(), 'Save &amp; Continue')]",
+            "//button[contains(@class, 'bg-red-600') and contains(text(), 'Save')]",
+            "//button[@type='button' and contains(text(), 'Save')]"
+        ]
+        
+        for selector in selectors:
+            try:
+                visible_elements = dom.visible(driver, selector)
+                if visible_elements:
+                    save_button = visible_elements[0]
+                    break
+            except:
+                continue
+        
+        if save_button:
+            with waits.acknowledged(driver, "Save & Continue"):
+                driver.execute_script("arguments[0].click();", save_button)
+            log("✓ Save & Continue button clicked - proceeding to next page")
+        else:
+            log("✗ Could not find Save & Continue button with any selector")
+    except Exception as e:
+        log("✗ Could not find Save & Continue button:", str(e))
+
+@_step
+def fill_location_details_page(driver, land, city_name: str, locality_name: str):
+    """Fill the location details page - city and locality using autocomplete."""
+    log("Starting to fill location details page...")
+    
+    # City field - Type and select first suggestion
+    try:
+        city_input = WebDriverWait(driver, 10).until(
+            EC.element_to_be_clickable((By.XPATH, "//input[@name='city']"))
+        )
+        city_input.clear()
+        city_input.send_keys(city_name)
+        log(f"✓ Typed city: {city_name}")
+        time.sleep(1.5)
+        first_suggestion = WebDriverWait(driver, 3).until(
+            EC.element_to_be_clickable((By.XPATH, "//div[contains(@class, 'pac-item')][1]"))
+        )
+        driver.execute_script("arguments[0].click();", first_suggestion)
+        log(f"✓ City selected: {city_name}")
+    except Exception as e:
+        log("✗ Could not select City:", str(e))
+
+    # Locality field - Type and select first suggestion
+    try:
+        locality_input = WebDriverWait(driver, 10).until(
+            EC.element_to_be_clickable((By.XPATH, "//input[@name='locality']"))
+        )
+        locality_input.clear()
+        locality_input.send_keys(locality_name)
+        log(f"✓ Typed locality: {locality_name}")
+        time.sleep(1.5)
+        first_suggestion = WebDriverWait(driver, 3).until(
+            EC.element_to_be_clickable((By.XPATH, "//div[contains(@class, 'pac-item')][1]"))
+        )
+        driver.execute_script("arguments[0].click();", first_suggestion)
+        log(f"✓ Locality selected: {locality_name}")
+    except Exception as e:
+        log("✗ Could not select Locality:", str(e))
+
+    # Click Save & Continue button
+    try:
+        save_button = None
+        selectors = [
+            "//button[contains(text(), 'Save & Continue')]",
+            "//button[contains(text(), 'Save &amp; Continue')]",
+            "//button[contains(@class, 'bg-red-600') and contains(text(), 'Save')]",
+            "//button[@type='button' and contains(text(), 'Save')]"
+        ]
+        for selector in selectors:
+            try:
+                visible_elements = dom.visible(driver, selector)
+                if visible_elements:
+                    save_button = visible_elements[0]
+                    break
+            except:
+                continue
+        if save_button:
+            with waits.acknowledged(driver, "Save & Continue"):
+                driver.execute_script("arguments[0].click();", save_button)
+            log("✓ Save & Continue button clicked - proceeding to next page")
+        else:
+            log("✗ Could not find Save & Continue button with any selector")
+    except Exception as e:
+        log("✗ Could not click Save & Continue:", str(e))
+
+@_step
+def fill_sale_details_page(driver, land):
+    """Fill the sale details page - expected price, approved by and description."""
+    log("Starting to fill sale details page...")
+
+    # Wait for page transition
+    waits.settled(driver)
+
+    forms.fill_page(driver, f"{land.flow}.sale_details", {
+        "Expected Price": (forms.NUMBER, "//input[@id='expectedPrice']", EXPECTED_PRICE),
+        "Approved By": (forms.TEXT, "//input[@id='approvedBy']", APPROVED_BY),
+        "Description": (forms.TEXTAREA, "//textarea[@id='description']", DESCRIPTION),
+    })
+
+    # Click Save & Continue
+    try:
+        visible = dom.visible(driver, "//button[contains(text(), 'Save & Continue')]|//button[contains(text(), 'Save &amp; Continue')]")
+        if visible:
+            with waits.acknowledged(driver, "Save & Continue"):
+                driver.execute_script("arguments[0].click();", visible[0])
+            log("✓ Save & Continue button clicked - proceeding to next page")
+        else:
+            log("✗ Could not find Save & Continue button on sale details page")
+    except Exception as e:
+        log("✗ Could not click Save & Continue on sale details page:", str(e))
+
+@_step
+def fill_infrastructure_page(driver, land):
+    """Fill the infrastructure page - water supply, electricity, sewage (if asked), road width and directions."""
+    log("Starting to fill infrastructure page...")
+
+    # Wait for page transition
+    waits.settled(driver)
+
+    spec = {
+        "Width of Facing Road": (forms.NUMBER, "//input[@id='roadWidth']", ROAD_WIDTH),
+        "Directions for buyers": (forms.TEXTAREA, "//textarea[@id='directionsToProperty']", DIRECTIONS_FOR_BUYERS),
+        "Water Supply": (forms.COMBOBOX, "//button[@role='combobox' and contains(., 'water supply')]", forms.RANDOM),
+    }
+    if land.sewage:
+        spec["Sewage Connection"] = (forms.COMBOBOX, "//button[@role='combobox' and contains(., 'sewage connection')]", forms.RANDOM)
+    forms.fill_page(driver, f"{land.flow}.infrastructure", spec)
+
+    # Electricity Connection - First option (second visible combobox on the page)
+    try:
+        visible_cb = dom.visible(driver, "//button[@role='combobox']")
+        if len(visible_cb) >= 2:
+            first_text = options.select(driver, visible_cb[1], f"{land.flow}.infrastructure.Electricity Connection", strategy="first")
+            if first_text:
+                log(f"✓ Electricity Connection selected: {first_text}")
+            else:
+                log("✗ No Electricity Connection options found")
+        else:
+            log("✗ Electricity Connection combobox not found")
+    except Exception as e:
+        log("✗ Electricity selection failed:", str(e))
+
+    # Save & Continue
+    try:
+        visible = dom.visible(driver, "//button[contains(text(), 'Save & Continue')]|//button[contains(text(), 'Save &amp; Continue')]")
+        if visible:
+            with waits.acknowledged(driver, "Save & Continue"):
+                driver.execute_script("arguments[0].click();", visible[0])
+            log("✓ Save & Continue button clicked - proceeding to next page")
+        else:
+            log("✗ Could not find Save & Continue button on infrastructure page")
+    except Exception as e:
+        log("✗ Could not click Save & Continue on infrastructure page:", str(e))
+
+@_step
+def fill_gallery_page(driver, land):
+    """Upload the gallery images."""
+    log("Starting to fill gallery page...")
+
+    # Wait for page transition
+    waits.settled(driver)
+
+    try:
+        # Prepare absolute image paths
+        current_dir = os.path.dirname(os.path.abspath(__file__))
+        images = [os.path.join(current_dir, name) for name in IMAGE_FILES]
+        existing = [p for p in images if os.path.exists(p)]
+        for p in images:
+            if os.path.exists(p):
+                log(f"✓ Found image: {p}")
+            else:
+                log(f"⚠️  Image not found: {p}")
+
+        if existing:
+            file_input = WebDriverWait(driver, 10).until(
+                EC.presence_of_element_located((By.XPATH, "//input[@type='file' and @accept='image/*']"))
+            )
+            file_input.send_keys("\n".join(existing))
+            log(f"✓ Uploaded {len(existing)} image(s)")
+            # Let the uploads finish before saving
+            waits.settled(driver)
+        else:
+            log("✗ No images found to upload")
+    except Exception as e:
+        log("✗ Could not upload images:", str(e))
+
+    # Save & Continue on gallery
+    try:
+        visible = dom.visible(driver, "//button[contains(text(), 'Save & Continue')]|//button[contains(text(), 'Save &amp; Continue')]")
+        if visible:
+            with waits.acknowledged(driver, "Save & Continue"):
+                driver.execute_script("arguments[0].click();", visible[0])
+            log("✓ Save & Continue button clicked - proceeding to next page")
+        else:
+            log("✗ Could not find Save & Continue button on gallery page")
+    except Exception as e:
+        log("✗ Could not click Save & Continue on gallery page:", str(e))
+
+@_step
+def fill_schedule_and_submit(driver, land):
+    """Submit the property from the schedule page."""
+    log("Starting to fill schedule page...")
+
+    # Wait for page transition
+    waits.settled(driver)
+
+    try:
+        submit_button = WebDriverWait(driver, 12).until(
+            EC.element_to_be_clickable((By.XPATH, "//button[contains(text(), 'Submit Property')]"))
+        )
+        with waits.acknowledged(driver, "Submit Property", submit=True):
+            dom.click(driver, submit_button)
+        log("✓ Submit Property button clicked - property submitted!")
+    except Exception as e:
+        log("✗ Could not submit property:", str(e))
+
+@_step
+def start_new_post(driver, land):
+    """Navigate to post property page to start a new property posting."""
+    log("Starting new property posting...")
+
+    try:
+        driver.get(f"{BASE_URL}/post-property")
+        WebDriverWait(driver, 15).until(
+            EC.presence_of_element_located((By.XPATH, "//button[@role='combobox' and contains(., 'Select city')] | //button[contains(., 'Start Posting Your Ad For FREE')]"))
+        )
+        log("✓ Navigated to post property page - ready for next property")
+    except Exception as e:
+        log("✗ Could not navigate to post property page:", str(e))
+
+def run_full_post_flow(driver, land, property_index):
+    """Run the complete property posting flow for one property of the given land type."""
+    log = land.log
+    with log.listing(property_index):
+        # Rotate city/locality per property
+        city_name, locality_name = CITIES_LOCALITIES[(property_index - 1) % len(CITIES_LOCALITIES)]
+
+        try:
+            fill_first_page(driver, land)
+            waits.settled(driver)
+
+            fill_plot_details_page(driver, land)
+            waits.settled(driver)
+
+            fill_location_details_page(driver, land, city_name, locality_name)
+            waits.settled(driver)
+
+            fill_sale_details_page(driver, land)
+            waits.settled(driver)
+
+            fill_infrastructure_page(driver, land)
+            waits.settled(driver)
+
+            fill_gallery_page(driver, land)
+            waits.settled(driver)
+
+            fill_schedule_and_submit(driver, land)
+
+            log(f"✓ {land.name} property {property_index} submitted successfully!")
+            return True
+
+        except Exception as e:
+            log(f"✗ Error posting {land.name} property {property_index}: {str(e)}")
+            return False
+
+def main(land):
+    """Script entry point shared by agricultural.py and commercial_land.py."""
+    import flows
+
+    log = land.log
+    # Ask user for number of properties to post
+    try:
+        num_properties = int(input(f"How many {land.name} properties do you want to post? Enter a number: "))
+        if num_properties <= 0:
+            log("Please enter a positive number.")
+            return
+    except ValueError:
+        log("Please enter a valid number.")
+        return
+
+    # Initialize Chrome WebDriver
+    driver = create_driver()
+    driver.maximize_window()
+
+    try:
+        # Navigate to HomeHNI and wait for manual login
+        login_and_wait(driver)
+
+        successful_posts = 0
+        partial_posts = 0
+        failed_posts = 0
+        watch = Watchdog(landing_url=f"{BASE_URL}/post-property")
+
+        for i in range(1, num_properties + 1):
+            # Same outcome rules as the pool runners: ok once Submit Property went through
+            ok, note = flows.run_item(driver, land.flow, i)
+            if ok:
+                successful_posts += 1
+                partial_posts += note == flows.PARTIAL
+            else:
+                failed_posts += 1
+                log(f"✗ {land.name} property {i} was not submitted ({note})")
+
+            # run_item opens a fresh post-property page for the next item
+            if i < num_properties:
+                # Fresh tab/browser every N listings or when memory runs high
+                driver = watch.check(driver)
+
+        log(f"\n{'='*60}")
+        log(f"{land.name.upper()} POSTING COMPLETE!")
+        log(f"{'='*60}")
+        log(f"Total properties requested: {num_properties}")
+        log(f"Successfully posted: {successful_posts}")
+        log(f"Submitted with failed steps: {partial_posts}")
+        log(f"Failed posts: {failed_posts}")
+        log(f"{'='*60}")
+
+        log.flush()
+        input("Press Enter to close the browser...")
+
+    except Exception as e:
+        log(f"An error occurred: {str(e)}")
+    finally:
+        release(driver)
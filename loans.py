@@ -15,26 +15,38 @@ Usage:
 """
 
 import time
-import random
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
+from browserwatch import Watchdog
+from drivers import BASE_URL, create_driver, release
+import dom
+import eventlog
+import options
+import retry
+import waits
+from eventlog import get_logger
+
+log = get_logger("loans")
+
 # Configuration
+SERVICE_TAB = "Loans"  # tab on the Services page that shows this form
+FORM_FIELD_ID = "loan-phone-mobile"
 LOAN_PHONE = "9902978675"
 LOAN_AMOUNT = "1000000"
 
 
 def login_and_wait_on_services(driver):
     """Open HomeHNI homepage; user will log in and navigate to Loans form."""
-    driver.get("https://homehni.in/")
+    driver.get(f"{BASE_URL}/")
     input(
         "Please log in (if needed), then navigate to Services → Loans in THIS window.\n"
         "Ensure the form is visible, then press Enter to start..."
     )
 
 
+@log.step
 def click_loans_tab(driver):
     """Click the Loans tab/button on the Services page if present."""
     try:
@@ -46,9 +58,7 @@ def click_loans_tab(driver):
                 )
             )
         )
-        driver.execute_script("arguments[0].scrollIntoView({block:'center'});", loans_btn)
-        time.sleep(0.2)
-        driver.execute_script("arguments[0].click();", loans_btn)
+        dom.click(driver, loans_btn)
         return True
     except Exception:
         return False
@@ -69,6 +79,7 @@ def _get_input_value(driver, element) -> str:
     return driver.execute_script("return arguments[0].value;", element) or ""
 
 
+@log.step
 def fill_phone_number(driver):
     try:
         phone_input = WebDriverWait(driver, 12).until(
@@ -92,6 +103,7 @@ def fill_phone_number(driver):
         return False
 
 
+@log.step
 def select_city_first_option(driver):
     """Open City combobox and select the first available option."""
     try:
@@ -104,14 +116,9 @@ def select_city_first_option(driver):
             )
         except Exception:
             # Fallback: choose the second visible combobox (skip country code)
-            all_cb = WebDriverWait(driver, 6).until(
-                EC.presence_of_all_elements_located((By.XPATH, "//button[@role='combobox']"))
-            )
-            visible_cb = [c for c in all_cb if c.is_displayed()]
+            visible_cb = WebDriverWait(driver, 6).until(lambda d: dom.visible(d, "//button[@role='combobox']"))
             city_cb = visible_cb[1] if len(visible_cb) >= 2 else visible_cb[0]
-        driver.execute_script("arguments[0].scrollIntoView({block:'center'});", city_cb)
-        time.sleep(0.2)
-        driver.execute_script("arguments[0].click();", city_cb)
+        dom.click(driver, city_cb)
         time.sleep(0.5)
         first_option = WebDriverWait(driver, 6).until(
             EC.element_to_be_clickable((By.XPATH, "(//div[@role='option'] | //li[@role='option'])[1]"))
@@ -122,6 +129,7 @@ def select_city_first_option(driver):
         return False
 
 
+@log.step
 def select_loan_type_random(driver):
     """Open Loan Type combobox and select a random option from the list."""
     try:
@@ -134,28 +142,14 @@ def select_loan_type_random(driver):
             )
         except Exception:
             # Fallback: pick combobox after city (third visible, skipping country)
-            all_cb = WebDriverWait(driver, 6).until(
-                EC.presence_of_all_elements_located((By.XPATH, "//button[@role='combobox']"))
-            )
-            visible_cb = [c for c in all_cb if c.is_displayed()]
+            visible_cb = WebDriverWait(driver, 6).until(lambda d: dom.visible(d, "//button[@role='combobox']"))
             type_cb = visible_cb[2] if len(visible_cb) >= 3 else visible_cb[-1]
-        driver.execute_script("arguments[0].scrollIntoView({block:'center'});", type_cb)
-        time.sleep(0.2)
-        driver.execute_script("arguments[0].click();", type_cb)
-        time.sleep(0.5)
-        options = WebDriverWait(driver, 6).until(
-            EC.presence_of_all_elements_located((By.XPATH, "//div[@role='option']"))
-        )
-        visible = [o for o in options if o.is_displayed()]
-        if not visible:
-            return False
-        idx = random.randint(0, len(visible) - 1)
-        driver.execute_script("arguments[0].click();", visible[idx])
-        return True
+        return options.select(driver, type_cb, "loans.loan_type") is not None
     except Exception:
         return False
 
 
+@log.step
 def fill_amount(driver):
     try:
         amt_input = WebDriverWait(driver, 12).until(
@@ -178,6 +172,7 @@ def fill_amount(driver):
         return False
 
 
+@log.step
 def submit_pre_approval(driver):
     try:
         submit_btn = WebDriverWait(driver, 10).until(
@@ -188,93 +183,108 @@ def submit_pre_approval(driver):
                 )
             )
         )
-        driver.execute_script("arguments[0].scrollIntoView({block:'center'});", submit_btn)
-        time.sleep(0.2)
-        driver.execute_script("arguments[0].click();", submit_btn)
+        dom.click(driver, submit_btn)
         return True
     except Exception:
         return False
 
 
+@log.step
 def wait_for_form_reset(driver, timeout: int = 10):
-    """Wait until the form resets (phone and amount inputs become empty)."""
+    """Wait until the form resets (phone and amount inputs become empty) or a success toast shows."""
     try:
-        WebDriverWait(driver, timeout).until(
-            lambda d: (
-                (d.find_element(By.ID, "loan-phone-mobile").get_attribute("value") or "") == ""
-                and (d.find_element(By.ID, "loan-amount-mobile").get_attribute("value") or "") == ""
-            )
-        )
-        return True
+        return waits.form_reset(driver, [FORM_FIELD_ID, "loan-amount-mobile"], timeout) is not None
     except Exception:
         return False
 
 
+def submit_request(driver, index: int) -> bool:
+    """Fill and submit one loan request; returns True when the submit click went through."""
+    with log.listing(index):
+        # Ensure Loans tab is active (in case of navigation)
+        click_loans_tab(driver)
+        time.sleep(0.3)
+
+        ok = True
+        ok &= fill_phone_number(driver)
+        ok &= select_city_first_option(driver)
+        ok &= select_loan_type_random(driver)
+        ok &= fill_amount(driver)
+
+        if not ok:
+            log(f"✗ Could not prepare form for submission {index}")
+            return False
+        if submit_pre_approval(driver):
+            log(f"✓ Loan request {index} submitted")
+            return True
+        log(f"✗ Submission click failed for request {index}")
+        return False
+
+
 def main():
     try:
         n = int(input("How many loan requests do you want to submit? Enter a number: "))
         if n <= 0:
-            print("Please enter a positive number.")
+            log("Please enter a positive number.")
             return
     except ValueError:
-        print("Please enter a valid number.")
+        log("Please enter a valid number.")
         return
 
-    driver = webdriver.Chrome()
+    driver = create_driver()
     driver.maximize_window()
 
     try:
         login_and_wait_on_services(driver)
 
         successful = 0
+        partial = 0
         failed = 0
+        retries = retry.RetryQueue()
 
         for i in range(1, n + 1):
-            # Ensure Loans tab is active (in case of navigation)
-            click_loans_tab(driver)
-            time.sleep(0.3)
-
-            ok = True
-            ok &= fill_phone_number(driver)
-            ok &= select_city_first_option(driver)
-            ok &= select_loan_type_random(driver)
-            ok &= fill_amount(driver)
-
-            if not ok:
-                print(f"✗ Could not prepare form for submission {i}")
-                failed += 1
+            # Only a request whose submit click did not go through is retried
+            failures_before = eventlog.failures()
+            if submit_request(driver, i):
+                successful += 1
+                if eventlog.failures() > failures_before:
+                    partial += 1
             else:
-                submitted = submit_pre_approval(driver)
-                if submitted:
-                    print(f"✓ Loan request {i} submitted")
-                    successful += 1
-                else:
-                    print(f"✗ Submission click failed for request {i}")
-                    failed += 1
+                failed += 1
+                retries.park("loans", i, "LeadFailed")
 
             # Wait for automatic form reset; no refresh required
             if i < n:
                 reset_ok = wait_for_form_reset(driver, timeout=10)
-                # Additional wait as requested
-                time.sleep(3)
                 if not reset_ok:
                     # As a fallback, try reactivating Loans tab without page reload
                     click_loans_tab(driver)
-                time.sleep(0.5)
-
-        print("\n==============================")
-        print("LOAN REQUESTS COMPLETE")
-        print("==============================")
-        print(f"Requested: {n}")
-        print(f"Successful: {successful}")
-        print(f"Failed: {failed}")
+                    time.sleep(0.5)
+
+        # Retry the failed requests on a fresh tab, backing off between attempts
+        if len(retries):
+            log(f"\nRetrying {len(retries)} failed loan requests...")
+            driver, recovered = retry.drain(driver, retries, Watchdog())
+            successful += recovered
+            failed -= recovered
+
+        log("\n==============================")
+        log("LOAN REQUESTS COMPLETE")
+        log("==============================")
+        log(f"Requested: {n}")
+        log(f"Successful: {successful}")
+        log(f"Submitted with failed steps: {partial}")
+        log(f"Failed: {failed}")
+        if retries.dead:
+            log(f"Dead letters: {retries.path}")
     finally:
         # Give user a moment to review
         try:
+            log.flush()
             input("Press Enter to close the browser...")
         except Exception:
             pass
-        driver.quit()
+        release(driver)
 
 
 if __name__ == "__main__":
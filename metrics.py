@@ -0,0 +1,308 @@
+"""
+Module Name: metrics.py
+
+Purpose:
+    Live throughput metrics for long runs in the Prometheus text format. An
+    in-process registry is fed from the event log (no flow code changes): the
+    step_end/step_error events of every @log.step function (fill_first_page ...
+    fill_schedule_and_submit, the Services submit_* steps), listing_end,
+    api_ack, memory, recycle, retry and autoscale events. It publishes
+    listings and leads per minute, per-step latency histograms, failures by
+    step and error class, active browser sessions and browser RSS on a local
+    HTTP endpoint and/or a textfile for node_exporter's textfile collector.
+
+Usage:
+    HNI_METRICS_PORT=9464 python orchestrator.py rent=200 loans=100 --workers 4
+    curl -s localhost:9464/metrics
+
+    HNI_METRICS_FILE=/var/lib/node_exporter/hni.prom python sale.py
+
+    # Started by drivers.create_driver() when either variable is set, or directly:
+    import metrics
+    metrics.start(port=9464)
+
+    Environment:
+        HNI_METRICS_PORT      serve /metrics on this port (default: off)
+        HNI_METRICS_HOST      interface to bind (default: 127.0.0.1)
+        HNI_METRICS_FILE      rewrite this textfile every interval and at exit (default: off)
+        HNI_METRICS_INTERVAL  seconds between textfile writes (default: 15)
+"""
+
+import atexit
+import os
+import threading
+import time
+from collections import defaultdict, deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import eventlog
+from eventlog import get_logger
+
+log = get_logger("metrics")
+
+# Configuration
+METRICS_PORT = int(os.environ.get("HNI_METRICS_PORT") or 0)
+METRICS_HOST = os.environ.get("HNI_METRICS_HOST", "127.0.0.1")
+METRICS_FILE = os.environ.get("HNI_METRICS_FILE")
+METRICS_INTERVAL = float(os.environ.get("HNI_METRICS_INTERVAL", "15"))
+METRICS = bool(METRICS_PORT or METRICS_FILE)
+RATE_WINDOW = 60          # seconds of completed items behind the per-minute gauges
+
+STEP_BUCKETS = (0.25, 0.5, 1, 2, 5, 10, 20, 30, 60, 120)
+LISTING_BUCKETS = (10, 20, 30, 45, 60, 90, 120, 180, 300, 600)
+API_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2, 5, 10)
+
+# Logger names of the Services lead forms (flows.SERVICE_FLOWS keys); everything else posts listings
+LEAD_FLOWS = {"loans", "packers", "handover", "home_security", "property_management", "architect"}
+
+MB = 1024 * 1024
+
+
+def _labels(names, values):
+    if not names:
+        return ""
+    pairs = []
+    for name, value in zip(names, values):
+        value = str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        pairs.append(f'{name}="{value}"')
+    return "{" + ",".join(pairs) + "}"
+
+
+def _number(value):
+    if value == float("inf"):
+        return "+Inf"
+    return repr(round(value, 6)) if isinstance(value, float) else str(value)
+
+
+class Metric:
+    def __init__(self, name: str, kind: str, help_text: str, labels=()):
+        self.name = name
+        self.kind = kind
+        self.help = help_text
+        self.labels = tuple(labels)
+        self.values = {}
+        self.lock = threading.Lock()
+
+    def header(self):
+        return [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+
+
+class Counter(Metric):
+    def __init__(self, name, help_text, labels=()):
+        super().__init__(name, "counter", help_text, labels)
+
+    def inc(self, *label_values, amount: float = 1):
+        with self.lock:
+            self.values[label_values] = self.values.get(label_values, 0) + amount
+
+    def render(self):
+        with self.lock:
+            items = sorted(self.values.items())
+        return self.header() + [f"{self.name}{_labels(self.labels, k)} {_number(v)}" for k, v in items]
+
+
+class Gauge(Metric):
+    def __init__(self, name, help_text, labels=()):
+        super().__init__(name, "gauge", help_text, labels)
+
+    def set(self, *label_values, value: float):
+        with self.lock:
+            self.values[label_values] = value
+
+    def add(self, *label_values, amount: float = 1):
+        with self.lock:
+            self.values[label_values] = self.values.get(label_values, 0) + amount
+
+    render = Counter.render
+
+
+class Histogram(Metric):
+    def __init__(self, name, help_text, labels=(), buckets=STEP_BUCKETS):
+        super().__init__(name, "histogram", help_text, labels)
+        self.buckets = tuple(buckets) + (float("inf"),)
+
+    def observe(self, *label_values, value: float):
+        with self.lock:
+            series = self.values.get(label_values)
+            if series is None:
+                series = self.values[label_values] = [[0] * len(self.buckets), 0.0, 0]
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series[0][i] += 1
+            series[1] += value
+            series[2] += 1
+
+    def render(self):
+        with self.lock:
+            items = sorted((k, ([*v[0]], v[1], v[2])) for k, v in self.values.items())
+        lines = self.header()
+        names = self.labels + ("le",)
+        for key, (counts, total, count) in items:
+            for bound, n in zip(self.buckets, counts):
+                lines.append(f"{self.name}_bucket{_labels(names, key + (_number(float(bound)),))} {n}")
+            lines.append(f"{self.name}_sum{_labels(self.labels, key)} {_number(round(total, 6))}")
+            lines.append(f"{self.name}_count{_labels(self.labels, key)} {count}")
+        return lines
+
+
+class Registry:
+    """The run's metrics, updated from eventlog events."""
+
+    def __init__(self):
+        self.items = Counter("hni_items_total", "Listings and leads finished, by outcome (ok, partial, error)",
+                             ("flow", "kind", "outcome"))
+        self.rate = Gauge("hni_items_per_minute", f"Listings and leads finished ok over the last {RATE_WINDOW}s, per minute",
+                          ("flow", "kind"))
+        self.item_seconds = Histogram("hni_item_duration_seconds", "Wall time of one listing or lead",
+                                      ("flow", "kind"), LISTING_BUCKETS)
+        self.step_seconds = Histogram("hni_step_duration_seconds", "Wall time of one flow step",
+                                      ("flow", "step"), STEP_BUCKETS)
+        self.step_failures = Counter("hni_step_failures_total", "Failed flow steps by error class",
+                                     ("flow", "step", "error"))
+        self.api_seconds = Histogram("hni_api_ack_seconds", "Save/Submit API latency seen by waits.acknowledged",
+                                     ("flow", "signal"), API_BUCKETS)
+        self.retries = Counter("hni_retries_total", "Items parked for a retry", ("flow", "error"))
+        self.dead_letters = Counter("hni_dead_letters_total", "Items that gave up after the last retry", ("flow",))
+        self.sessions = Gauge("hni_active_sessions", "Browser sessions currently open")
+        self.rss = Gauge("hni_browser_rss_bytes", "Chrome process tree RSS per worker at its last sample", ("worker",))
+        self.heap = Gauge("hni_browser_js_heap_bytes", "JS heap used per worker at its last sample", ("worker",))
+        self.recycles = Counter("hni_browser_recycles_total", "Tab and browser restarts by the memory watchdog", ("kind",))
+        self.workers = Gauge("hni_autoscale_workers", "Browsers the autoscaler is running")
+        self.started = time.time()
+        self._finished = defaultdict(deque)
+        self._lock = threading.Lock()
+        self.sessions.set(value=0)
+
+    def on_event(self, event):
+        kind = event["event"]
+        flow = event.get("flow") or "unknown"
+        if kind == "step_end" and event.get("duration_ms") is not None:
+            self.step_seconds.observe(flow, event["step"], value=event["duration_ms"] / 1000)
+            if event.get("outcome") == "fail":
+                self.step_failures.inc(flow, event["step"], "StepFailed")
+        elif kind == "step_error":
+            self.step_failures.inc(flow, event.get("step"), event.get("error") or "Exception")
+        elif kind == "listing_end":
+            item_kind = "lead" if flow in LEAD_FLOWS else "listing"
+            outcome = event.get("outcome") or "ok"
+            self.items.inc(flow, item_kind, outcome)
+            if event.get("duration_ms") is not None:
+                self.item_seconds.observe(flow, item_kind, value=event["duration_ms"] / 1000)
+            if outcome == "ok":
+                with self._lock:
+                    self._finished[(flow, item_kind)].append(event["ts"])
+        elif kind == "api_ack" and event.get("api_ms") is not None:
+            self.api_seconds.observe(flow, event.get("signal"), value=event["api_ms"] / 1000)
+        elif kind == "memory":
+            worker = event.get("worker")
+            if event.get("rss_mb") is not None:
+                self.rss.set(worker, value=event["rss_mb"] * MB)
+            if event.get("heap_mb") is not None:
+                self.heap.set(worker, value=event["heap_mb"] * MB)
+        elif kind == "recycle":
+            self.recycles.inc(event.get("kind"))
+        elif kind == "retry_parked":
+            self.retries.inc(flow, event.get("error"))
+        elif kind == "dead_letter":
+            self.dead_letters.inc(flow)
+        elif kind == "autoscale":
+            self.workers.set(value=event["target"])
+
+    def _update_rates(self):
+        cutoff = time.time() - RATE_WINDOW
+        window = min(RATE_WINDOW, max(1.0, time.time() - self.started))
+        with self._lock:
+            for key, stamps in self._finished.items():
+                while stamps and stamps[0] < cutoff:
+                    stamps.popleft()
+                self.rate.set(*key, value=round(len(stamps) / window * 60, 2))
+
+    def render(self):
+        self._update_rates()
+        lines = [
+            "# HELP hni_run_info Run being measured",
+            "# TYPE hni_run_info gauge",
+            f"hni_run_info{_labels(('run',), (eventlog.RUN_ID,))} 1",
+        ]
+        for metric in (self.items, self.rate, self.item_seconds, self.step_seconds, self.step_failures,
+                       self.api_seconds, self.retries, self.dead_letters, self.sessions, self.rss,
+                       self.heap, self.recycles, self.workers):
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+_started = False
+_start_lock = threading.Lock()
+
+
+def session_opened():
+    REGISTRY.sessions.add(amount=1)
+
+
+def session_closed():
+    REGISTRY.sessions.add(amount=-1)
+
+
+def write_textfile(path: str = METRICS_FILE):
+    """Write the metrics atomically, as node_exporter's textfile collector expects."""
+    if os.path.dirname(path):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(REGISTRY.render())
+    os.replace(tmp, path)
+
+
+def _textfile_loop(path, interval):
+    while True:
+        time.sleep(interval)
+        try:
+            write_textfile(path)
+        except OSError as e:
+            log(f"⚠️  Could not write metrics to {path}:", str(e))
+
+
+def serve(host: str = METRICS_HOST, port: int = METRICS_PORT):
+    """Serve GET /metrics from a background thread; returns the server."""
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?")[0] not in ("/metrics", "/"):
+                self.send_error(404)
+                return
+            body = REGISTRY.render().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, fmt, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="metrics-http", daemon=True).start()
+    log(f"✓ Metrics on http://{host}:{server.server_port}/metrics")
+    return server
+
+
+def start(port: int = METRICS_PORT, path: str = METRICS_FILE, interval: float = METRICS_INTERVAL):
+    """Feed the registry from the event log and expose it (once per process)."""
+    global _started
+    with _start_lock:
+        if _started:
+            return
+        _started = True
+    eventlog.subscribe(REGISTRY.on_event)
+    if port:
+        try:
+            serve(METRICS_HOST, port)
+        except OSError as e:
+            log(f"⚠️  Metrics endpoint unavailable on port {port}:", str(e))
+    if path:
+        threading.Thread(target=_textfile_loop, args=(path, interval), name="metrics-textfile", daemon=True).start()
+        atexit.register(write_textfile, path)
+        log(f"✓ Metrics written to {path} every {interval:.0f}s")
@@ -0,0 +1,289 @@
+"""
+Module Name: netblock.py
+
+Purpose:
+    Per-flow, per-step request blocking for automation browsers. Analytics,
+    ad/social pixels, web fonts, images and Google Maps are blocked through
+    the Chrome DevTools Protocol (Network.setBlockedURLs); Maps/Places is let
+    through only around the locality step, where the city and locality
+    autocompletes need it. Every listing reports the bytes it transferred and
+    its page-load time, and how much both dropped against a baseline run.
+
+Usage:
+    Applied automatically to every driver made by drivers.create_driver().
+
+    # 1. Record a baseline with nothing blocked
+    HNI_NETBLOCK=baseline python orchestrator.py rent=5
+    # 2. Normal runs block and report savings per listing
+    python orchestrator.py rent=50
+
+    Environment:
+        HNI_NETBLOCK        on | baseline | off (default: on)
+        HNI_NETBLOCK_RULES  optional JSON file overriding BLOCK_GROUPS/ALLOW_RULES,
+                            e.g. {"block": ["analytics", "fonts"],
+                                  "allow": [["pg", "*locality*", ["maps"]]]}
+"""
+
+import atexit
+import fnmatch
+import json
+import os
+import threading
+
+import eventlog
+from eventlog import get_logger
+
+log = get_logger("netblock")
+
+# Configuration
+NETBLOCK_MODE = os.environ.get("HNI_NETBLOCK", "on")
+RULES_FILE = os.environ.get("HNI_NETBLOCK_RULES")
+BASELINE_FILE = os.path.join(eventlog.LOG_DIR, "netblock-baseline.json")
+
+# Named URL pattern groups ('*' wildcards, as understood by Network.setBlockedURLs)
+URL_GROUPS = {
+    "analytics": [
+        "*google-analytics.com*", "*googletagmanager.com*", "*analytics.google.com*",
+        "*clarity.ms*", "*hotjar.com*", "*hotjar.io*", "*segment.io*", "*mixpanel.com*",
+    ],
+    "ads": ["*doubleclick.net*", "*googlesyndication.com*", "*googleadservices.com*"],
+    "social": ["*connect.facebook.net*", "*facebook.com/tr*", "*platform.twitter.com*", "*snap.licdn.com*"],
+    "fonts": ["*fonts.googleapis.com*", "*fonts.gstatic.com*", "*.woff2*", "*.woff", "*.ttf", "*.otf"],
+    "images": ["*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.avif", "*.ico", "*.png?*", "*.jpg?*", "*.webp?*"],
+    "maps": ["*maps.googleapis.com*", "*maps.gstatic.com*", "*places.googleapis.com*"],
+}
+
+# Groups blocked on every step unless an allow rule exempts them
+BLOCK_GROUPS = ["analytics", "ads", "social", "fonts", "images", "maps"]
+
+# (flow glob, step glob, groups let through while that step runs)
+ALLOW_RULES = [
+    ("*", "*localit*", ["maps"]),
+    ("*", "*location*", ["maps"]),
+    # setBlockedURLs matches any URL ending in the file name, uploads and previews included
+    ("*", "*gallery*", ["images"]),
+]
+
+_local = threading.local()
+_lock = threading.Lock()
+# flow -> {step: next step}, learned from the first listing so an allowed
+# group is already open while the previous step's "Next" mounts the page
+_next_step = {}
+# flow -> {"listings": n, "bytes": total, "load_ms": total}, for baseline runs
+_totals = {}
+_baseline = None
+_atexit_registered = False
+
+# Resource/navigation timing since the last sample; a fresh document starts over
+_SAMPLE_JS = """
+const perf = window.performance;
+if (!perf || !perf.getEntriesByType) return null;
+if (window.__hniNetMark === undefined) {
+    window.__hniNetMark = 0;
+    if (perf.setResourceTimingBufferSize) perf.setResourceTimingBufferSize(5000);
+}
+let bytes = 0, requests = 0, loadMs = 0;
+if (!window.__hniNavSeen) {
+    const nav = perf.getEntriesByType('navigation')[0];
+    if (nav && nav.loadEventEnd > 0) {
+        window.__hniNavSeen = true;
+        bytes += nav.transferSize || 0;
+        loadMs = nav.loadEventEnd - nav.startTime;
+    }
+}
+const entries = perf.getEntriesByType('resource');
+for (let i = window.__hniNetMark; i < entries.length; i++) {
+    bytes += entries[i].transferSize || 0;
+    requests += 1;
+}
+window.__hniNetMark = entries.length;
+return {bytes: bytes, requests: requests, load_ms: loadMs};
+"""
+
+
+def _load_rules():
+    global BLOCK_GROUPS, ALLOW_RULES
+    if not RULES_FILE:
+        return
+    with open(RULES_FILE, encoding="utf-8") as f:
+        rules = json.load(f)
+    BLOCK_GROUPS = rules.get("block", BLOCK_GROUPS)
+    ALLOW_RULES = [tuple(rule) for rule in rules.get("allow", ALLOW_RULES)]
+    URL_GROUPS.update(rules.get("groups", {}))
+
+
+def _load_baseline():
+    global _baseline
+    if _baseline is None:
+        try:
+            with open(BASELINE_FILE, encoding="utf-8") as f:
+                _baseline = json.load(f)
+        except (OSError, ValueError):
+            _baseline = {}
+    return _baseline
+
+
+def cdp(driver, cmd: str, params: dict = None):
+    """Run a DevTools command on a local Chrome or a Remote/Grid Chrome session."""
+    if hasattr(driver, "execute_cdp_cmd"):
+        return driver.execute_cdp_cmd(cmd, params or {})
+    # Remote sessions: chromedriver's vendor endpoint, forwarded by Grid
+    driver.command_executor._commands.setdefault(
+        "executeCdpCommand", ("POST", "/session/$sessionId/goog/cdp/execute")
+    )
+    return driver.execute("executeCdpCommand", {"cmd": cmd, "params": params or {}})["value"]
+
+
+def allowed_groups(flow: str, step: str):
+    groups = set()
+    for flow_glob, step_glob, names in ALLOW_RULES:
+        if fnmatch.fnmatch(flow or "", flow_glob) and fnmatch.fnmatch(step or "", step_glob):
+            groups.update(names)
+    return groups
+
+
+def blocked_urls(flow: str, step: str):
+    """URL patterns to block while `step` of `flow` runs."""
+    allow = allowed_groups(flow, step)
+    upcoming = _next_step.get(flow, {}).get(step)
+    if upcoming:
+        allow |= allowed_groups(flow, upcoming)
+    elif step is not None and flow not in _next_step:
+        # Step order not learned yet: keep Maps open rather than break the locality page
+        allow |= {"maps"}
+    urls = []
+    for group in BLOCK_GROUPS:
+        if group not in allow:
+            urls.extend(URL_GROUPS.get(group, []))
+    return urls
+
+
+class NetworkGuard:
+    """Blocking state and per-listing traffic counters of one worker's browser."""
+
+    def __init__(self, driver, mode: str = NETBLOCK_MODE):
+        self.driver = driver
+        self.mode = mode
+        self.applied = None
+        self.previous_step = None
+        self.steps_seen = []
+        self.reset()
+        cdp(driver, "Network.enable")
+        if mode == "on":
+            self.apply(None, None)
+
+    def reset(self):
+        self.bytes = 0
+        self.requests = 0
+        self.load_ms = 0.0
+
+    def apply(self, flow, step):
+        urls = blocked_urls(flow, step)
+        if urls == self.applied:
+            return
+        cdp(self.driver, "Network.setBlockedURLs", {"urls": urls})
+        self.applied = urls
+
+    def sample(self):
+        try:
+            stats = self.driver.execute_script(_SAMPLE_JS)
+        except Exception:
+            return
+        if stats:
+            self.bytes += stats.get("bytes") or 0
+            self.requests += stats.get("requests") or 0
+            self.load_ms += stats.get("load_ms") or 0
+
+    def on_event(self, event):
+        kind = event.get("event")
+        flow, step = event.get("flow"), event.get("step")
+        if kind == "listing_start":
+            self.sample()
+            self.reset()
+            self.steps_seen = []
+        elif kind == "step_start":
+            self.steps_seen.append(step)
+            if self.mode == "on":
+                try:
+                    self.apply(flow, step)
+                except Exception:
+                    pass
+        elif kind == "step_end":
+            self.sample()
+        elif kind == "listing_end":
+            self.sample()
+            self._learn(flow)
+            self._report(event)
+
+    def _learn(self, flow):
+        with _lock:
+            if flow in _next_step or len(self.steps_seen) < 2:
+                return
+            _next_step[flow] = dict(zip(self.steps_seen, self.steps_seen[1:]))
+
+    def _report(self, event):
+        flow = event.get("flow")
+        fields = {"mode": self.mode, "bytes": self.bytes, "requests": self.requests,
+                  "page_load_ms": round(self.load_ms)}
+        if self.mode == "baseline":
+            with _lock:
+                totals = _totals.setdefault(flow, {"listings": 0, "bytes": 0, "load_ms": 0.0})
+                totals["listings"] += 1
+                totals["bytes"] += self.bytes
+                totals["load_ms"] += self.load_ms
+        else:
+            base = _load_baseline().get(flow)
+            if base:
+                fields["bytes_saved"] = round(base["bytes"] - self.bytes)
+                fields["page_load_ms_saved"] = round(base["load_ms"] - self.load_ms)
+        eventlog.emit("network", **fields)
+        line = f"Network: {self.bytes / 1024:.0f} KB in {self.requests} requests, page load {self.load_ms:.0f}ms"
+        if "bytes_saved" in fields:
+            line += (f" (saved {fields['bytes_saved'] / 1024:.0f} KB, "
+                     f"{fields['page_load_ms_saved']}ms vs baseline)")
+        log(line)
+
+
+def _on_event(event):
+    guard = getattr(_local, "guard", None)
+    if guard is not None:
+        guard.on_event(event)
+
+
+def save_baseline():
+    """Merge this run's per-listing averages into the baseline file."""
+    if not _totals:
+        return
+    baseline = dict(_load_baseline())
+    for flow, totals in _totals.items():
+        n = totals["listings"]
+        baseline[flow] = {"listings": n, "bytes": totals["bytes"] / n, "load_ms": totals["load_ms"] / n}
+    os.makedirs(os.path.dirname(BASELINE_FILE) or ".", exist_ok=True)
+    with open(BASELINE_FILE, "w", encoding="utf-8") as f:
+        json.dump(baseline, f, indent=2)
+
+
+def attach(driver, mode: str = NETBLOCK_MODE):
+    """Give the calling thread request blocking and traffic accounting over `driver`."""
+    global _atexit_registered
+    if mode == "off":
+        _local.guard = None
+        return None
+    _load_rules()
+    try:
+        _local.guard = NetworkGuard(driver, mode)
+    except Exception as e:
+        _local.guard = None
+        log(f"⚠️  Network blocking unavailable for this browser: {e}")
+        return None
+    eventlog.subscribe(_on_event)
+    if mode == "baseline":
+        with _lock:
+            if not _atexit_registered:
+                atexit.register(save_baseline)
+                _atexit_registered = True
+    return _local.guard
+
+
+def detach():
+    _local.guard = None
@@ -0,0 +1,154 @@
+"""
+Module Name: options.py
+
+Purpose:
+    Dropdown option catalog. The first time a combobox is opened in a run its
+    option texts are read in one in-page call and stored (in memory and in
+    runs/options.json). From then on the target option is chosen up front
+    from the catalog and selected with a single targeted click by text,
+    instead of fetching and filtering every //div[@role='option'] element on
+    every submission.
+
+Usage:
+    import options
+
+    # Opens the combobox, picks a random catalogued option and clicks it
+    text = options.select(driver, combobox, "loans.loan_type")
+    text = options.select(driver, combobox, "commercial_sale.Parking", strategy="first")
+
+    Environment:
+        HNI_OPTIONS_CACHE    catalog file (default: runs/options.json)
+        HNI_OPTIONS_REFRESH  1 to ignore the saved catalog and re-crawl once this run
+"""
+
+import json
+import os
+import threading
+import time
+
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.support.ui import WebDriverWait
+
+import dom
+import eventlog
+import replay
+
+# Configuration
+CATALOG_FILE = os.environ.get("HNI_OPTIONS_CACHE", os.path.join(eventlog.LOG_DIR, "options.json"))
+REFRESH = os.environ.get("HNI_OPTIONS_REFRESH") == "1"
+OPTION_TIMEOUT = 6
+
+_catalog = None
+_lock = threading.Lock()
+
+# Texts of the visible options of the open listbox (scoped by aria-controls when known)
+_CRAWL_JS = """
+const root = (arguments[0] && document.getElementById(arguments[0])) || document;
+return [...root.querySelectorAll('[role=option]')]
+    .filter(el => el.offsetParent !== null || el.getClientRects().length)
+    .map(el => el.textContent.trim());
+"""
+
+# Click the visible option whose text matches exactly; false if it is not rendered yet
+_CLICK_JS = """
+const root = (arguments[1] && document.getElementById(arguments[1])) || document;
+const el = [...root.querySelectorAll('[role=option]')].find(
+    o => (o.offsetParent !== null || o.getClientRects().length) && o.textContent.trim() === arguments[0]);
+if (!el) return false;
+el.scrollIntoView({block: 'nearest'});
+el.click();
+return true;
+"""
+
+
+def _load():
+    global _catalog
+    if _catalog is None:
+        _catalog = {}
+        if not REFRESH:
+            try:
+                with open(CATALOG_FILE, encoding="utf-8") as f:
+                    _catalog = json.load(f)
+            except (OSError, ValueError):
+                pass
+    return _catalog
+
+
+def _save():
+    os.makedirs(os.path.dirname(CATALOG_FILE) or ".", exist_ok=True)
+    tmp = f"{CATALOG_FILE}.{os.getpid()}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(_catalog, f, indent=2, ensure_ascii=False, sort_keys=True)
+    os.replace(tmp, CATALOG_FILE)
+
+
+def known(key: str):
+    """Catalogued option texts for `key`, or None if it has not been crawled."""
+    with _lock:
+        return _load().get(key)
+
+
+def forget(key: str):
+    """Drop a stale entry (the site changed its options)."""
+    with _lock:
+        if _load().pop(key, None) is not None:
+            _save()
+
+
+def crawl(driver, key: str, listbox_id: str = None, timeout: int = OPTION_TIMEOUT):
+    """Read the open listbox's option texts in one call and catalog them."""
+    texts = WebDriverWait(driver, timeout).until(
+        lambda d: [t for t in d.execute_script(_CRAWL_JS, listbox_id) if t] or False
+    )
+    with _lock:
+        _load()[key] = texts
+        _save()
+    return texts
+
+
+def choose(texts, key: str, strategy: str = "random"):
+    """Pick the target option text up front (seeded and recorded by replay)."""
+    if strategy == "first":
+        return texts[0]
+    return replay.choice(texts, key)
+
+
+def click(driver, text: str, listbox_id: str = None, timeout: int = OPTION_TIMEOUT) -> bool:
+    """Click the option labelled `text` as soon as it renders."""
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=0.1).until(
+            lambda d: d.execute_script(_CLICK_JS, text, listbox_id)
+        )
+        return True
+    except TimeoutException:
+        return False
+
+
+def open_combobox(driver, combobox):
+    dom.click(driver, combobox)
+    try:
+        return combobox.get_attribute("aria-controls")
+    except Exception:
+        return None
+
+
+def select(driver, combobox, key: str, strategy: str = "random"):
+    """Open `combobox` and select an option chosen from the catalog.
+
+    Returns the selected text, or None if nothing could be selected.
+    """
+    listbox_id = open_combobox(driver, combobox)
+    texts = known(key)
+    if not texts:
+        texts = crawl(driver, key, listbox_id)
+    text = choose(texts, key, strategy)
+    if click(driver, text, listbox_id):
+        return text
+    # Catalog is stale: re-crawl what is actually offered and try once more
+    forget(key)
+    driver.execute_script("document.body.click();")
+    time.sleep(0.2)
+    listbox_id = open_combobox(driver, combobox)
+    texts = crawl(driver, key, listbox_id)
+    text = choose(texts, key, strategy)
+    return text if click(driver, text, listbox_id) else None
@@ -0,0 +1,321 @@
+"""
+Module Name: orchestrator.py
+
+Purpose:
+    Single entry point that seeds a mixed catalog: it takes a per-flow count
+    mix, schedules every listing over one shared pool of browsers and reports
+    per-flow and aggregate throughput. One manual login is enough; its session
+    is cloned into every other browser in the pool. Failed listings are
+    retried with backoff on a fresh tab in between new ones (see retry.py).
+    With --autoscale the pool grows and shrinks with host load (see autoscale.py).
+
+Usage:
+    python orchestrator.py rent=20 sale=10 pg=5 commercial_rent=5 --workers 4
+    python orchestrator.py rent=50 --workers 2 --session runs/session.json
+    python orchestrator.py rent=200 loans=100 --workers 2 --autoscale --max-workers 8
+
+    Flows: any name in flows.names() (flows.POSTING_FLOWS and flows.SERVICE_FLOWS).
+"""
+
+import argparse
+import json
+import os
+import queue
+import threading
+import time
+
+import autoscale
+import browserwatch
+import drivers
+import eventlog
+import flows
+import retry
+import session
+from eventlog import get_logger
+
+log = get_logger("orchestrator")
+
+# Configuration
+DEFAULT_WORKERS = 2
+REPORT_DIR = eventlog.LOG_DIR
+
+
+def parse_mix(items):
+    """['rent=20', 'sale=5'] -> {'rent': 20, 'sale': 5} (validated against the registry)."""
+    mix = {}
+    for item in items:
+        name, _, count = item.partition("=")
+        if not count.isdigit() or int(count) <= 0:
+            raise ValueError(f"Expected flow=count, got '{item}'")
+        flows.load(name)
+        mix[name] = mix.get(name, 0) + int(count)
+    return mix
+
+
+def interleave(mix):
+    """Spread listings so every flow progresses proportionally: [(flow, index), ...]."""
+    total = sum(mix.values())
+    tasks = []
+    for flow, count in mix.items():
+        for i in range(1, count + 1):
+            # Fractional position of this listing within the whole run
+            tasks.append(((i - 0.5) / count * total, flow, i))
+    tasks.sort()
+    return [(flow, i) for _, flow, i in tasks]
+
+
+class FlowStats:
+    def __init__(self):
+        self.ok = 0
+        self.partial = 0
+        self.failed = 0
+        self.retried = 0
+        self.busy_seconds = 0.0
+        self.first_start = None
+        self.last_end = None
+        self.errors = {}
+
+    def record(self, start, end, ok, error, retrying=False):
+        self.busy_seconds += end - start
+        self.first_start = start if self.first_start is None else min(self.first_start, start)
+        self.last_end = end if self.last_end is None else max(self.last_end, end)
+        if ok:
+            # Submitted with failed steps: counted as done, never posted again
+            self.ok += 1
+            self.partial += error == flows.PARTIAL
+            return
+        self.errors[error] = self.errors.get(error, 0) + 1
+        if retrying:
+            self.retried += 1
+        else:
+            self.failed += 1
+
+    def summary(self):
+        done = self.ok + self.failed
+        attempts = done + self.retried
+        span = (self.last_end - self.first_start) if done else 0.0
+        return {
+            "ok": self.ok,
+            "partial": self.partial,
+            "failed": self.failed,
+            "retried": self.retried,
+            "avg_seconds_per_listing": round(self.busy_seconds / attempts, 1) if attempts else None,
+            "listings_per_minute": round(self.ok / span * 60, 2) if span else None,
+            "errors": self.errors,
+        }
+
+
+class Orchestrator:
+    def __init__(self, mix, workers: int = DEFAULT_WORKERS, session_path: str = None,
+                 autoscale_to: int = None):
+        self.mix = mix
+        self.workers = max(1, min(workers, sum(mix.values())))
+        self.session_path = session_path
+        self.autoscale_to = autoscale_to
+        self.state = None
+        self.threads = []
+        self.draining = set()
+        self.peak_workers = 0
+        self.tasks = queue.Queue()
+        self.stats = {flow: FlowStats() for flow in mix}
+        self.lock = threading.Lock()
+        self.drivers = []
+        self.retries = retry.RetryQueue()
+
+    def _new_driver(self):
+        driver = drivers.create_driver()
+        driver.maximize_window()
+        return driver
+
+    def _prepare_drivers(self):
+        """Log in once (or load a saved session) and seed every browser with it."""
+        first = self._new_driver()
+        self.drivers.append(first)
+        if self.session_path and os.path.exists(self.session_path):
+            state = session.load(self.session_path)
+            session.import_session(first, state, flows.POST_PROPERTY_URL)
+        else:
+            flows.login(first, next(iter(self.mix)))
+            state = session.export_session(first)
+            if self.session_path:
+                session.save(state, self.session_path)
+        self.state = state
+        for _ in range(self.workers - 1):
+            driver = self._new_driver()
+            session.import_session(driver, state, flows.POST_PROPERTY_URL)
+            self.drivers.append(driver)
+
+    def _start_worker(self, slot):
+        thread = threading.Thread(target=self._worker, args=(slot,), name=f"worker-{slot + 1}")
+        with self.lock:
+            self.threads.append(thread)
+            self.peak_workers = max(self.peak_workers, self.active_workers())
+        thread.start()
+
+    # Pool interface used by autoscale.Autoscaler
+
+    def active_workers(self):
+        return sum(1 for d in self.drivers if d is not None) - len(self.draining)
+
+    def backlog(self):
+        return self.tasks.qsize() + len(self.retries)
+
+    def add_worker(self):
+        """Start one more browser carrying the logged-in session."""
+        driver = self._new_driver()
+        session.import_session(driver, self.state, flows.POST_PROPERTY_URL)
+        with self.lock:
+            self.drivers.append(driver)
+            slot = len(self.drivers) - 1
+        self._start_worker(slot)
+
+    def drain_worker(self):
+        """Let the newest busy browser finish its current listing, then close it."""
+        with self.lock:
+            for slot in range(len(self.drivers) - 1, -1, -1):
+                if self.drivers[slot] is not None and slot not in self.draining:
+                    self.draining.add(slot)
+                    return slot
+        return None
+
+    def _retire(self, slot):
+        with self.lock:
+            driver, self.drivers[slot] = self.drivers[slot], None
+            self.draining.discard(slot)
+        try:
+            drivers.release(driver)
+        except Exception:
+            pass
+        log(f"Browser {slot + 1} drained; {self.active_workers()} left")
+
+    def _worker(self, slot):
+        driver = self.drivers[slot]
+        drivers.bind_thread(driver)
+        watch = browserwatch.Watchdog()
+        while True:
+            if slot in self.draining:
+                self._retire(slot)
+                return
+            # A retry whose backoff has elapsed goes before new listings
+            item = self.retries.pop_due()
+            start = time.time()
+            if item is not None:
+                flow, index, _ = item
+                driver, ok, error = retry.attempt(driver, flow, index, watch)
+            else:
+                try:
+                    flow, index = self.tasks.get_nowait()
+                except queue.Empty:
+                    # Retries parked by a worker that is still busy are picked up by that worker
+                    wait = self.retries.next_due()
+                    if wait is None:
+                        return
+                    time.sleep(min(wait, 1.0))
+                    continue
+                ok, error = flows.run_item(driver, flow, index)
+            end = time.time()
+            if ok:
+                self.retries.done(flow, index)
+                retrying = False
+            else:
+                retrying = self.retries.park(flow, index, error)
+            with self.lock:
+                self.stats[flow].record(start, end, ok, error, retrying)
+            if not ok and not retrying:
+                log(f"✗ {flow} listing {index} failed ({error})")
+            driver = self.drivers[slot] = watch.check(driver)
+
+    def run(self):
+        for task in interleave(self.mix):
+            self.tasks.put(task)
+        self._prepare_drivers()
+        log(f"Running {self.tasks.qsize()} listings across {len(self.drivers)} browsers: "
+            + ", ".join(f"{flow}={count}" for flow, count in self.mix.items()))
+        started = time.time()
+        scaler = None
+        if self.autoscale_to:
+            scaler = autoscale.Autoscaler(self, max_workers=self.autoscale_to)
+        try:
+            for slot in range(len(self.drivers)):
+                self._start_worker(slot)
+            if scaler:
+                scaler.start()
+            # The autoscaler may add workers while the others run
+            while True:
+                with self.lock:
+                    alive = [t for t in self.threads if t.is_alive()]
+                if not alive:
+                    break
+                alive[0].join()
+        finally:
+            if scaler:
+                scaler.stop()
+            for driver in self.drivers:
+                if driver is None:
+                    continue
+                try:
+                    drivers.release(driver)
+                except Exception:
+                    pass
+        return self.report(time.time() - started)
+
+    def report(self, elapsed: float):
+        per_flow = {flow: stats.summary() for flow, stats in self.stats.items()}
+        ok = sum(s["ok"] for s in per_flow.values())
+        partial = sum(s["partial"] for s in per_flow.values())
+        failed = sum(s["failed"] for s in per_flow.values())
+        report = {
+            "run": eventlog.RUN_ID,
+            "workers": self.peak_workers,
+            "elapsed_seconds": round(elapsed, 1),
+            "ok": ok,
+            "partial": partial,
+            "failed": failed,
+            "recovered": self.retries.recovered,
+            "dead_letter": self.retries.path if self.retries.dead else None,
+            "listings_per_minute": round(ok / elapsed * 60, 2) if elapsed else None,
+            "flows": per_flow,
+        }
+        log(f"\n{'='*60}")
+        log("ORCHESTRATED RUN COMPLETE")
+        log(f"{'='*60}")
+        for flow, s in per_flow.items():
+            log(f"{flow:<18} ok {s['ok']:>4}  failed {s['failed']:>4}  "
+                f"{s['listings_per_minute'] or 0:>6} /min  {s['avg_seconds_per_listing'] or 0:>6}s avg")
+        log(f"{'TOTAL':<18} ok {ok:>4}  failed {failed:>4}  {report['listings_per_minute'] or 0:>6} /min "
+            f"over {report['elapsed_seconds']}s with {report['workers']} browsers")
+        if partial:
+            log(f"⚠️  {partial} of the ok listing(s) submitted with failed steps")
+        if self.retries.recovered:
+            log(f"↻ {self.retries.recovered} listing(s) went through on a retry")
+        if report["dead_letter"]:
+            log(f"✗ {failed} listing(s) gave up after {self.retries.attempts} attempts; see {report['dead_letter']}")
+        os.makedirs(REPORT_DIR, exist_ok=True)
+        path = os.path.join(REPORT_DIR, f"orchestrator-{eventlog.RUN_ID}.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        log(f"Report written to {path}")
+        log.flush()
+        return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run several HomeHNI posting flows over one browser pool")
+    parser.add_argument("mix", nargs="+", help="flow=count pairs, e.g. rent=20 sale=10")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="browsers in the pool")
+    parser.add_argument("--session", help="reuse/save the logged-in session at this path")
+    parser.add_argument("--autoscale", action="store_true",
+                        help="add or drain browsers with host CPU, memory and step latency")
+    parser.add_argument("--max-workers", type=int, help="autoscaling limit (default: CPU count)")
+    args = parser.parse_args()
+
+    try:
+        mix = parse_mix(args.mix)
+    except ValueError as e:
+        parser.error(str(e))
+    autoscale_to = (args.max_workers or os.cpu_count() or DEFAULT_WORKERS) if args.autoscale else None
+    Orchestrator(mix, args.workers, args.session, autoscale_to).run()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,193 @@
+"""
+Module Name: perftrace.py
+
+Purpose:
+    Opt-in per-step performance tracing. Chrome's performance log (CDP
+    Network/Page events plus devtools.timeline trace events) is drained at
+    every step boundary and each step's wall time is split into:
+        backend_ms    time the site's API spent answering (request sent ->
+                      response headers, overlapping requests merged)
+        script_ms     JavaScript execution on the page
+        render_ms     style, layout and paint
+        idle_ms       the rest: automation sleeps, waits and WebDriver
+                      round trips
+    Step boundaries are marked in the page (performance.mark) so they line
+    up in DevTools, and each listing's raw events are saved as a Chrome
+    trace file for a deeper look.
+
+Usage:
+    HNI_PERFTRACE=1 python sale.py            # attached by drivers.create_driver()
+    # Per-listing table in the console, "perftrace" events in runs/events.jsonl,
+    # raw traces in runs/traces/ (open in DevTools > Performance > Load profile)
+
+    Environment:
+        HNI_PERFTRACE       1 to enable (default: off)
+        HNI_PERFTRACE_RAW   0 to skip writing raw trace files (default: 1)
+"""
+
+import json
+import os
+import threading
+
+import eventlog
+from eventlog import get_logger
+
+log = get_logger("perftrace")
+
+# Configuration
+PERFTRACE = os.environ.get("HNI_PERFTRACE") == "1"
+WRITE_RAW = os.environ.get("HNI_PERFTRACE_RAW", "1") == "1"
+TRACE_DIR = os.path.join(eventlog.LOG_DIR, "traces")
+TRACE_CATEGORIES = "devtools.timeline,v8.execute,blink.user_timing"
+
+SCRIPT_EVENTS = {"EvaluateScript", "FunctionCall", "v8.compile", "V8.Execute"}
+RENDER_EVENTS = {"UpdateLayoutTree", "Layout", "Paint", "PrePaint", "Layerize", "RecalculateStyles"}
+API_TYPES = {"XHR", "Fetch"}
+
+_local = threading.local()
+
+
+def configure(options):
+    """Ask chromedriver to record the performance log (called from drivers.chrome_options)."""
+    options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+    options.add_experimental_option("perfLoggingPrefs", {
+        "enableNetwork": True,
+        "enablePage": True,
+        "traceCategories": TRACE_CATEGORIES,
+    })
+    return options
+
+
+def _merged_ms(intervals):
+    """Total length of possibly overlapping [start, end] intervals."""
+    total, end = 0.0, None
+    for start, stop in sorted(intervals):
+        if end is None or start > end:
+            total += stop - start
+            end = stop
+        elif stop > end:
+            total += stop - end
+            end = stop
+    return total
+
+
+def summarize(messages, wall_ms: float):
+    """Split a step's wall time using its performance-log messages."""
+    backend, script_us, render_us = [], 0, 0
+    requests = 0
+    slowest = None
+    for message in messages:
+        method = message.get("method")
+        params = message.get("params", {})
+        if method == "Network.responseReceived":
+            response = params.get("response", {})
+            timing = response.get("timing")
+            if params.get("type") not in API_TYPES or not timing:
+                continue
+            requests += 1
+            base = timing["requestTime"] * 1000
+            start, stop = base + timing.get("sendEnd", 0), base + timing.get("receiveHeadersEnd", 0)
+            if stop > start:
+                backend.append((start, stop))
+                if slowest is None or stop - start > slowest[1]:
+                    slowest = (response.get("url", "")[:200], round(stop - start, 1))
+        elif method == "Tracing.dataCollected" and params.get("ph") == "X":
+            name = params.get("name")
+            if name in SCRIPT_EVENTS:
+                script_us += params.get("dur", 0)
+            elif name in RENDER_EVENTS:
+                render_us += params.get("dur", 0)
+    backend_ms = _merged_ms(backend)
+    script_ms, render_ms = script_us / 1000, render_us / 1000
+    return {
+        "wall_ms": round(wall_ms, 1),
+        "api_requests": requests,
+        "backend_ms": round(backend_ms, 1),
+        "script_ms": round(script_ms, 1),
+        "render_ms": round(render_ms, 1),
+        "idle_ms": round(max(0.0, wall_ms - backend_ms - script_ms - render_ms), 1),
+        "slowest_request": slowest,
+    }
+
+
+class StepTracer:
+    """Drains one browser's performance log at step boundaries."""
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.rows = []
+        self.raw = []
+
+    def drain(self):
+        try:
+            entries = self.driver.get_log("performance")
+        except Exception:
+            return []
+        messages = []
+        for entry in entries:
+            try:
+                messages.append(json.loads(entry["message"])["message"])
+            except (KeyError, ValueError):
+                continue
+        if WRITE_RAW:
+            self.raw.extend(m["params"] for m in messages if m.get("method") == "Tracing.dataCollected")
+        return messages
+
+    def mark(self, label: str):
+        try:
+            self.driver.execute_script("performance.mark(arguments[0]);", label)
+        except Exception:
+            pass
+
+    def on_event(self, event):
+        kind = event.get("event")
+        step = event.get("step")
+        if kind == "listing_start":
+            self.drain()
+            self.rows, self.raw = [], []
+        elif kind == "step_start":
+            # Whatever happened between steps is not charged to this one
+            self.drain()
+            self.mark(f"hni:{step}:start")
+        elif kind == "step_end":
+            self.mark(f"hni:{step}:end")
+            row = summarize(self.drain(), event.get("duration_ms") or 0.0)
+            row["step_name"] = step
+            self.rows.append(row)
+            eventlog.emit("perftrace", **row)
+        elif kind == "listing_end":
+            self.report(event)
+
+    def report(self, event):
+        if not self.rows:
+            return
+        log(f"Step timing split (listing {event.get('listing')}): wall = backend + script + render + idle")
+        for row in self.rows:
+            log(f"  {row['step_name']:<32} {row['wall_ms']:>8.0f}ms = {row['backend_ms']:>7.0f} + "
+                f"{row['script_ms']:>6.0f} + {row['render_ms']:>6.0f} + {row['idle_ms']:>7.0f}"
+                + (f"  slowest API {row['slowest_request'][1]}ms" if row["slowest_request"] else ""))
+        totals = {k: sum(r[k] for r in self.rows) for k in ("wall_ms", "backend_ms", "script_ms", "render_ms", "idle_ms")}
+        eventlog.emit("perftrace_listing", **{k: round(v, 1) for k, v in totals.items()})
+        if WRITE_RAW and self.raw:
+            self.write_raw(event)
+
+    def write_raw(self, event):
+        os.makedirs(TRACE_DIR, exist_ok=True)
+        name = "-".join(str(p) for p in (eventlog.RUN_ID, event.get("flow"), event.get("listing")) if p is not None)
+        path = os.path.join(TRACE_DIR, f"{name}.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": self.raw}, f)
+        log(f"Trace written to {path}")
+
+
+def _on_event(event):
+    tracer = getattr(_local, "tracer", None)
+    if tracer is not None:
+        tracer.on_event(event)
+
+
+def attach(driver):
+    """Trace the calling thread's steps on `driver`."""
+    _local.tracer = StepTracer(driver)
+    eventlog.subscribe(_on_event)
+    return _local.tracer
@@ -16,13 +16,20 @@ Usage:
 import time
 import os
 from datetime import datetime
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait, Select
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.keys import Keys
 
+from drivers import BASE_URL, create_driver, release
+import dom
+import forms
+import waits
+from eventlog import get_logger
+
+log = get_logger("pg")
+
 # Configuration
 PRIMARY_NAME = "Tanish"
 PRIMARY_MOBILE = "9902978675"
@@ -64,15 +71,16 @@ def login_and_wait(driver):
     Once you are logged in and have clicked on 'Post Property' to reach the
     first page form, press Enter in your terminal to continue.
     """
-    driver.get("https://homehni.in")
+    driver.get(BASE_URL)
     input("Please complete the login process, click on 'Post Property', and when you reach the first page form, press Enter here to continue...")
 
+@log.step
 def fill_first_page(driver):
     """Fill the first page form - select city, PG/Hostel option, and submit.
     More robust with retries, scrolling, and JS clicks to avoid interceptions.
     """
-    print("Starting to fill first page...")
-    print("Note: Name and Mobile are pre-filled automatically")
+    log("Starting to fill first page...")
+    log("Note: Name and Mobile are pre-filled automatically")
 
     def try_fill_once():
         # City dropdown - always select first option in the list
@@ -80,15 +88,14 @@ def fill_first_page(driver):
             city_combobox = WebDriverWait(driver, 10).until(
                 EC.element_to_be_clickable((By.XPATH, "//button[@role='combobox' and contains(., 'Select city')]"))
             )
-            driver.execute_script("arguments[0].scrollIntoView({block:'center'});", city_combobox)
-            driver.execute_script("arguments[0].click();", city_combobox)
+            dom.click(driver, city_combobox)
             time.sleep(1)
             try:
                 first_opt = WebDriverWait(driver, 5).until(
                     EC.element_to_be_clickable((By.XPATH, "(//div[@role='option'] | //li[@role='option'])[1]"))
                 )
                 driver.execute_script("arguments[0].click();", first_opt)
-                print("✓ City selected (first option)")
+                log("✓ City selected (first option)")
             except:
                 # Fallback: type any character and pick first suggestion
                 try:
@@ -102,23 +109,21 @@ def fill_first_page(driver):
                         EC.element_to_be_clickable((By.XPATH, "(//div[@role='option'] | //li[@role='option'])[1]"))
                     )
                     driver.execute_script("arguments[0].click();", first_opt)
-                    print("✓ City selected (typed, first option)")
+                    log("✓ City selected (typed, first option)")
                 except:
-                    print("⚠️  Skipping city selection this attempt")
+                    log("⚠️  Skipping city selection this attempt")
         except Exception as e:
-            print("⚠️  City combobox not ready:", str(e))
+            log("⚠️  City combobox not ready:", str(e))
 
         # PG/Hostel button (scoped within the same form section as the submit button)
         try:
             pg_button = WebDriverWait(driver, 10).until(
                 EC.presence_of_element_located((By.XPATH, "//div[.//button[normalize-space()='Start Posting Your Ad For FREE']]//button[normalize-space()='PG/Hostel']"))
             )
-            driver.execute_script("arguments[0].scrollIntoView({block:'center'});", pg_button)
-            time.sleep(0.3)
-            driver.execute_script("arguments[0].click();", pg_button)
-            print("✓ PG/Hostel button clicked")
+            dom.click(driver, pg_button)
+            log("✓ PG/Hostel button clicked")
         except Exception as e:
-            print("✗ Could not click PG/Hostel:", str(e))
+            log("✗ Could not click PG/Hostel:", str(e))
 
         # Submit button: wait until enabled (no disabled attribute), then click
         try:
@@ -127,46 +132,43 @@ def fill_first_page(driver):
             )
             # wait until button is enabled
             WebDriverWait(driver, 10).until(lambda d: submit_button.get_attribute('disabled') is None)
-            driver.execute_script("arguments[0].scrollIntoView({block:'center'});", submit_button)
-            time.sleep(0.3)
-            driver.execute_script("arguments[0].click();", submit_button)
-            print("✓ Submit button clicked - proceeding to next page")
+            dom.click(driver, submit_button)
+            log("✓ Submit button clicked - proceeding to next page")
             return True
         except Exception as e:
-            print("✗ Could not click Submit:", str(e))
+            log("✗ Could not click Submit:", str(e))
             return False
 
     # Try once; if fail, reload post page and retry once
     success = try_fill_once()
     if not success:
         try:
-            driver.get("https://homehni.in/post-property")
+            driver.get(f"{BASE_URL}/post-property")
             WebDriverWait(driver, 15).until(
                 EC.presence_of_element_located((By.XPATH, "//button[@role='combobox' and contains(., 'Select city')] | //button[contains(., 'Start Posting Your Ad For FREE')]"))
             )
-            print("↻ Retrying first page after reload...")
+            log("↻ Retrying first page after reload...")
             try_fill_once()
         except Exception:
             pass
 
+@log.step
 def fill_room_type_page(driver):
     """Fill the room type page - select Single room type and submit."""
-    print("Starting to fill room type page...")
+    log("Starting to fill room type page...")
     
     # Wait for page transition
-    time.sleep(3)
+    waits.settled(driver)
     
     # Select Single room type
     try:
         single_room = WebDriverWait(driver, 10).until(
             EC.element_to_be_clickable((By.XPATH, "//div[contains(@class, 'border-2') and contains(@class, 'cursor-pointer') and contains(., 'Single')]"))
         )
-        driver.execute_script("arguments[0].scrollIntoView({block:'center'});", single_room)
-        time.sleep(0.5)
-        driver.execute_script("arguments[0].click();", single_room)
-        print("✓ Single room type selected")
+        dom.click(driver, single_room)
+        log("✓ Single room type selected")
     except Exception as e:
-        print("✗ Could not select Single room type:", str(e))
+        log("✗ Could not select Single room type:", str(e))
     
     # Click Save & Continue button
     try:
@@ -181,8 +183,7 @@ def fill_room_type_page(driver):
         
         for selector in selectors:
             try:
-                elements = driver.find_elements(By.XPATH, selector)
-                visible_elements = [el for el in elements if el.is_displayed()]
+                visible_elements = dom.visible(driver, selector)
                 if visible_elements:
                     save_button = visible_elements[0]
                     break
@@ -190,61 +191,28 @@ def fill_room_type_page(driver):
                 continue
         
         if save_button:
-            driver.execute_script("arguments[0].click();", save_button)
-            print("✓ Save & Continue button clicked - proceeding to next page")
+            with waits.acknowledged(driver, "Save & Continue"):
+                driver.execute_script("arguments[0].click();", save_button)
+            log("✓ Save & Continue button clicked - proceeding to next page")
         else:
-            print("✗ Could not find Save & Continue button with any selector")
+            log("✗ Could not find Save & Continue button with any selector")
     except Exception as e:
-        print("✗ Could not find Save & Continue button:", str(e))
+        log("✗ Could not find Save & Continue button:", str(e))
 
+@log.step
 def fill_room_details_page(driver):
     """Fill the room details page - rent, deposit, and amenities."""
-    print("Starting to fill room details page...")
+    log("Starting to fill room details page...")
     
     # Wait for page transition
-    time.sleep(3)
-    
-    # Expected Rent per person
-    try:
-        rent_input = WebDriverWait(driver, 10).until(
-            EC.element_to_be_clickable((By.XPATH, "//input[@id='single-rent']"))
-        )
-        rent_input.clear()
-        rent_input.send_keys(EXPECTED_RENT)
-        print(f"✓ Expected Rent per person filled: {EXPECTED_RENT}")
-    except Exception as e:
-        print("✗ Could not fill Expected Rent field:", str(e))
-    
-    # Expected Deposit per Person
-    try:
-        deposit_input = WebDriverWait(driver, 10).until(
-            EC.element_to_be_clickable((By.XPATH, "//input[@id='single-deposit']"))
-        )
-        deposit_input.clear()
-        deposit_input.send_keys(EXPECTED_DEPOSIT)
-        print(f"✓ Expected Deposit per person filled: {EXPECTED_DEPOSIT}")
-    except Exception as e:
-        print("✗ Could not fill Expected Deposit field:", str(e))
-    
-    # Room Amenities - Select Cupboard
-    try:
-        cupboard_checkbox = WebDriverWait(driver, 10).until(
-            EC.element_to_be_clickable((By.XPATH, "//button[@id='cupboard']"))
-        )
-        driver.execute_script("arguments[0].click();", cupboard_checkbox)
-        print("✓ Cupboard amenity selected")
-    except Exception as e:
-        print("✗ Could not select Cupboard amenity:", str(e))
+    waits.settled(driver)
     
-    # Room Amenities - Select AC
-    try:
-        ac_checkbox = WebDriverWait(driver, 10).until(
-            EC.element_to_be_clickable((By.XPATH, "//button[@id='ac']"))
-        )
-        driver.execute_script("arguments[0].click();", ac_checkbox)
-        print("✓ AC amenity selected")
-    except Exception as e:
-        print("✗ Could not select AC amenity:", str(e))
+    forms.fill_page(driver, "pg.room_details", {
+        "Expected Rent per person": (forms.NUMBER, "//input[@id='single-rent']", EXPECTED_RENT),
+        "Expected Deposit per person": (forms.NUMBER, "//input[@id='single-deposit']", EXPECTED_DEPOSIT),
+        "Cupboard": (forms.CHECKBOX, "//button[@id='cupboard']", True),
+        "AC": (forms.CHECKBOX, "//button[@id='ac']", True),
+    })
     
     # Click Save & Continue button
     try:
@@ -259,8 +227,7 @@ def fill_room_details_page(driver):
         
         for selector in selectors:
             try:
-                elements = driver.find_elements(By.XPATH, selector)
-                visible_elements = [el for el in elements if el.is_displayed()]
+                visible_elements = dom.visible(driver, selector)
                 if visible_elements:
                     save_button = visible_elements[0]
                     break
@@ -268,19 +235,21 @@ def fill_room_details_page(driver):
                 continue
         
         if save_button:
-            driver.execute_script("arguments[0].click();", save_button)
-            print("✓ Save & Continue button clicked - proceeding to next page")
+            with waits.acknowledged(driver, "Save & Continue"):
+                driver.execute_script("arguments[0].click();", save_button)
+            log("✓ Save & Continue button clicked - proceeding to next page")
         else:
-            print("✗ Could not find Save & Continue button with any selector")
+            log("✗ Could not find Save & Continue button with any selector")
     except Exception as e:
-        print("✗ Could not find Save & Continue button:", str(e))
+        log("✗ Could not find Save & Continue button:", str(e))
 
+@log.step
 def fill_locality_details_page(driver):
     """Fill the locality details page - city and locality with autocomplete."""
-    print("Starting to fill locality details page...")
+    log("Starting to fill locality details page...")
     
     # Wait for page transition
-    time.sleep(3)
+    waits.settled(driver)
     
     # City input - Type "Bangalore" and select first suggestion
     try:
@@ -296,9 +265,9 @@ def fill_locality_details_page(driver):
             EC.presence_of_element_located((By.XPATH, "//div[@class='pac-item'][1]"))
         )
         driver.execute_script("arguments[0].click();", first_suggestion)
-        print("✓ City selected: Bangalore")
+        log("✓ City selected: Bangalore")
     except Exception as e:
-        print("✗ Could not fill City field:", str(e))
+        log("✗ Could not fill City field:", str(e))
     
     # Locality input - Type "Bellandur" and select first suggestion
     try:
@@ -314,9 +283,9 @@ def fill_locality_details_page(driver):
             EC.presence_of_element_located((By.XPATH, "//div[@class='pac-item'][1]"))
         )
         driver.execute_script("arguments[0].click();", first_suggestion)
-        print("✓ Locality selected: Bellandur")
+        log("✓ Locality selected: Bellandur")
     except Exception as e:
-        print("✗ Could not fill Locality field:", str(e))
+        log("✗ Could not fill Locality field:", str(e))
     
     # Click Save & Continue button
     try:
@@ -331,8 +300,7 @@ def fill_locality_details_page(driver):
         
         for selector in selectors:
             try:
-                elements = driver.find_elements(By.XPATH, selector)
-                visible_elements = [el for el in elements if el.is_displayed()]
+                visible_elements = dom.visible(driver, selector)
                 if visible_elements:
                     save_button = visible_elements[0]
                     break
@@ -340,19 +308,21 @@ def fill_locality_details_page(driver):
                 continue
         
         if save_button:
-            driver.execute_script("arguments[0].click();", save_button)
-            print("✓ Save & Continue button clicked - proceeding to next page")
+            with waits.acknowledged(driver, "Save & Continue"):
+                driver.execute_script("arguments[0].click();", save_button)
+            log("✓ Save & Continue button clicked - proceeding to next page")
         else:
-            print("✗ Could not find Save & Continue button with any selector")
+            log("✗ Could not find Save & Continue button with any selector")
     except Exception as e:
-        print("✗ Could not find Save & Continue button:", str(e))
+        log("✗ Could not find Save & Continue button:", str(e))
 
+@log.step
 def fill_pg_details_page(driver):
     """Fill the PG details page - rules and description."""
-    print("Starting to fill PG details page...")
+    log("Starting to fill PG details page...")
     
     # Wait for page transition
-    time.sleep(3)
+    waits.settled(driver)
     
     # No Smoking checkbox
     try:
@@ -360,9 +330,9 @@ def fill_pg_details_page(driver):
             EC.element_to_be_clickable((By.XPATH, "//button[@id='noSmoking']"))
         )
         driver.execute_script("arguments[0].click();", no_smoking_checkbox)
-        print("✓ No Smoking rule selected")
+        log("✓ No Smoking rule selected")
     except Exception as e:
-        print("✗ Could not select No Smoking rule:", str(e))
+        log("✗ Could not select No Smoking rule:", str(e))
     
     # No Drinking checkbox
     try:
@@ -370,20 +340,21 @@ def fill_pg_details_page(driver):
             EC.element_to_be_clickable((By.XPATH, "//button[@id='noDrinking']"))
         )
         driver.execute_script("arguments[0].click();", no_drinking_checkbox)
-        print("✓ No Drinking rule selected")
+        log("✓ No Drinking rule selected")
     except Exception as e:
-        print("✗ Could not select No Drinking rule:", str(e))
+        log("✗ Could not select No Drinking rule:", str(e))
     
     # Description textarea
     try:
         description_textarea = WebDriverWait(driver, 10).until(
             EC.element_to_be_clickable((By.XPATH, "//textarea[@id='description']"))
         )
-        description_textarea.clear()
-        description_textarea.send_keys(DESCRIPTION)
-        print(f"✓ Description filled: {DESCRIPTION[:50]}...")
+        if forms.set_text(driver, description_textarea, DESCRIPTION):
+            log(f"✓ Description filled: {DESCRIPTION[:50]}...")
+        else:
+            log("✗ Description does not hold the text")
     except Exception as e:
-        print("✗ Could not fill Description field:", str(e))
+        log("✗ Could not fill Description field:", str(e))
     
     # Click Save & Continue button
     try:
@@ -398,8 +369,7 @@ def fill_pg_details_page(driver):
         
         for selector in selectors:
             try:
-                elements = driver.find_elements(By.XPATH, selector)
-                visible_elements = [el for el in elements if el.is_displayed()]
+                visible_elements = dom.visible(driver, selector)
                 if visible_elements:
                     save_button = visible_elements[0]
                     break
@@ -407,19 +377,21 @@ def fill_pg_details_page(driver):
                 continue
         
         if save_button:
-            driver.execute_script("arguments[0].click();", save_button)
-            print("✓ Save & Continue button clicked - proceeding to next page")
+            with waits.acknowledged(driver, "Save & Continue"):
+                driver.execute_script("arguments[0].click();", save_button)
+            log("✓ Save & Continue button clicked - proceeding to next page")
         else:
-            print("✗ Could not find Save & Continue button with any selector")
+            log("✗ Could not find Save & Continue button with any selector")
     except Exception as e:
-        print("✗ Could not find Save & Continue button:", str(e))
+        log("✗ Could not find Save & Continue button:", str(e))
 
+@log.step
 def fill_amenities_page(driver):
     """Fill the amenities page - dropdowns, checkboxes, and directions."""
-    print("Starting to fill amenities page...")
+    log("Starting to fill amenities page...")
     
     # Wait for page transition
-    time.sleep(3)
+    waits.settled(driver)
     
     # Handle all dropdowns - select first option for each
     try:
@@ -429,7 +401,7 @@ def fill_amenities_page(driver):
         
         # Find all visible combobox buttons on the page
         comboboxes = WebDriverWait(driver, 10).until(
-            lambda d: [el for el in d.find_elements(By.XPATH, "//button[@role='combobox']") if el.is_displayed()]
+            lambda d: dom.visible(d, "//button[@role='combobox']")
         )
         
         # We expect 3 dropdowns: Laundry, Room Cleaning, Warden Facility
@@ -437,34 +409,33 @@ def fill_amenities_page(driver):
         
         for idx, cb in enumerate(comboboxes[:3]):
             try:
-                driver.execute_script("arguments[0].scrollIntoView({block:'center'});", cb)
-                time.sleep(0.2)
-                driver.execute_script("arguments[0].click();", cb)
+                dom.click(driver, cb)
                 
                 # Wait for dropdown options to appear and select first option
                 first_option = WebDriverWait(driver, 5).until(
                     EC.element_to_be_clickable((By.XPATH, "//div[@role='option'][1]"))
                 )
                 driver.execute_script("arguments[0].click();", first_option)
-                print(f"✓ {dropdown_names[idx]} selected (first option)")
+                log(f"✓ {dropdown_names[idx]} selected (first option)")
                 time.sleep(0.2)
             except Exception as inner_e:
-                print(f"⚠️  {dropdown_names[idx]} selection failed:", str(inner_e))
+                log(f"⚠️  {dropdown_names[idx]} selection failed:", str(inner_e))
                 driver.execute_script("document.body.click();")
                 time.sleep(0.2)
     except Exception as e:
-        print("✗ Could not process dropdown selections:", str(e))
+        log("✗ Could not process dropdown selections:", str(e))
     
     # Directions for clients textarea
     try:
         directions_textarea = WebDriverWait(driver, 10).until(
             EC.element_to_be_clickable((By.XPATH, "//textarea[contains(@placeholder, 'Take the road opposite')]"))
         )
-        directions_textarea.clear()
-        directions_textarea.send_keys(DIRECTIONS_TIP)
-        print(f"✓ Directions filled: {DIRECTIONS_TIP[:50]}...")
+        if forms.set_text(driver, directions_textarea, DIRECTIONS_TIP):
+            log(f"✓ Directions filled: {DIRECTIONS_TIP[:50]}...")
+        else:
+            log("✗ Directions does not hold the text")
     except Exception as e:
-        print("✗ Could not fill Directions field:", str(e))
+        log("✗ Could not fill Directions field:", str(e))
     
     # Select checkboxes: Mess, Cooking Allowed, Wifi
     checkbox_ids = ["mess", "cookingAllowed", "wifi"]
@@ -476,9 +447,9 @@ def fill_amenities_page(driver):
                 EC.element_to_be_clickable((By.XPATH, f"//button[@id='{checkbox_id}']"))
             )
             driver.execute_script("arguments[0].click();", checkbox)
-            print(f"✓ {checkbox_names[i]} selected")
+            log(f"✓ {checkbox_names[i]} selected")
         except Exception as e:
-            print(f"✗ Could not select {checkbox_names[i]}:", str(e))
+            log(f"✗ Could not select {checkbox_names[i]}:", str(e))
     
     # Click Save & Continue button
     try:
@@ -493,8 +464,7 @@ def fill_amenities_page(driver):
         
         for selector in selectors:
             try:
-                elements = driver.find_elements(By.XPATH, selector)
-                visible_elements = [el for el in elements if el.is_displayed()]
+                visible_elements = dom.visible(driver, selector)
                 if visible_elements:
                     save_button = visible_elements[0]
                     break
@@ -502,17 +472,19 @@ def fill_amenities_page(driver):
                 continue
         
         if save_button:
-            driver.execute_script("arguments[0].click();", save_button)
-            print("✓ Save & Continue button clicked - proceeding to next page")
+            with waits.acknowledged(driver, "Save & Continue"):
+                driver.execute_script("arguments[0].click();", save_button)
+            log("✓ Save & Continue button clicked - proceeding to next page")
         else:
-            print("✗ Could not find Save & Continue button with any selector")
+            log("✗ Could not find Save & Continue button with any selector")
     except Exception as e:
-        print("✗ Could not find Save & Continue button:", str(e))
+        log("✗ Could not find Save & Continue button:", str(e))
 
+@log.step
 def fill_gallery_page(driver):
     """Skip gallery uploads and just click Save & Continue."""
-    print("Starting to fill gallery page...")
-    print("⚠️  Skipping image and video uploads - proceeding directly to Save & Continue")
+    log("Starting to fill gallery page...")
+    log("⚠️  Skipping image and video uploads - proceeding directly to Save & Continue")
     
     # Wait a moment for page to load
     time.sleep(2)
@@ -530,8 +502,7 @@ def fill_gallery_page(driver):
         
         for selector in selectors:
             try:
-                elements = driver.find_elements(By.XPATH, selector)
-                visible_elements = [el for el in elements if el.is_displayed()]
+                visible_elements = dom.visible(driver, selector)
                 if visible_elements:
                     save_button = visible_elements[0]
                     break
@@ -539,94 +510,94 @@ def fill_gallery_page(driver):
                 continue
         
         if save_button:
-            driver.execute_script("arguments[0].click();", save_button)
-            print("✓ Save & Continue button clicked - proceeding to next page")
+            with waits.acknowledged(driver, "Save & Continue"):
+                driver.execute_script("arguments[0].click();", save_button)
+            log("✓ Save & Continue button clicked - proceeding to next page")
         else:
-            print("✗ Could not find Save & Continue button with any selector")
+            log("✗ Could not find Save & Continue button with any selector")
     except Exception as e:
-        print("✗ Could not find Save & Continue button:", str(e))
+        log("✗ Could not find Save & Continue button:", str(e))
 
+@log.step
 def fill_schedule_and_submit(driver):
     """Fill the schedule page and submit the property."""
-    print("Starting to fill schedule page...")
+    log("Starting to fill schedule page...")
     
     # Wait for page transition
-    time.sleep(3)
+    waits.settled(driver)
     
     # Click Submit Property button
     try:
         submit_button = WebDriverWait(driver, 10).until(
             EC.element_to_be_clickable((By.XPATH, "//button[contains(text(), 'Submit Property')]"))
         )
-        driver.execute_script("arguments[0].scrollIntoView({block:'center'});", submit_button)
-        time.sleep(0.5)
-        driver.execute_script("arguments[0].click();", submit_button)
-        print("✓ Submit Property button clicked - property submitted!")
-        
-        # Wait for submission to complete
-        time.sleep(3)
+        with waits.acknowledged(driver, "Submit Property", submit=True):
+            dom.click(driver, submit_button)
+        log("✓ Submit Property button clicked - property submitted!")
         
     except Exception as e:
-        print("✗ Could not find or click Submit Property button:", str(e))
+        log("✗ Could not find or click Submit Property button:", str(e))
 
+@log.step
 def start_new_post(driver):
     """Navigate to post property page to start a new property posting."""
-    print("Starting new property posting...")
+    log("Starting new property posting...")
     
     try:
-        driver.get("https://homehni.in/post-property")
+        driver.get(f"{BASE_URL}/post-property")
         WebDriverWait(driver, 15).until(
             EC.presence_of_element_located((By.XPATH, "//button[@role='combobox' and contains(., 'Select city')] | //button[contains(., 'Start Posting Your Ad For FREE')]"))
         )
-        print("✓ Navigated to post property page - ready for next property")
+        log("✓ Navigated to post property page - ready for next property")
         time.sleep(2)
     except Exception as e:
-        print("✗ Could not navigate to post property page:", str(e))
+        log("✗ Could not navigate to post property page:", str(e))
 
 def run_full_post_flow(driver, property_index):
     """Run the complete property posting flow for one property."""
-    print(f"\n{'='*50}")
-    print(f"PG/HOSTEL PROPERTY {property_index} - Starting posting flow")
-    print(f"{'='*50}")
+    with log.listing(property_index):
+        log(f"\n{'='*50}")
+        log(f"PG/HOSTEL PROPERTY {property_index} - Starting posting flow")
+        log(f"{'='*50}")
     
-    try:
-        # Fill the first page form
-        fill_first_page(driver)
-        time.sleep(3)
+        try:
+            # Fill the first page form
+            fill_first_page(driver)
+            waits.settled(driver)
 
-        # Fill the room type page
-        fill_room_type_page(driver)
-        time.sleep(3)
+            # Fill the room type page
+            fill_room_type_page(driver)
+            waits.settled(driver)
 
-        # Fill the room details page
-        fill_room_details_page(driver)
-        time.sleep(3)
+            # Fill the room details page
+            fill_room_details_page(driver)
+            waits.settled(driver)
 
-        # Fill the locality details page
-        fill_locality_details_page(driver)
-        time.sleep(3)
+            # Fill the locality details page
+            fill_locality_details_page(driver)
+            waits.settled(driver)
 
-        # Fill the PG details page
-        fill_pg_details_page(driver)
-        time.sleep(3)
+            # Fill the PG details page
+            fill_pg_details_page(driver)
+            waits.settled(driver)
 
-        # Fill the amenities page
-        fill_amenities_page(driver)
-        time.sleep(3)
+            # Fill the amenities page
+            fill_amenities_page(driver)
+            waits.settled(driver)
 
-        # Fill the gallery page
-        fill_gallery_page(driver)
-        time.sleep(3)
+            # Fill the gallery page
+            fill_gallery_page(driver)
+            waits.settled(driver)
 
-        # Fill the schedule page and submit
-        fill_schedule_and_submit(driver)
+            # Fill the schedule page and submit
+            fill_schedule_and_submit(driver)
         
-        print(f"✓ PG/Hostel Property {property_index} submitted successfully!")
-        return True
+            log(f"✓ PG/Hostel Property {property_index} submitted successfully!")
+            return True
         
-    except Exception as e:
-        print(f"✗ Error posting PG/Hostel property {property_index}: {str(e)}")
-        return False
+        except Exception as e:
+            log(f"✗ Error posting PG/Hostel property {property_index}: {str(e)}")
+            return False
 
 def main():
     """Main entry point."""
@@ -634,14 +605,14 @@ def main():
     try:
         num_properties = int(input("How many PG/Hostel properties do you want to post? Enter a number: "))
         if num_properties <= 0:
-            print("Please enter a positive number.")
+            log("Please enter a positive number.")
             return
     except ValueError:
-        print("Please enter a valid number.")
+        log("Please enter a valid number.")
         return
 
     # Initialize Chrome WebDriver
-    driver = webdriver.Chrome()
+    driver = create_driver()
     driver.maximize_window()
 
     try:
@@ -659,19 +630,19 @@ def main():
                 
                 if success:
                     successful_posts += 1
-                    print(f"✓ PG/Hostel Property {i} completed successfully!")
+                    log(f"✓ PG/Hostel Property {i} completed successfully!")
                 else:
                     failed_posts += 1
-                    print(f"✗ PG/Hostel Property {i} failed!")
+                    log(f"✗ PG/Hostel Property {i} failed!")
                 
                 # If not the last property, start a new post
                 if i < num_properties:
-                    print(f"\nStarting PG/Hostel property {i+1}...")
+                    log(f"\nStarting PG/Hostel property {i+1}...")
                     start_new_post(driver)
                     time.sleep(2)
                     
             except Exception as e:
-                print(f"✗ Error with PG/Hostel property {i}: {str(e)}")
+                log(f"✗ Error with PG/Hostel property {i}: {str(e)}")
                 failed_posts += 1
                 
                 # If not the last property, try to start a new post
@@ -680,25 +651,26 @@ def main():
                         start_new_post(driver)
                         time.sleep(2)
                     except:
-                        print("Could not start new post. Please check the browser manually.")
+                        log("Could not start new post. Please check the browser manually.")
                         break
 
         # Final summary
-        print(f"\n{'='*60}")
-        print(f"PG/HOSTEL POSTING COMPLETE!")
-        print(f"{'='*60}")
-        print(f"Total properties requested: {num_properties}")
-        print(f"Successfully posted: {successful_posts}")
-        print(f"Failed posts: {failed_posts}")
-        print(f"Success rate: {(successful_posts/num_properties)*100:.1f}%")
-        print(f"{'='*60}")
-
+        log(f"\n{'='*60}")
+        log(f"PG/HOSTEL POSTING COMPLETE!")
+        log(f"{'='*60}")
+        log(f"Total properties requested: {num_properties}")
+        log(f"Successfully posted: {successful_posts}")
+        log(f"Failed posts: {failed_posts}")
+        log(f"Success rate: {(successful_posts/num_properties)*100:.1f}%")
+        log(f"{'='*60}")
+
+        log.flush()
         input("Press Enter to close the browser...")
 
     except Exception as e:
-        print(f"An error occurred: {str(e)}")
+        log(f"An error occurred: {str(e)}")
     finally:
-        driver.quit()
+        release(driver)
 
 if __name__ == "__main__":
     main()
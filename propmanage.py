@@ -15,19 +15,27 @@ Usage:
 """
 
 import time
-import random
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
+from drivers import BASE_URL, create_driver, release
+import dom
+import options
+import waits
+from eventlog import get_logger
+
+log = get_logger("property_management")
+
 # Configuration
+SERVICE_TAB = "Property Management"  # tab on the Services page that shows this form
+FORM_FIELD_ID = "property-phone-mobile"
 PHONE_NUMBER = "9902978675"
 
 
 def wait_for_user_on_management_form(driver):
     """Open home page and let the user log in and navigate to the Property Management form."""
-    driver.get("https://homehni.in/")
+    driver.get(f"{BASE_URL}/")
     input(
         "Please log in (if needed), then open Services → Property Management so the form is visible.\n"
         "Press Enter here to begin filling the form..."
@@ -50,6 +58,7 @@ def _get_value(driver, element) -> str:
     return driver.execute_script("return arguments[0].value;", element) or ""
 
 
+@log.step
 def fill_phone(driver):
     try:
         phone_input = WebDriverWait(driver, 12).until(
@@ -72,6 +81,7 @@ def fill_phone(driver):
         return False
 
 
+@log.step
 def select_city_first_option(driver):
     try:
         # Prefer combobox labeled City
@@ -83,15 +93,10 @@ def select_city_first_option(driver):
             )
         except Exception:
             # Fallback: choose second visible combobox (skip any country code dropdown)
-            all_cb = WebDriverWait(driver, 8).until(
-                EC.presence_of_all_elements_located((By.XPATH, "//button[@role='combobox']"))
-            )
-            visible = [c for c in all_cb if c.is_displayed()]
+            visible = WebDriverWait(driver, 8).until(lambda d: dom.visible(d, "//button[@role='combobox']"))
             city_cb = visible[1] if len(visible) >= 2 else visible[0]
 
-        driver.execute_script("arguments[0].scrollIntoView({block:'center'});", city_cb)
-        time.sleep(0.2)
-        driver.execute_script("arguments[0].click();", city_cb)
+        dom.click(driver, city_cb)
         time.sleep(0.4)
         first_opt = WebDriverWait(driver, 6).until(
             EC.element_to_be_clickable((By.XPATH, "(//div[@role='option'] | //li[@role='option'])[1]"))
@@ -102,6 +107,7 @@ def select_city_first_option(driver):
         return False
 
 
+@log.step
 def select_property_type_random(driver):
     try:
         # Property Type combobox
@@ -113,29 +119,15 @@ def select_property_type_random(driver):
             )
         except Exception:
             # Fallback: last visible combobox on the form
-            all_cb = WebDriverWait(driver, 8).until(
-                EC.presence_of_all_elements_located((By.XPATH, "//button[@role='combobox']"))
-            )
-            visible = [c for c in all_cb if c.is_displayed()]
+            visible = WebDriverWait(driver, 8).until(lambda d: dom.visible(d, "//button[@role='combobox']"))
             prop_cb = visible[-1]
 
-        driver.execute_script("arguments[0].scrollIntoView({block:'center'});", prop_cb)
-        time.sleep(0.2)
-        driver.execute_script("arguments[0].click();", prop_cb)
-        time.sleep(0.4)
-        options = WebDriverWait(driver, 6).until(
-            EC.presence_of_all_elements_located((By.XPATH, "//div[@role='option']"))
-        )
-        visible_opts = [o for o in options if o.is_displayed()]
-        if not visible_opts:
-            return False
-        idx = random.randint(0, len(visible_opts) - 1)
-        driver.execute_script("arguments[0].click();", visible_opts[idx])
-        return True
+        return options.select(driver, prop_cb, "property_management.property_type") is not None
     except Exception:
         return False
 
 
+@log.step
 def submit_support(driver):
     try:
         submit_btn = WebDriverWait(driver, 10).until(
@@ -146,39 +138,51 @@ def submit_support(driver):
                 )
             )
         )
-        driver.execute_script("arguments[0].scrollIntoView({block:'center'});", submit_btn)
-        time.sleep(0.2)
-        driver.execute_script("arguments[0].click();", submit_btn)
+        dom.click(driver, submit_btn)
         return True
     except Exception:
         return False
 
 
+@log.step
 def wait_for_form_reset(driver, timeout: int = 10):
-    """Wait until the form resets (phone input becomes empty)."""
+    """Wait until the form resets (phone input becomes empty) or a success toast shows."""
     try:
-        WebDriverWait(driver, timeout).until(
-            lambda d: (
-                (d.find_element(By.ID, "property-phone-mobile").get_attribute("value") or "") == ""
-            )
-        )
-        return True
+        return waits.form_reset(driver, [FORM_FIELD_ID], timeout) is not None
     except Exception:
         return False
 
 
+def submit_request(driver, index: int) -> bool:
+    """Fill and submit one Property Management request; returns True when the submit click went through."""
+    with log.listing(index):
+        ok = True
+        ok &= fill_phone(driver)
+        ok &= select_city_first_option(driver)
+        ok &= select_property_type_random(driver)
+
+        if not ok:
+            log(f"✗ Could not prepare form for submission {index}")
+            return False
+        if submit_support(driver):
+            log(f"✓ Property Management request {index} submitted successfully")
+            return True
+        log(f"✗ Submission click failed for request {index}")
+        return False
+
+
 def main():
     # Ask user for number of requests to submit
     try:
         num_requests = int(input("How many Property Management requests do you want to submit? Enter a number: "))
         if num_requests <= 0:
-            print("Please enter a positive number.")
+            log("Please enter a positive number.")
             return
     except ValueError:
-        print("Please enter a valid number.")
+        log("Please enter a valid number.")
         return
 
-    driver = webdriver.Chrome()
+    driver = create_driver()
     driver.maximize_window()
 
     try:
@@ -188,39 +192,28 @@ def main():
         failed = 0
 
         for i in range(1, num_requests + 1):
-            ok = True
-            ok &= fill_phone(driver)
-            ok &= select_city_first_option(driver)
-            ok &= select_property_type_random(driver)
-
-            if not ok:
-                print(f"✗ Could not prepare form for submission {i}")
-                failed += 1
+            if submit_request(driver, i):
+                successful += 1
             else:
-                if submit_support(driver):
-                    print(f"✓ Property Management request {i} submitted successfully")
-                    successful += 1
-                else:
-                    print(f"✗ Submission click failed for request {i}")
-                    failed += 1
+                failed += 1
 
             if i < num_requests:
                 reset_ok = wait_for_form_reset(driver, timeout=10)
-                time.sleep(3)
                 if not reset_ok:
-                    print(f"⚠️  Form may not have reset for request {i}; continuing anyway...")
-                time.sleep(0.5)
+                    log(f"⚠️  Form may not have reset for request {i}; continuing anyway...")
+                    time.sleep(0.5)
 
-        print("\n==============================")
-        print("PROPERTY MANAGEMENT REQUESTS COMPLETE")
-        print("==============================")
-        print(f"Requested: {num_requests}")
-        print(f"Successful: {successful}")
-        print(f"Failed: {failed}")
+        log("\n==============================")
+        log("PROPERTY MANAGEMENT REQUESTS COMPLETE")
+        log("==============================")
+        log(f"Requested: {num_requests}")
+        log(f"Successful: {successful}")
+        log(f"Failed: {failed}")
 
+        log.flush()
         input("Press Enter to close the browser...")
     finally:
-        driver.quit()
+        release(driver)
 
 
 if __name__ == "__main__":
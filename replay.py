@@ -0,0 +1,191 @@
+"""
+Module Name: replay.py
+
+Purpose:
+    Seeded, recorded randomness for the flows. Every run carries a seed and
+    each listing draws its choices (random dropdown options, Yes/No picks)
+    from its own generator derived from (seed, flow, listing), so the
+    outcome does not depend on how workers interleave. Every choice is also
+    recorded as a "decision" event in the run's event log. A replay re-runs
+    the same listings with the same seed and, where recorded, the exact same
+    option texts, so a slow listing can be reproduced, bisected and profiled.
+
+Usage:
+    import replay
+    text = replay.choice(option_texts, "loans.loan_type")
+    index = replay.randint(0, 1, "Gated Property?")
+
+    # Reproduce listing 213 of an earlier run
+    python replay.py 20250101-101500-4242 --flow commercial_sale --listing 213
+
+    Environment:
+        HNI_SEED     seed for this run (default: random, recorded in the event log)
+        HNI_REPLAY   run id whose seed and decisions this process should follow
+"""
+
+import argparse
+import glob
+import json
+import os
+import random
+import threading
+from collections import defaultdict, deque
+
+import eventlog
+from eventlog import get_logger
+
+log = get_logger("replay")
+
+# Configuration
+REPLAY_RUN = os.environ.get("HNI_REPLAY")
+
+_local = threading.local()
+_lock = threading.Lock()
+_seed = None
+_decisions = None   # (flow, listing) -> deque of recorded decisions while replaying
+
+
+def _events(run_id: str):
+    """Events of one run from the current and rotated event logs."""
+    pattern = os.path.join(eventlog.LOG_DIR, eventlog.LOG_FILE)
+    for path in sorted(glob.glob(pattern + "*"), reverse=True):
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    event = json.loads(line)
+                except ValueError:
+                    continue
+                if event.get("run") == run_id:
+                    yield event
+
+
+def load(run_id: str):
+    """Follow the seed and decisions recorded by an earlier run."""
+    global _seed, _decisions
+    seed, decisions = None, defaultdict(deque)
+    for event in _events(run_id):
+        if event.get("event") == "seed":
+            seed = event["seed"]
+        elif event.get("event") == "listing_start":
+            decisions[(event.get("flow"), event.get("listing"))]
+        elif event.get("event") == "decision":
+            decisions[(event.get("flow"), event.get("listing"))].append(event)
+    if not decisions:
+        raise ValueError(f"No listings recorded for run '{run_id}' in {eventlog.LOG_DIR}")
+    with _lock:
+        # A run that never drew a random choice never announced its seed
+        _seed = seed if seed is not None else 0
+        _decisions = decisions
+    eventlog.emit("seed", seed=seed, replay_of=run_id)
+    return decisions
+
+
+def seed() -> int:
+    """This run's seed, announced once in the event log."""
+    global _seed
+    with _lock:
+        if _seed is not None:
+            return _seed
+        _seed = int(os.environ.get("HNI_SEED") or random.SystemRandom().randrange(2 ** 32))
+    eventlog.emit("seed", seed=_seed)
+    return _seed
+
+
+def rng() -> random.Random:
+    """Generator for the calling thread's current (flow, listing)."""
+    flow, listing, _ = eventlog.current()
+    key = (flow, listing)
+    if getattr(_local, "key", None) != key:
+        _local.key = key
+        _local.rng = random.Random(f"{seed()}:{flow}:{listing}")
+    return _local.rng
+
+
+def _on_event(event):
+    # A listing that starts again (retry, replay) draws its choices from the start
+    if event.get("event") == "listing_start":
+        _local.key = None
+
+
+eventlog.subscribe(_on_event)
+
+
+def _recorded(label: str):
+    """Next recorded decision for this listing, if replaying and it matches `label`."""
+    if _decisions is None:
+        return None
+    flow, listing, _ = eventlog.current()
+    pending = _decisions.get((flow, listing))
+    if not pending:
+        return None
+    decision = pending.popleft()
+    if decision.get("label") != label:
+        log(f"⚠️  Replay diverged at {label} (recorded {decision.get('label')})")
+        pending.clear()
+        return None
+    return decision
+
+
+def choice(seq, label: str):
+    """Pick one item of `seq` reproducibly and record it."""
+    seq = list(seq)
+    recorded = _recorded(label)
+    if recorded is not None and recorded.get("value") in seq:
+        value = recorded["value"]
+    else:
+        value = rng().choice(seq)
+    eventlog.emit("decision", label=label, value=value, options=len(seq))
+    return value
+
+
+def randint(a: int, b: int, label: str) -> int:
+    """random.randint(a, b), reproducible and recorded."""
+    recorded = _recorded(label)
+    if recorded is not None and a <= recorded.get("value", a - 1) <= b:
+        value = recorded["value"]
+    else:
+        value = rng().randint(a, b)
+    eventlog.emit("decision", label=label, value=value, options=b - a + 1)
+    return value
+
+
+if REPLAY_RUN:
+    load(REPLAY_RUN)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Re-run listings of an earlier run with its seed and decisions")
+    parser.add_argument("run", help="run id (the 'run' field in runs/events.jsonl)")
+    parser.add_argument("--flow", help="only listings of this flow")
+    parser.add_argument("--listing", type=int, action="append", help="only this listing index (repeatable)")
+    args = parser.parse_args()
+
+    import drivers
+    import flows
+
+    decisions = load(args.run)
+    targets = sorted(
+        (flow, listing) for flow, listing in decisions if flow and listing is not None
+        and (not args.flow or flow == args.flow) and (not args.listing or listing in args.listing)
+    )
+    if not targets:
+        log(f"✗ No recorded listings match in run {args.run}")
+        log.flush()
+        return
+
+    driver = drivers.create_driver()
+    try:
+        driver.maximize_window()
+        flows.login(driver, targets[0][0])
+        for flow, listing in targets:
+            log(f"Replaying {flow} #{listing} ({len(decisions[(flow, listing)])} decisions)")
+            ok, error = flows.run_item(driver, flow, listing)
+            log(f"✓ Replayed {flow} #{listing}" if ok else f"✗ Replay of {flow} #{listing} failed ({error})")
+    finally:
+        log.flush()
+        input("Press Enter to close...")
+        drivers.release(driver)
+
+
+if __name__ == "__main__":
+    main()
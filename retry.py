@@ -0,0 +1,181 @@
+"""
+Module Name: retry.py
+
+Purpose:
+    Retries failed listings and leads instead of only counting them. A failure
+    (an item that never reached the backend: its Submit Property or lead
+    submit did not go through) is parked with its error class and comes back
+    after an exponential backoff, on a fresh tab: the pool runners
+    (orchestrator, daemon) interleave due retries with new work, and the
+    single-flow scripts retry everything at the end of their run. An item that
+    was submitted but had failed steps is "partial" and is never retried, as
+    that would post it twice. Items that still fail after the last attempt are
+    written to a dead-letter file, so a run reaches its target count in one
+    pass and the leftovers can be inspected or re-queued later.
+
+Usage:
+    retries = retry.RetryQueue()
+    ok, error = flows.run_item(driver, "loans", 7)   # ok for a partial (submitted) item too
+    if not ok:
+        retries.park("loans", 7, error)      # False when it went to the dead-letter file
+
+    # Pool workers: prefer a due retry over new work
+    item = retries.pop_due()                 # (flow, index, context) or None
+    driver, ok, error = retry.attempt(driver, flow, index, watch)
+
+    # Scripts: retry everything parked, waiting out the backoff
+    driver, recovered = retry.drain(driver, retries, watch)
+
+    Environment:
+        HNI_RETRY_ATTEMPTS   attempts per item, the first run included (default: 3, 1 = no retries)
+        HNI_RETRY_BASE_S     backoff before the first retry, doubled per retry (default: 5)
+        HNI_RETRY_MAX_S      backoff cap (default: 120)
+"""
+
+import heapq
+import itertools
+import json
+import os
+import threading
+import time
+
+import eventlog
+from eventlog import get_logger
+
+log = get_logger("retry")
+
+# Configuration
+RETRY_ATTEMPTS = int(os.environ.get("HNI_RETRY_ATTEMPTS", "3"))
+RETRY_BASE_S = float(os.environ.get("HNI_RETRY_BASE_S", "5"))
+RETRY_MAX_S = float(os.environ.get("HNI_RETRY_MAX_S", "120"))
+DEAD_LETTER_FILE = os.path.join(eventlog.LOG_DIR, f"dead-letter-{eventlog.RUN_ID}.jsonl")
+
+
+class RetryQueue:
+    """Thread-safe backoff queue of failed (flow, index) items plus the dead-letter file.
+
+    `context` travels with an item untouched (the daemon passes its Job) and is
+    part of the item's identity, so two batches of the same flow never share
+    attempt counts.
+    """
+
+    def __init__(self, attempts: int = RETRY_ATTEMPTS, base_s: float = RETRY_BASE_S,
+                 max_s: float = RETRY_MAX_S, path: str = DEAD_LETTER_FILE):
+        self.attempts = max(1, attempts)
+        self.base_s = base_s
+        self.max_s = max_s
+        self.path = path
+        self.dead = 0
+        self.recovered = 0
+        self._heap = []
+        self._seq = itertools.count()
+        self._errors = {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        with self._lock:
+            return len(self._heap)
+
+    def backoff(self, failures: int) -> float:
+        return min(self.max_s, self.base_s * 2 ** (failures - 1))
+
+    def park(self, flow: str, index: int, error: str, context=None) -> bool:
+        """Record a failure; True when a retry was scheduled, False when it was dead-lettered."""
+        key = (flow, index, context)
+        with self._lock:
+            errors = self._errors.setdefault(key, [])
+            errors.append(error)
+            failures = len(errors)
+            if failures < self.attempts:
+                delay = self.backoff(failures)
+                heapq.heappush(self._heap, (time.time() + delay, next(self._seq), key))
+            else:
+                del self._errors[key]
+                self.dead += 1
+        if failures < self.attempts:
+            eventlog.emit("retry_parked", flow=flow, listing=index, error=error,
+                          attempt=failures, delay_s=delay)
+            log(f"↻ {flow} #{index} failed ({error}); retry {failures}/{self.attempts - 1} in {delay:.0f}s")
+            return True
+        self._dead_letter(flow, index, errors)
+        return False
+
+    def done(self, flow: str, index: int, context=None):
+        """Forget an item that went through; counts it as recovered if it had failed before."""
+        with self._lock:
+            errors = self._errors.pop((flow, index, context), None)
+            if errors:
+                self.recovered += 1
+        if errors:
+            eventlog.emit("retry_recovered", flow=flow, listing=index, attempts=len(errors) + 1)
+            log(f"✓ {flow} #{index} went through on attempt {len(errors) + 1}")
+
+    def pop_due(self):
+        """The next retry whose backoff has elapsed as (flow, index, context), or None."""
+        with self._lock:
+            if not self._heap or self._heap[0][0] > time.time():
+                return None
+            _, _, key = heapq.heappop(self._heap)
+        return key
+
+    def next_due(self):
+        """Seconds until the next retry is due (0 if one is due now), or None when nothing is parked."""
+        with self._lock:
+            if not self._heap:
+                return None
+            return max(0.0, self._heap[0][0] - time.time())
+
+    def _dead_letter(self, flow, index, errors):
+        record = {
+            "ts": round(time.time(), 3),
+            "run": eventlog.RUN_ID,
+            "flow": flow,
+            "index": index,
+            "attempts": len(errors),
+            "error": errors[-1],
+            "errors": errors,
+        }
+        try:
+            if os.path.dirname(self.path):
+                os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with self._lock, open(self.path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(record) + "\n")
+        except OSError as e:
+            log(f"⚠️  Could not write dead letter for {flow} #{index}:", str(e))
+        eventlog.emit("dead_letter", flow=flow, listing=index, attempts=len(errors), error=errors[-1])
+        log(f"✗ {flow} #{index} gave up after {len(errors)} attempts ({', '.join(errors)}); "
+            f"written to {self.path}")
+
+
+def attempt(driver, flow: str, index: int, watch):
+    """Retry one item on a fresh tab; returns (driver, ok, error)."""
+    import flows
+
+    try:
+        driver = watch.recycle_tab(driver)
+    except Exception as e:
+        return driver, False, type(e).__name__
+    ok, error = flows.run_item(driver, flow, index)
+    return driver, ok, error
+
+
+def drain(driver, retries: RetryQueue, watch):
+    """Run every parked retry, waiting out each backoff; returns (driver, recovered)."""
+    recovered = 0
+    while True:
+        wait = retries.next_due()
+        if wait is None:
+            return driver, recovered
+        if wait:
+            time.sleep(wait)
+            continue
+        item = retries.pop_due()
+        if item is None:
+            continue
+        flow, index, context = item
+        driver, ok, error = attempt(driver, flow, index, watch)
+        if ok:
+            retries.done(flow, index, context)
+            recovered += 1
+        else:
+            retries.park(flow, index, error, context)
@@ -0,0 +1,68 @@
+"""
+Module Name: session.py
+
+Purpose:
+    Copy a logged-in HomeHNI session (cookies plus local/session storage, where
+    the SPA keeps its auth token) from one browser into another, so a single
+    manual login can seed every browser in a worker pool.
+
+Usage:
+    state = session.export_session(logged_in_driver)
+    session.import_session(new_driver, state)
+    session.save(state, "runs/session.json")      # reuse across processes
+"""
+
+import json
+import os
+
+from drivers import BASE_URL as SITE_URL
+
+BASE_URL = f"{SITE_URL}/"
+
+_EXPORT_STORAGE = """
+const dump = (s) => { const out = {}; for (let i = 0; i < s.length; i++) { const k = s.key(i); out[k] = s.getItem(k); } return out; };
+return {local: dump(window.localStorage), session: dump(window.sessionStorage)};
+"""
+
+_IMPORT_STORAGE = """
+const state = arguments[0];
+for (const [k, v] of Object.entries(state.local || {})) window.localStorage.setItem(k, v);
+for (const [k, v] of Object.entries(state.session || {})) window.sessionStorage.setItem(k, v);
+"""
+
+
+def export_session(driver):
+    """Snapshot cookies and web storage of the current HomeHNI origin."""
+    storage = driver.execute_script(_EXPORT_STORAGE) or {}
+    return {
+        "url": driver.current_url,
+        "cookies": driver.get_cookies(),
+        "local": storage.get("local", {}),
+        "session": storage.get("session", {}),
+    }
+
+
+def import_session(driver, state, landing_url: str = None):
+    """Load a snapshot into another browser and reload so the SPA picks it up."""
+    driver.get(BASE_URL)
+    for cookie in state.get("cookies", []):
+        cookie = {k: v for k, v in cookie.items() if k != "sameSite" or v in ("Strict", "Lax", "None")}
+        try:
+            driver.add_cookie(cookie)
+        except Exception:
+            # Cookies for other domains (analytics etc.) cannot be set from here
+            pass
+    driver.execute_script(_IMPORT_STORAGE, state)
+    driver.get(landing_url or BASE_URL)
+
+
+def save(state, path: str):
+    if os.path.dirname(path):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(state, f)
+
+
+def load(path: str):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
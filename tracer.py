@@ -0,0 +1,191 @@
+"""
+Module Name: tracer.py
+
+Purpose:
+    WebDriver round-trip accounting. Wraps a driver's command executor so
+    every command (findElement, isElementDisplayed, executeScript, ...) is
+    attributed, with its latency and request/response payload size, to the
+    current flow step and to the flow function that issued it. Each step
+    emits a "roundtrips" event; each listing ends with a round-trip budget
+    table so the chattiest steps and call sites can be batched first.
+
+Usage:
+    HNI_TRACE_COMMANDS=1 python sale.py       # attached by drivers.create_driver()
+
+    # Budget table over a whole run (or several)
+    python tracer.py runs/events.jsonl
+    python tracer.py runs/events.jsonl --run 20250101-101500-4242
+
+    Environment:
+        HNI_TRACE_COMMANDS  1 to trace commands (default: off)
+"""
+
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+from collections import Counter
+
+import eventlog
+from eventlog import get_logger
+
+log = get_logger("tracer")
+
+# Configuration
+TRACE_COMMANDS = os.environ.get("HNI_TRACE_COMMANDS") == "1"
+TOP_N = 5
+
+_local = threading.local()
+_SKIP_FILES = {"tracer.py", "eventlog.py", "drivers.py"}
+
+
+def _call_site():
+    """First frame outside Selenium and this module: 'file.py:function'."""
+    frame = sys._getframe(2)
+    while frame is not None:
+        path = frame.f_code.co_filename
+        name = os.path.basename(path)
+        if "selenium" not in path and name not in _SKIP_FILES:
+            return f"{name}:{frame.f_code.co_name}"
+        frame = frame.f_back
+    return "?"
+
+
+def _size(obj) -> int:
+    if obj is None:
+        return 0
+    try:
+        return len(json.dumps(obj, default=str))
+    except (TypeError, ValueError):
+        return 0
+
+
+def _new_stats():
+    return {"commands": 0, "ms": 0.0, "sent": 0, "received": 0,
+            "by_command": Counter(), "by_site": Counter()}
+
+
+def _stats():
+    steps = getattr(_local, "steps", None)
+    if steps is None:
+        steps = _local.steps = {}
+        _local.listing = []
+    return steps
+
+
+def _record(command, ms, sent, received, site):
+    _, _, step = eventlog.current()
+    stats = _stats().setdefault(step, _new_stats())
+    stats["commands"] += 1
+    stats["ms"] += ms
+    stats["sent"] += sent
+    stats["received"] += received
+    stats["by_command"][command] += 1
+    stats["by_site"][site] += 1
+
+
+def attach(driver):
+    """Trace every command sent through `driver` (idempotent)."""
+    executor = driver.command_executor
+    if getattr(executor, "_hni_traced", False):
+        return
+    execute = executor.execute
+
+    def traced(command, params):
+        site = _call_site()
+        start = time.perf_counter()
+        try:
+            response = execute(command, params)
+        finally:
+            ms = (time.perf_counter() - start) * 1000
+        _record(command, ms, _size(params), _size(response), site)
+        return response
+
+    executor.execute = traced
+    executor._hni_traced = True
+    eventlog.subscribe(_on_event)
+
+
+def _summary(step, stats):
+    return {
+        "step_name": step,
+        "commands": stats["commands"],
+        "roundtrip_ms": round(stats["ms"], 1),
+        "bytes_sent": stats["sent"],
+        "bytes_received": stats["received"],
+        "top_commands": stats["by_command"].most_common(TOP_N),
+        "top_sites": stats["by_site"].most_common(TOP_N),
+    }
+
+
+def _on_event(event):
+    kind = event.get("event")
+    if kind not in ("step_end", "listing_end"):
+        return
+    steps = _stats()
+    if kind == "step_end":
+        stats = steps.pop(event.get("step"), None)
+        if stats:
+            summary = _summary(event.get("step"), stats)
+            _local.listing.append(summary)
+            eventlog.emit("roundtrips", **summary)
+        return
+    # Commands issued between steps belong to the listing as a whole
+    stray = steps.pop(None, None)
+    if stray:
+        summary = _summary(None, stray)
+        _local.listing.append(summary)
+        eventlog.emit("roundtrips", **summary)
+    if _local.listing:
+        log_budget(_local.listing, f"listing {event.get('listing')}")
+    _local.listing = []
+
+
+def log_budget(rows, title: str):
+    """Round-trip budget table, chattiest steps first."""
+    merged = {}
+    for row in rows:
+        m = merged.setdefault(row["step_name"], {"commands": 0, "roundtrip_ms": 0.0, "bytes": 0, "sites": Counter()})
+        m["commands"] += row["commands"]
+        m["roundtrip_ms"] += row["roundtrip_ms"]
+        m["bytes"] += row["bytes_sent"] + row["bytes_received"]
+        m["sites"].update(dict(row["top_sites"]))
+    total = sum(m["commands"] for m in merged.values()) or 1
+    log(f"Round-trip budget ({title}): {total} commands")
+    for step, m in sorted(merged.items(), key=lambda kv: -kv[1]["commands"]):
+        site, count = (m["sites"].most_common(1) or [("?", 0)])[0]
+        log(f"  {str(step or '(between steps)'):<32} {m['commands']:>5} cmds {m['commands'] / total * 100:>5.1f}%  "
+            f"{m['roundtrip_ms']:>8.0f}ms  {m['bytes'] / 1024:>7.1f} KB  top: {site} x{count}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Round-trip budget from recorded 'roundtrips' events")
+    parser.add_argument("files", nargs="+", help="event log files (runs/events.jsonl*)")
+    parser.add_argument("--run", help="only this run id")
+    parser.add_argument("--flow", help="only this flow")
+    args = parser.parse_args()
+
+    rows = []
+    for path in args.files:
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    event = json.loads(line)
+                except ValueError:
+                    continue
+                if event.get("event") != "roundtrips":
+                    continue
+                if (args.run and event.get("run") != args.run) or (args.flow and event.get("flow") != args.flow):
+                    continue
+                rows.append(event)
+    if not rows:
+        log("✗ No 'roundtrips' events found (run with HNI_TRACE_COMMANDS=1)")
+    else:
+        log_budget(rows, ", ".join(args.files))
+    log.flush()
+
+
+if __name__ == "__main__":
+    main()
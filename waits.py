@@ -0,0 +1,279 @@
+"""
+Module Name: waits.py
+
+Purpose:
+    Event-driven waits. Instead of polling element values over WebDriver and
+    then sleeping a fixed margin, the page itself is asked to report when it
+    is ready: a MutationObserver (plus a cheap in-page timer, since React
+    writes input values as properties, not attributes) resolves an
+    execute_async_script call the moment the condition holds.
+
+    Wizard transitions use the same idea for the network: the page's fetch
+    and XHR calls are counted in the page, and a Save & Continue or Submit
+    Property click is finished when the write it triggered returned 2xx,
+    nothing is in flight and the next page has stopped rendering. The API
+    latency is recorded as an "api_ack" event.
+
+Usage:
+    import waits
+
+    # After a Services submit: returns "reset", "toast" or None on timeout
+    signal = waits.form_reset(driver, ["loan-phone-mobile", "loan-amount-mobile"])
+
+    # Wizard transitions: finish when the save API call has returned 2xx,
+    # nothing is in flight and the next page has stopped rendering
+    with waits.acknowledged(driver, "Save & Continue"):
+        driver.execute_script("arguments[0].click();", save_button)
+    ...
+    waits.settled(driver)          # at the start of the next step: no-op after an acknowledged save
+
+    # The click that finishes a listing also records it as submitted (eventlog.submits())
+    with waits.acknowledged(driver, "Submit Property", submit=True):
+        driver.execute_script("arguments[0].click();", submit_btn)
+
+    Environment:
+        HNI_API_PREFIX   only writes to URLs starting with this count as the save
+                         (default: any URL outside netblock's third-party groups)
+"""
+
+import os
+import re
+import threading
+import time
+from contextlib import contextmanager
+
+import eventlog
+import netblock
+from eventlog import get_logger
+
+log = get_logger("waits")
+
+# Configuration
+RESET_TIMEOUT = 10        # seconds to wait for a Services form to reset
+TOAST_GRACE_MS = 1500     # after a success toast, how long to still wait for the reset
+SUCCESS_WORDS = ("success", "submitted", "thank", "received", "we will contact", "request sent")
+ACK_TIMEOUT = 20          # seconds to wait for a save/submit to be acknowledged
+NETWORK_IDLE_MS = 300     # no request in flight for this long counts as idle
+DOM_QUIET_MS = 200        # no DOM mutation for this long counts as rendered
+NO_WRITE_MS = 1500        # if no POST/PUT/PATCH/DELETE starts by then, the click saved nothing remotely
+API_PREFIX = os.environ.get("HNI_API_PREFIX", "")
+# Analytics beacons, pixels and the like never carry the save, and netblock fails them with status 0
+THIRD_PARTY_RE = "|".join(
+    "^" + ".*".join(re.escape(part) for part in pattern.split("*")) + "$"
+    for patterns in netblock.URL_GROUPS.values() for pattern in patterns
+)
+
+_local = threading.local()
+
+# Resolves "reset" when every field is empty, or "toast" when a success toast
+# appeared and the form did not reset within the grace period; null on timeout
+_FORM_RESET_JS = """
+const [ids, timeoutMs, graceMs, words] = arguments;
+const done = arguments[arguments.length - 1];
+const empty = () => ids.every(id => { const el = document.getElementById(id); return !el || !el.value; });
+const toastSelector = '[role=status], [role=alert], [data-sonner-toast], [class*="toast"], [class*="Toast"]';
+const toasted = () => [...document.querySelectorAll(toastSelector)].some(el => {
+    const text = (el.textContent || '').toLowerCase();
+    return words.some(w => text.includes(w));
+});
+let toastAt = null, finished = false, observer = null, timer = null;
+const finish = (signal) => {
+    if (finished) return;
+    finished = true;
+    if (observer) observer.disconnect();
+    clearInterval(timer);
+    done(signal);
+};
+const check = () => {
+    if (empty()) return finish('reset');
+    if (toastAt === null && toasted()) toastAt = performance.now();
+    if (toastAt !== null && performance.now() - toastAt >= graceMs) finish('toast');
+};
+check();
+if (!finished) {
+    observer = new MutationObserver(check);
+    observer.observe(document.body, {subtree: true, childList: true, attributes: true, characterData: true});
+    timer = setInterval(check, 50);
+    setTimeout(() => finish(null), timeoutMs);
+}
+"""
+
+
+# Counts fetch/XHR calls in the page (installed once per document) and returns
+# the sequence number of the last request started, as the mark for a wait
+_MARK_JS = """
+if (!window.__hniNet) {
+    const net = window.__hniNet = {seq: 0, inflight: 0, last: performance.now(), log: []};
+    const begin = (method, url) => {
+        let href = String(url);
+        try { href = new URL(href, location.href).href; } catch (e) {}
+        const req = {seq: ++net.seq, method: String(method || 'GET').toUpperCase(), url: href, start: performance.now(), status: null};
+        net.inflight++; net.last = req.start;
+        net.log.push(req); if (net.log.length > 200) net.log.shift();
+        return req;
+    };
+    const end = (req, status) => {
+        net.inflight = Math.max(0, net.inflight - 1); net.last = performance.now();
+        req.status = status; req.ms = net.last - req.start;
+    };
+    const fetch = window.fetch;
+    if (fetch) window.fetch = function (input, init) {
+        const req = begin((init && init.method) || (input && input.method), typeof input === 'string' ? input : (input && input.url) || input);
+        return fetch.apply(this, arguments).then(r => { end(req, r.status); return r; }, e => { end(req, 0); throw e; });
+    };
+    const open = XMLHttpRequest.prototype.open, send = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.open = function (method, url) { this.__hniReq = [method, url]; return open.apply(this, arguments); };
+    XMLHttpRequest.prototype.send = function () {
+        const [method, url] = this.__hniReq || ['GET', ''];
+        const req = begin(method, url);
+        this.addEventListener('loadend', () => end(req, this.status));
+        return send.apply(this, arguments);
+    };
+}
+return window.__hniNet.seq;
+"""
+
+# Resolves once the writes started after `since` have all completed, nothing is
+# in flight for idleMs and the DOM has not changed for quietMs. A write is a
+# POST/PUT/PATCH/DELETE to the app's API: preflights and third-party URLs
+# (trackers, including the ones netblock stops) are ignored, and with an API
+# prefix only URLs under it count.
+# signal: "ack" (a write returned 2xx), "error" (a write failed), "idle" (no write
+# was made), or null on timeout with the requests still pending.
+_SETTLE_JS = """
+const [since, timeoutMs, idleMs, quietMs, noWriteMs, needWrite, apiPrefix, thirdParty] = arguments;
+const done = arguments[arguments.length - 1];
+const net = window.__hniNet;
+const skip = new RegExp(thirdParty);
+const isWrite = r => r.seq > since && !['GET', 'HEAD', 'OPTIONS'].includes(r.method)
+    && (apiPrefix ? r.url.startsWith(apiPrefix) : !skip.test(r.url));
+const t0 = performance.now();
+let mutated = t0;
+const observer = new MutationObserver(() => { mutated = performance.now(); });
+observer.observe(document.body, {subtree: true, childList: true, attributes: true, characterData: true});
+const finish = (result) => { observer.disconnect(); result.wait_ms = Math.round(performance.now() - t0); done(result); };
+const tick = () => {
+    const now = performance.now();
+    if (!net) return finish({signal: now - mutated >= quietMs ? 'idle' : null, untracked: true});
+    const writes = net.log.filter(isWrite);
+    const settled = net.inflight === 0 && now - net.last >= idleMs && now - mutated >= quietMs;
+    if (settled && writes.length && writes.every(r => r.status !== null)) {
+        const bad = writes.find(r => r.status < 200 || r.status >= 300);
+        const req = bad || writes[writes.length - 1];
+        return finish({signal: bad ? 'error' : 'ack', method: req.method, url: req.url.slice(0, 200),
+                       status: req.status, api_ms: Math.round(req.ms)});
+    }
+    if (settled && !writes.length && (!needWrite || now - t0 >= noWriteMs)) return finish({signal: 'idle'});
+    if (now - t0 >= timeoutMs) {
+        return finish({signal: null, pending: net.log.filter(r => r.status === null).map(r => r.method + ' ' + r.url.slice(0, 120))});
+    }
+    setTimeout(tick, 50);
+};
+tick();
+"""
+
+
+def _ensure_script_timeout(driver, seconds: float):
+    """execute_async_script gives up after the session's script timeout; keep it above `seconds`."""
+    timeouts = getattr(driver, "timeouts", None)
+    try:
+        if timeouts is not None and timeouts.script < seconds + 5:
+            driver.set_script_timeout(seconds + 5)
+    except Exception:
+        pass
+
+
+def form_reset(driver, field_ids, timeout: float = RESET_TIMEOUT):
+    """Wait in the page until a submitted Services form is ready for the next lead.
+
+    Returns "reset" (all `field_ids` are empty again), "toast" (a success toast
+    showed but the form kept its values) or None when neither happened in time.
+    """
+    _ensure_script_timeout(driver, timeout)
+    start = time.perf_counter()
+    signal = driver.execute_async_script(
+        _FORM_RESET_JS, list(field_ids), int(timeout * 1000), TOAST_GRACE_MS, list(SUCCESS_WORDS)
+    )
+    wait_ms = round((time.perf_counter() - start) * 1000, 1)
+    eventlog.emit("form_ready", signal=signal, wait_ms=wait_ms)
+    if signal:
+        log(f"✓ Form ready ({signal}) after {wait_ms:.0f}ms")
+    else:
+        log(f"⚠️  Form did not reset within {timeout}s")
+    return signal
+
+
+def mark(driver) -> int:
+    """Start tracking the page's fetch/XHR calls (once per document); returns the current mark."""
+    return driver.execute_script(_MARK_JS)
+
+
+def _settle(driver, since, timeout: float, need_write: bool):
+    _ensure_script_timeout(driver, timeout)
+    try:
+        return driver.execute_async_script(
+            _SETTLE_JS, since, int(timeout * 1000), NETWORK_IDLE_MS, DOM_QUIET_MS, NO_WRITE_MS, need_write,
+            API_PREFIX, THIRD_PARTY_RE,
+        )
+    except Exception as e:
+        # A full navigation (e.g. to the dashboard after Submit Property) unloads the waiting script
+        if "unload" in str(e).lower():
+            return {"signal": "navigated"}
+        return {"signal": None, "error": type(e).__name__}
+
+
+@contextmanager
+def acknowledged(driver, label: str, timeout: float = ACK_TIMEOUT, submit: bool = False):
+    """Wrap a save/submit click: on exit, wait until the backend has acknowledged it.
+
+    Waits for the write calls the click triggered to return, the network to go
+    idle and the next page to finish rendering, then emits an "api_ack" event
+    with the API latency. The next settled() call on this thread returns at once.
+
+    With submit=True the click finishes the item (Submit Property): unless the
+    write was rejected or none was made, it is recorded with
+    eventlog.mark_submitted() so a failed later step never gets it posted again.
+    """
+    try:
+        since = mark(driver)
+    except Exception:
+        since = None
+    yield
+    if since is None:
+        if submit:
+            eventlog.mark_submitted(label=label, signal=None)
+        return
+    result = _settle(driver, since, timeout, need_write=True)
+    if submit and result.get("signal") not in ("error", "idle"):
+        # A timeout with the write still pending may well have landed; never post twice
+        eventlog.mark_submitted(label=label, signal=result.get("signal"))
+    _local.settled = result.get("signal") is not None
+    eventlog.emit("api_ack", label=label, **result)
+    signal = result.get("signal")
+    if signal == "ack":
+        log(f"✓ {label} acknowledged: {result['method']} {result['status']} in {result['api_ms']}ms")
+    elif signal == "idle":
+        log(f"✓ {label} settled (no save request) after {result['wait_ms']}ms")
+    elif signal == "navigated":
+        log(f"✓ {label} led to a new page")
+    elif signal == "error":
+        log(f"✗ {label} rejected: {result['method']} {result['url']} returned {result['status']}")
+    else:
+        log(f"⚠️  {label} not acknowledged within {timeout}s; pending: {result.get('pending')}")
+
+
+def settled(driver, timeout: float = ACK_TIMEOUT):
+    """Wait for a page transition to finish (network idle and DOM quiet).
+
+    Returns immediately when the previous acknowledged() save already waited
+    for it, so a step can call this first thing instead of sleeping.
+    """
+    if getattr(_local, "settled", False):
+        _local.settled = False
+        return True
+    try:
+        since = mark(driver)
+    except Exception:
+        return False
+    result = _settle(driver, since, timeout, need_write=False)
+    return result.get("signal") is not None